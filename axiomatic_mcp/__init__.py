@@ -6,6 +6,7 @@ import asyncio
 
 from fastmcp import FastMCP
 
+from .providers.lifespan_provider import mcp_lifespan
 from .providers.middleware_provider import get_mcp_middleware
 from .servers import servers
 
@@ -14,6 +15,7 @@ axiomatic_mcp = FastMCP(
     instructions="""This server provides various tools to help with physics and engineering workflows..""",
     version=__version__,
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
 )
 
 
@@ -0,0 +1,15 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastmcp import FastMCP
+
+from ..shared.api_client import AxiomaticAPIClient
+
+
+@asynccontextmanager
+async def mcp_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP connection pool of the API client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await AxiomaticAPIClient.aclose()
@@ -1,6 +1,12 @@
 import asyncio
+import contextlib
+import json
 import mimetypes
+import os
+import re
+import sqlite3
 import textwrap
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -8,19 +14,30 @@ from pathlib import Path
 from typing import Annotated
 
 import filetype
-from fastmcp import FastMCP
+import numpy as np
+from fastmcp import Context, FastMCP
 from fastmcp.exceptions import NotFoundError, ToolError, ValidationError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 from pydantic import BaseModel, Field, field_validator
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared.api_client import AxiomaticAPIClient
+from ...shared.documents.pdf_to_markdown import CHUNK_MAX_ATTEMPTS, DEFAULT_CHUNK_CONCURRENCY, chunk_retry_delay, split_pdf
+from ...shared.utils.disk_cache import DiskCache, make_cache_key, sha256_file
+from ...shared.utils.image_preprocessing import DEFAULT_MAX_IMAGE_DIMENSION, PREPROCESSABLE_MIME_TYPES, prepare_image_upload
 from ...shared.utils.prompt_utils import get_feedback_prompt
+from .store import annotation_store
 
 mimetypes.add_type("text/markdown", ".md")
 
+ANNOTATION_CACHE_MAX_BYTES = int(os.getenv("AXIOMATIC_ANNOTATION_CACHE_MAX_MB", "256")) * 1024 * 1024
+ANNOTATION_CACHE_TTL_SECONDS = float(os.getenv("AXIOMATIC_ANNOTATION_CACHE_TTL_HOURS", "168")) * 3600
+
+annotation_cache = DiskCache("annotations", max_bytes=ANNOTATION_CACHE_MAX_BYTES)
+
 
 class AnnotationType(str, Enum):
     TEXT = "text"
@@ -92,75 +109,312 @@ class AnnotationsResponse(BaseModel):
             return [Annotation.model_validate(item) for item in v]
 
 
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
+
+
+def get_annotation_cache_key(
+    file_hash: str,
+    file_type: str,
+    query: str,
+    pages_per_chunk: int | None = None,
+    image_max_dimension: int | None = None,
+) -> str:
+    parts = ["annotations", file_hash, file_type, normalize_query(query), pages_per_chunk]
+    if image_max_dimension is not None:
+        # Preprocessed images are a different input to the backend
+        parts.append({"image_max_dimension": image_max_dimension})
+    return make_cache_key(*parts)
+
+
+def dump_annotations_response(response: AnnotationsResponse) -> bytes:
+    # Dumped item by item: the field is typed list[Annotation], which would drop PDFAnnotation.page_number
+    payload = {"cached_at": time.time(), "annotations": [annotation.model_dump(mode="json") for annotation in response.annotations]}
+    return json.dumps(payload).encode("utf-8")
+
+
+def load_annotations_response(value: bytes, ttl_seconds: float = ANNOTATION_CACHE_TTL_SECONDS) -> AnnotationsResponse | None:
+    """Validate a cached response, or return None when it is expired or unreadable."""
+    try:
+        payload = json.loads(value)
+        if time.time() - payload["cached_at"] > ttl_seconds:
+            return None
+        return AnnotationsResponse.model_validate({"annotations": payload["annotations"]})
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def get_cached_annotations(cache_key: str) -> AnnotationsResponse | None:
+    cached = await asyncio.to_thread(annotation_cache.get, cache_key)
+    if cached is None:
+        return None
+
+    response = load_annotations_response(cached)
+    if response is None:
+        await asyncio.to_thread(annotation_cache.delete, cache_key)
+    return response
+
+
+async def store_annotations(file_hash: str, file_path: Path, file_type: str, query: str, response: AnnotationsResponse) -> None:
+    """Persist a result in the local annotation store for `query_annotations`."""
+    annotations = [annotation.model_dump(mode="json") for annotation in response.annotations]
+    # Like the cache, the store must not fail the annotation
+    with contextlib.suppress(sqlite3.Error, OSError):
+        await asyncio.to_thread(annotation_store.add_annotations, file_hash, file_path.resolve(), file_type, normalize_query(query), annotations)
+
+
+async def set_cached_annotations(cache_key: str, response: AnnotationsResponse) -> None:
+    # The cache is an optimization only, an unwritable cache dir must not fail the annotation
+    with contextlib.suppress(OSError):
+        await asyncio.to_thread(annotation_cache.set, cache_key, dump_annotations_response(response))
+
+
 mcp = FastMCP(
     name="AxDocumentAnnotator Server",
     instructions="""This server provides tools to annotate pdfs with detailed analysis.
-    """ + get_feedback_prompt("annotate_pdf"),
+    """ + get_feedback_prompt("annotate_pdf, annotate_file_queries, query_annotations"),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
 
 @mcp.tool(
     name="annotate_file",
-    description="Annotate a file with detailed analysis. Supports PDF, PNG, JPEG, MD, and TXT files.",
+    description=(
+        "Annotate a file with detailed analysis. Supports PDF, PNG, JPEG, MD, and TXT files. "
+        "For large PDFs (e.g. datasheets over ~30 pages), set pages_per_chunk to annotate page ranges in parallel; "
+        "annotations of each finished range are streamed back as progress notifications."
+    ),
     tags=["file", "annotate", "analyze"],
 )
 async def annotate_file(
+    ctx: Context,
     file_path: Annotated[Path, "The absolute path to the file to annotate"],
     query: Annotated[str, "The specific instructions or query to use for annotating the file"],
+    pages_per_chunk: Annotated[int | None, "PDF only: split the PDF into chunks of this many pages and annotate them in parallel"] = None,
+    max_concurrency: Annotated[int, "Maximum number of chunks annotated at the same time when pages_per_chunk is set"] = DEFAULT_CHUNK_CONCURRENCY,
+    use_cache: Annotated[bool, "Reuse the result of a previous run with the same file content and query"] = True,
+    preprocess_images: Annotated[bool, "PNG/JPEG only: downsample, strip metadata and recompress the image locally before uploading"] = False,
+    max_image_dimension: Annotated[int, "Longest side in pixels of preprocessed images"] = DEFAULT_MAX_IMAGE_DIMENSION,
 ) -> ToolResult:
-    return await annotate_file_main(file_path, query)
+    return await annotate_file_main(
+        file_path,
+        query,
+        pages_per_chunk=pages_per_chunk,
+        max_concurrency=max_concurrency,
+        ctx=ctx,
+        use_cache=use_cache,
+        preprocess_images=preprocess_images,
+        max_image_dimension=max_image_dimension,
+    )
 
 
-async def annotate_file_main(file_path: Path, query: str) -> ToolResult:
-    if not file_path.exists():
-        raise NotFoundError(f"File not found: {file_path}")
+def _normalize_text(text: str | None) -> str:
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def _annotation_key(annotation: Annotation) -> tuple:
+    return (
+        annotation.annotation_type,
+        _normalize_text(annotation.description),
+        _normalize_text(annotation.equation),
+        _normalize_text(annotation.parameter_name),
+        annotation.parameter_value,
+        _normalize_text(annotation.parameter_unit),
+    )
 
-    allowed = {
-        "application/pdf",
-        "image/png",
-        "image/jpeg",
-        "text/markdown",
-        "text/plain",
-    }
 
-    def _guess_mime(path: Path) -> str | None:
+def merge_chunk_annotations(chunks: list[tuple[int, int, list[Annotation]]]) -> list[Annotation]:
+    """Merge per-chunk annotations in page order, dropping annotations repeated across chunks.
+
+    Page numbers returned for a chunk are relative to that chunk and are rebased onto the
+    original document. An annotation already found in an earlier chunk is dropped, while
+    repeated annotations within one chunk, e.g. the same finding on two pages, are kept.
+    """
+    merged: list[Annotation] = []
+    seen: set[tuple] = set()
+    for first_page, _, annotations in sorted(chunks, key=lambda chunk: chunk[0]):
+        chunk_keys: set[tuple] = set()
+        for annotation in annotations:
+            key = _annotation_key(annotation)
+            if key in seen:
+                continue
+            if isinstance(annotation, PDFAnnotation):
+                annotation = annotation.model_copy(update={"page_number": annotation.page_number + first_page - 1})
+            merged.append(annotation)
+            chunk_keys.add(key)
+        seen |= chunk_keys
+
+    return sorted(merged, key=lambda annotation: getattr(annotation, "page_number", 0))
+
+
+async def _request_annotations(file_name: str, file_content: bytes | Path, file_type: str, query: str) -> AnnotationsResponse:
+    files = {"file": (file_name, file_content, file_type)}
+    data = {"query": query}
+
+    response = await AxiomaticAPIClient().post(
+        "/annotations/",
+        files=files,
+        data=data,
+    )
+
+    return AnnotationsResponse.model_validate(response)
+
+
+async def _annotate_pdf_chunked(
+    file_path: Path,
+    query: str,
+    pages_per_chunk: int,
+    max_concurrency: int,
+    ctx: Context | None = None,
+) -> tuple[AnnotationsResponse, list[str]]:
+    """Annotate page ranges of a PDF concurrently.
+
+    Annotations of each range are reported through `ctx` as soon as the range is done.
+
+    Returns:
+        The merged annotations and a message for every page range that failed.
+    """
+    chunks = await asyncio.to_thread(split_pdf, file_path, pages_per_chunk)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def annotate_chunk(first_page: int, last_page: int, content: bytes) -> tuple[int, int, list[Annotation]]:
+        chunk_name = f"{file_path.stem}_p{first_page}-{last_page}.pdf"
+        # A failed chunk is retried on its own instead of re-annotating the whole document
+        for attempt in range(1, CHUNK_MAX_ATTEMPTS + 1):
+            try:
+                async with semaphore:
+                    response = await _request_annotations(chunk_name, content, "application/pdf", query)
+                return first_page, last_page, response.annotations
+            except Exception as e:
+                if attempt == CHUNK_MAX_ATTEMPTS:
+                    raise RuntimeError(f"Failed to annotate pages {first_page}-{last_page}: {e!s}") from e
+            await asyncio.sleep(chunk_retry_delay(attempt))
+
+    results: list[tuple[int, int, list[Annotation]]] = []
+    errors: list[str] = []
+    for done, task in enumerate(asyncio.as_completed([annotate_chunk(*chunk) for chunk in chunks]), start=1):
         try:
-            if kind := filetype.guess(str(path)):
-                return kind.mime
-        except Exception:
-            pass
+            result = await task
+        except RuntimeError as e:
+            errors.append(str(e))
+            message = str(e)
+        else:
+            results.append(result)
+            first_page, last_page, _ = result
+            partial = merge_chunk_annotations([result])
+            message = f"Pages {first_page}-{last_page}: {len(partial)} annotations"
+            if partial:
+                message += f"\n\n{format_annotations(partial)}"
+
+        if ctx is not None:
+            await ctx.report_progress(progress=done, total=len(chunks), message=message)
+
+    if not results:
+        raise RuntimeError("; ".join(errors))
 
-        guessed, _ = mimetypes.guess_type(path.name)
-        return guessed
+    return AnnotationsResponse(annotations=merge_chunk_annotations(results)), errors
+
+
+ALLOWED_MIME_TYPES = {
+    "application/pdf",
+    "image/png",
+    "image/jpeg",
+    "text/markdown",
+    "text/plain",
+}
+
+
+def _guess_mime(path: Path) -> str | None:
+    try:
+        if kind := filetype.guess(str(path)):
+            return kind.mime
+    except Exception:
+        pass
+
+    guessed, _ = mimetypes.guess_type(path.name)
+    return guessed
+
+
+def _validate_file(file_path: Path) -> str:
+    """Check that the file exists and is supported, and return its MIME type."""
+    if not file_path.exists():
+        raise NotFoundError(f"File not found: {file_path}")
 
     file_type = _guess_mime(file_path)
 
-    if file_type not in allowed:
+    if file_type not in ALLOWED_MIME_TYPES:
         raise ValidationError(f"Unsupported file type: {file_path.suffix}. Supported types: pdf, png, jpeg, md, txt.")
 
+    return file_type
+
+
+async def annotate_file_main(
+    file_path: Path,
+    query: str,
+    pages_per_chunk: int | None = None,
+    max_concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    ctx: Context | None = None,
+    use_cache: bool = True,
+    preprocess_images: bool = False,
+    max_image_dimension: int = DEFAULT_MAX_IMAGE_DIMENSION,
+) -> ToolResult:
+    file_type = _validate_file(file_path)
+
+    if pages_per_chunk is not None and pages_per_chunk < 1:
+        raise ValidationError("pages_per_chunk must be a positive integer")
+
+    chunked = pages_per_chunk is not None and file_type == "application/pdf"
+    preprocess = preprocess_images and file_type in PREPROCESSABLE_MIME_TYPES
+
+    failed_chunks: list[str] = []
+    from_cache = False
+    preprocessed = None
     try:
-        file_content = await asyncio.to_thread(file_path.read_bytes)
-        files = {"file": (file_path.name, file_content, file_type)}
-        data = {"query": query}
-
-        response = await asyncio.to_thread(
-            AxiomaticAPIClient().post,
-            "/annotations/",
-            files=files,
-            data=data,
-        )
+        cache_key = None
+        annotations_response = None
+        file_hash = await asyncio.to_thread(sha256_file, file_path)
+        if use_cache:
+            cache_key = get_annotation_cache_key(
+                file_hash,
+                file_type,
+                query,
+                pages_per_chunk if chunked else None,
+                max_image_dimension if preprocess else None,
+            )
+            annotations_response = await get_cached_annotations(cache_key)
+            from_cache = annotations_response is not None
+
+        if annotations_response is None:
+            if chunked:
+                annotations_response, failed_chunks = await _annotate_pdf_chunked(file_path, query, pages_per_chunk, max_concurrency, ctx)
+            else:
+                preprocessed = await prepare_image_upload(file_path, file_type, preprocess, max_image_dimension)
+                # Passing the path streams the upload from disk instead of buffering the whole file
+                file_content = preprocessed.content if preprocessed else file_path
+                annotations_response = await _request_annotations(file_path.name, file_content, file_type, query)
+
+            # Results with failed page ranges are incomplete and must be recomputed next time
+            if cache_key is not None and not failed_chunks:
+                await set_cached_annotations(cache_key, annotations_response)
+
+        await store_annotations(file_hash, file_path, file_type, query, annotations_response)
 
-        annotations_response = AnnotationsResponse.model_validate(response)
         annotations_text = (
             format_annotations(annotations_response.annotations) if annotations_response.annotations else "No annotations found for the given query."
         )
+        if failed_chunks:
+            annotations_text += "\n\n**Incomplete:** " + "; ".join(failed_chunks)
 
     except Exception as e:
         raise ToolError(f"Failed to annotate file: {e!s}") from e
 
+    summary = f"Successfully annotated {file_path.name}" + (" (cached result, no upload)" if from_cache else "")
+    if preprocessed is not None:
+        summary += f"\n\n{preprocessed.summary()}"
+
     try:
         with (file_path.parent / f"{file_path.stem}_annotations.md").open("w", encoding="utf-8") as f:
             f.write(annotations_text)
@@ -169,7 +423,7 @@ async def annotate_file_main(file_path: Path, query: str) -> ToolResult:
             content=[
                 TextContent(
                     type="text",
-                    text=textwrap.dedent(f"""Successfully annotated {file_path.name}\n\n
+                    text=textwrap.dedent(f"""{summary}\n\n
                     Failed to save markdown file: {e!s}\n\n
                     **Query:** {query}\n\n
                     **Annotations:**\n\n{annotations_text}"""),
@@ -182,7 +436,7 @@ async def annotate_file_main(file_path: Path, query: str) -> ToolResult:
         content=[
             TextContent(
                 type="text",
-                text=textwrap.dedent(f"""Successfully annotated {file_path.name}\n\n
+                text=textwrap.dedent(f"""{summary}\n\n
                     Successfully saved markdown file: {file_path.parent / f"{file_path.stem}_annotations.md"}\n\n
                     **Query:** {query}\n\n
                     **Annotations:**\n\n
@@ -192,6 +446,196 @@ async def annotate_file_main(file_path: Path, query: str) -> ToolResult:
     )
 
 
+@mcp.tool(
+    name="annotate_file_queries",
+    description=(
+        "Annotate one file with several queries in a single call (e.g. parameters, equations and figure descriptions). "
+        "The file is hashed once, queries run in parallel, and results already cached for a query are not re-uploaded. "
+        "Returns one annotation set per query and saves them all to <stem>_annotations.md. Supports PDF, PNG, JPEG, MD, and TXT files."
+    ),
+    tags=["file", "annotate", "analyze", "batch"],
+)
+async def annotate_file_queries(
+    file_path: Annotated[Path, "The absolute path to the file to annotate"],
+    queries: Annotated[list[str], "The queries to run against the file, one annotation set is returned per query"],
+    max_concurrency: Annotated[int, "Maximum number of queries running at the same time"] = DEFAULT_CHUNK_CONCURRENCY,
+    use_cache: Annotated[bool, "Reuse the results of previous runs with the same file content and query"] = True,
+    preprocess_images: Annotated[bool, "PNG/JPEG only: downsample, strip metadata and recompress the image locally before uploading"] = False,
+    max_image_dimension: Annotated[int, "Longest side in pixels of preprocessed images"] = DEFAULT_MAX_IMAGE_DIMENSION,
+) -> ToolResult:
+    file_type = _validate_file(file_path)
+    preprocess = preprocess_images and file_type in PREPROCESSABLE_MIME_TYPES
+
+    queries = [query for query in queries if query.strip()]
+    if not queries:
+        raise ValidationError("At least one query is required")
+
+    file_hash = await asyncio.to_thread(sha256_file, file_path)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    # Images are preprocessed at most once, and only if some query is not cached. Other files are
+    # passed as their path, so every upload streams from disk instead of holding the file in memory
+    file_content: bytes | Path | None = None
+    preprocessed = None
+    content_lock = asyncio.Lock()
+
+    async def load_content() -> bytes | Path:
+        nonlocal file_content, preprocessed
+        async with content_lock:
+            if file_content is None:
+                preprocessed = await prepare_image_upload(file_path, file_type, preprocess, max_image_dimension)
+                file_content = preprocessed.content if preprocessed else file_path
+        return file_content
+
+    async def run(query: str) -> dict:
+        try:
+            cache_key = None
+            if use_cache:
+                cache_key = get_annotation_cache_key(file_hash, file_type, query, None, max_image_dimension if preprocess else None)
+            response = await get_cached_annotations(cache_key) if cache_key else None
+            cached = response is not None
+
+            if response is None:
+                content = await load_content()
+                async with semaphore:
+                    response = await _request_annotations(file_path.name, content, file_type, query)
+                if cache_key:
+                    await set_cached_annotations(cache_key, response)
+
+            await store_annotations(file_hash, file_path, file_type, query, response)
+
+            return {"query": query, "cached": cached, "annotations": response.annotations}
+        except Exception as e:
+            return {"query": query, "error": str(e)}
+
+    results = await asyncio.gather(*(run(query) for query in queries))
+
+    if all("error" in result for result in results):
+        raise ToolError("Failed to annotate file: " + "; ".join(f"{r['query']}: {r['error']}" for r in results))
+
+    sections = []
+    for i, result in enumerate(results, start=1):
+        if "error" in result:
+            body = f"Failed: {result['error']}"
+        elif result["annotations"]:
+            body = format_annotations(result["annotations"])
+        else:
+            body = "No annotations found for the given query."
+        sections.append(f"## Query {i}: {result['query']}\n\n{body}")
+    annotations_text = "\n\n".join(sections)
+
+    markdown_path = file_path.parent / f"{file_path.stem}_annotations.md"
+    try:
+        await asyncio.to_thread(markdown_path.write_text, annotations_text, encoding="utf-8")
+        saved = f"Successfully saved markdown file: {markdown_path}"
+    except Exception as e:
+        saved = f"Failed to save markdown file: {e!s}"
+
+    n_cached = sum(1 for result in results if result.get("cached"))
+    n_failed = sum(1 for result in results if "error" in result)
+    summary = f"Annotated {file_path.name} with {len(results)} queries ({n_cached} from cache, {n_failed} failed)"
+    if preprocessed is not None:
+        summary += f"\n\n{preprocessed.summary()}"
+
+    for result in results:
+        if "annotations" in result:
+            result["annotations"] = [annotation.model_dump(mode="json") for annotation in result["annotations"]]
+
+    return ToolResult(
+        content=[TextContent(type="text", text=f"{summary}\n\n{saved}\n\n{annotations_text}")],
+        structured_content={"markdown_path": str(markdown_path), "results": results},
+    )
+
+
+def summarize_parameter_values(rows: list[dict]) -> list[dict]:
+    """Count, min, median and max of the SI values of `rows`, per SI unit."""
+    values = np.array([np.nan if row["si_value"] is None else row["si_value"] for row in rows], dtype=float)
+    units = np.array([row["si_unit"] or "" for row in rows], dtype=object)
+
+    summary = []
+    for unit in dict.fromkeys(units[~np.isnan(values)]):
+        unit_values = values[(units == unit) & ~np.isnan(values)]
+        summary.append(
+            {
+                "si_unit": unit,
+                "count": int(unit_values.size),
+                "min": float(unit_values.min()),
+                "median": float(np.median(unit_values)),
+                "max": float(unit_values.max()),
+            }
+        )
+    return summary
+
+
+@mcp.tool(
+    name="query_annotations",
+    description=(
+        "Query annotations stored locally by previous annotate_file / annotate_file_queries runs, without calling the backend. "
+        "Filter by parameter name (e.g. propagation_loss), annotation type, tag, document path, page or text. "
+        "Parameter values are also returned converted to SI units, with per-unit statistics, so values from many papers can be compared."
+    ),
+    tags=["annotate", "search", "parameters", "local"],
+)
+async def query_annotations(
+    parameter_name: Annotated[str | None, "Parameter name to look for, case, spaces and underscores are ignored (e.g. 'propagation loss')"] = None,
+    annotation_type: Annotated[AnnotationType | None, "Only return annotations of this type"] = None,
+    tag: Annotated[str | None, "Only return annotations with this tag"] = None,
+    document: Annotated[str | None, "Only return annotations of files whose path contains this string"] = None,
+    page_number: Annotated[int | None, "Only return annotations on this page (PDF only)"] = None,
+    text: Annotated[str | None, "Only return annotations whose description or equation contains this text"] = None,
+    limit: Annotated[int, "Maximum number of annotations returned"] = 200,
+) -> ToolResult:
+    try:
+        rows = await asyncio.to_thread(
+            annotation_store.query,
+            parameter_name=parameter_name,
+            annotation_type=annotation_type.value if annotation_type else None,
+            tag=tag,
+            document=document,
+            page_number=page_number,
+            text=text,
+            limit=limit,
+        )
+    except Exception as e:
+        raise ToolError(f"Failed to query the annotation store: {e!s}") from e
+
+    if not rows:
+        return ToolResult(
+            content=[TextContent(type="text", text="No stored annotations match. Only files annotated with this server are stored.")],
+            structured_content={"annotations": [], "parameter_summary": []},
+        )
+
+    parameter_summary = summarize_parameter_values(rows)
+
+    lines = [f"Found {len(rows)} stored annotations:", ""]
+    parameter_rows = [row for row in rows if row["parameter_name"]]
+    if parameter_rows:
+        lines.append("| File | Page | Parameter | Value | SI value |")
+        lines.append("|---|---|---|---|---|")
+        for row in parameter_rows:
+            value = f"{row['parameter_value']} {row['parameter_unit'] or ''}".strip() if row["parameter_value"] is not None else ""
+            si_value = f"{row['si_value']:.6g} {row['si_unit'] or ''}".strip() if row["si_value"] is not None else ""
+            lines.append(f"| {Path(row['file_path']).name} | {row['page_number'] or ''} | {row['parameter_name']} | {value} | {si_value} |")
+        lines.append("")
+        for stats in parameter_summary:
+            lines.append(
+                f"SI unit '{stats['si_unit'] or '-'}': {stats['count']} values, "
+                f"min {stats['min']:.6g}, median {stats['median']:.6g}, max {stats['max']:.6g}"
+            )
+        lines.append("")
+
+    for row in rows:
+        if row["parameter_name"]:
+            continue
+        page = f" (Page {row['page_number']})" if row["page_number"] is not None else ""
+        lines.append(f"- {Path(row['file_path']).name}{page} [{row['annotation_type']}]: {row['description']}")
+
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(lines).strip())],
+        structured_content={"annotations": rows, "parameter_summary": parameter_summary},
+    )
+
+
 def format_annotations(annotations: list[Annotation]) -> str:
     annotation_lines = []
 
@@ -0,0 +1,207 @@
+"""Local SQLite store of annotation results.
+
+Every annotation run is persisted by document hash and normalized query, so extracted
+parameters can be queried across documents without calling the backend again. Parameter
+values are stored both as extracted and converted to SI (see `units.to_si`), which makes
+values reported in different units comparable.
+
+Methods are blocking; call them through ``asyncio.to_thread`` from async code.
+"""
+
+import math
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from ...shared.utils.disk_cache import get_cache_dir
+from .units import to_si
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_hash TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    file_type TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS annotations (
+    id INTEGER PRIMARY KEY,
+    doc_hash TEXT NOT NULL,
+    query TEXT NOT NULL,
+    page_number INTEGER,
+    annotation_type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    equation TEXT,
+    parameter_name TEXT,
+    parameter_key TEXT,
+    parameter_value REAL,
+    parameter_unit TEXT,
+    si_value REAL,
+    si_unit TEXT,
+    reference TEXT,
+    tags TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS annotation_tags (
+    annotation_id INTEGER NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS annotations_doc_page ON annotations (doc_hash, page_number);
+CREATE INDEX IF NOT EXISTS annotations_doc_query ON annotations (doc_hash, query);
+CREATE INDEX IF NOT EXISTS annotations_type ON annotations (annotation_type);
+CREATE INDEX IF NOT EXISTS annotations_parameter_key ON annotations (parameter_key);
+CREATE INDEX IF NOT EXISTS annotation_tags_tag ON annotation_tags (tag, annotation_id);
+"""
+
+
+def get_store_path() -> Path:
+    return Path(os.getenv("AXIOMATIC_ANNOTATION_STORE_PATH", get_cache_dir() / "annotations.sqlite3")).expanduser()
+
+
+def normalize_parameter_name(name: str | None) -> str | None:
+    """Lowercase with runs of non-alphanumerics as "_", so "Propagation loss" matches "propagation_loss"."""
+    if not name:
+        return None
+    return re.sub(r"[^0-9a-z]+", "_", name.lower()).strip("_") or None
+
+
+def _normalize_tag(tag: str) -> str:
+    return " ".join(tag.split()).lower()
+
+
+def _like_substring(value: str) -> str:
+    """LIKE pattern matching `value` literally anywhere, for use with `ESCAPE '\\'`."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class AnnotationStore:
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_store_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def add_annotations(self, doc_hash: str, file_path: Path, file_type: str, query: str, annotations: list[dict]) -> int:
+        """Store the annotations of one run, replacing a previous run of the same query on the same content.
+
+        Args:
+            query: The normalized query.
+            annotations: Annotations dumped with ``model_dump(mode="json")``.
+
+        Returns:
+            The number of stored annotations.
+        """
+        si_values, si_units = to_si([a.get("parameter_value") for a in annotations], [a.get("parameter_unit") for a in annotations])
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "DELETE FROM annotation_tags WHERE annotation_id IN (SELECT id FROM annotations WHERE doc_hash = ? AND query = ?)",
+                    (doc_hash, query),
+                )
+                connection.execute("DELETE FROM annotations WHERE doc_hash = ? AND query = ?", (doc_hash, query))
+                connection.execute(
+                    "INSERT OR REPLACE INTO documents (doc_hash, file_path, file_type, updated_at) VALUES (?, ?, ?, ?)",
+                    (doc_hash, str(file_path), file_type, time.time()),
+                )
+
+                for annotation, si_value, si_unit in zip(annotations, si_values.tolist(), si_units, strict=True):
+                    tags = sorted({_normalize_tag(tag) for tag in annotation.get("tags") or [] if tag.strip()})
+                    cursor = connection.execute(
+                        """
+                        INSERT INTO annotations (
+                            doc_hash, query, page_number, annotation_type, description, equation, parameter_name,
+                            parameter_key, parameter_value, parameter_unit, si_value, si_unit, reference, tags
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            doc_hash,
+                            query,
+                            annotation.get("page_number"),
+                            annotation["annotation_type"],
+                            annotation["description"],
+                            annotation.get("equation"),
+                            annotation.get("parameter_name"),
+                            normalize_parameter_name(annotation.get("parameter_name")),
+                            annotation.get("parameter_value"),
+                            annotation.get("parameter_unit"),
+                            None if math.isnan(si_value) else si_value,
+                            si_unit if annotation.get("parameter_unit") else None,
+                            annotation.get("reference"),
+                            ", ".join(tags),
+                        ),
+                    )
+                    connection.executemany(
+                        "INSERT INTO annotation_tags (annotation_id, tag) VALUES (?, ?)",
+                        [(cursor.lastrowid, tag) for tag in tags],
+                    )
+        finally:
+            connection.close()
+
+        return len(annotations)
+
+    def query(
+        self,
+        parameter_name: str | None = None,
+        annotation_type: str | None = None,
+        tag: str | None = None,
+        document: str | None = None,
+        page_number: int | None = None,
+        text: str | None = None,
+        limit: int = 200,
+    ) -> list[dict]:
+        """Return stored annotations matching all given filters, ordered by document and page.
+
+        Args:
+            parameter_name: Substring of the normalized parameter name, e.g. "propagation_loss".
+            annotation_type: One of the `AnnotationType` values.
+            tag: A tag the annotation must have (case-insensitive).
+            document: Substring of the annotated file's path.
+            page_number: Page of the annotation (PDF only).
+            text: Substring of the description or equation.
+            limit: Maximum number of annotations returned.
+        """
+        sql = """
+            SELECT d.file_path, a.page_number, a.annotation_type, a.description, a.equation, a.parameter_name,
+                   a.parameter_value, a.parameter_unit, a.si_value, a.si_unit, a.reference, a.tags, a.query
+            FROM annotations a
+            JOIN documents d ON d.doc_hash = a.doc_hash
+            WHERE 1 = 1
+        """
+        params: list = []
+        if parameter_name:
+            sql += " AND a.parameter_key LIKE ? ESCAPE '\\'"
+            params.append(_like_substring(normalize_parameter_name(parameter_name) or ""))
+        if annotation_type:
+            sql += " AND a.annotation_type = ?"
+            params.append(annotation_type)
+        if tag:
+            sql += " AND a.id IN (SELECT annotation_id FROM annotation_tags WHERE tag = ?)"
+            params.append(_normalize_tag(tag))
+        if document:
+            sql += " AND d.file_path LIKE ? ESCAPE '\\'"
+            params.append(_like_substring(document))
+        if page_number is not None:
+            sql += " AND a.page_number = ?"
+            params.append(page_number)
+        if text:
+            sql += " AND (a.description LIKE ? ESCAPE '\\' OR a.equation LIKE ? ESCAPE '\\')"
+            params.extend([_like_substring(text)] * 2)
+        sql += " ORDER BY d.file_path, a.page_number, a.id LIMIT ?"
+        params.append(limit)
+
+        connection = self._connect()
+        try:
+            return [dict(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+
+annotation_store = AnnotationStore()
@@ -0,0 +1,177 @@
+"""Conversion of annotation parameter units to SI.
+
+Units are parsed once per distinct unit string (e.g. "dB/cm", "µm", "GHz", "ps/nm/km"; parentheses
+are not supported) and values are converted with one vectorized multiply-add over the whole
+column. Units that cannot be parsed are passed through unchanged.
+"""
+
+import math
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+# base unit -> (factor to SI, {SI base unit: exponent})
+_BASE_UNITS: dict[str, tuple[float, dict[str, int]]] = {
+    "m": (1.0, {"m": 1}),
+    "g": (1e-3, {"kg": 1}),
+    "s": (1.0, {"s": 1}),
+    "A": (1.0, {"A": 1}),
+    "K": (1.0, {"K": 1}),
+    "mol": (1.0, {"mol": 1}),
+    "cd": (1.0, {"cd": 1}),
+    "Hz": (1.0, {"Hz": 1}),
+    "N": (1.0, {"N": 1}),
+    "Pa": (1.0, {"Pa": 1}),
+    "J": (1.0, {"J": 1}),
+    "W": (1.0, {"W": 1}),
+    "C": (1.0, {"C": 1}),
+    "V": (1.0, {"V": 1}),
+    "F": (1.0, {"F": 1}),
+    "ohm": (1.0, {"Ω": 1}),
+    "Ω": (1.0, {"Ω": 1}),
+    "S": (1.0, {"S": 1}),
+    "T": (1.0, {"T": 1}),
+    "H": (1.0, {"H": 1}),
+    "rad": (1.0, {"rad": 1}),
+    "sr": (1.0, {"sr": 1}),
+    "dB": (1.0, {"dB": 1}),
+    "eV": (1.602176634e-19, {"J": 1}),
+    "L": (1e-3, {"m": 3}),
+    "min": (60.0, {"s": 1}),
+    "h": (3600.0, {"s": 1}),
+    "deg": (math.pi / 180, {"rad": 1}),
+    "°": (math.pi / 180, {"rad": 1}),
+    "Å": (1e-10, {"m": 1}),
+    "bar": (1e5, {"Pa": 1}),
+}
+
+_PREFIXES = {
+    "Y": 1e24,
+    "Z": 1e21,
+    "E": 1e18,
+    "P": 1e15,
+    "T": 1e12,
+    "G": 1e9,
+    "M": 1e6,
+    "k": 1e3,
+    "h": 1e2,
+    "da": 1e1,
+    "d": 1e-1,
+    "c": 1e-2,
+    "m": 1e-3,
+    "µ": 1e-6,
+    "μ": 1e-6,
+    "u": 1e-6,
+    "n": 1e-9,
+    "p": 1e-12,
+    "f": 1e-15,
+    "a": 1e-18,
+}
+
+# Units converted with an offset; they are only valid on their own, not inside compound units
+_AFFINE_UNITS = {
+    "°C": (1.0, 273.15, "K"),
+    "degC": (1.0, 273.15, "K"),
+    "℃": (1.0, 273.15, "K"),
+    "°F": (5 / 9, 273.15 - 32 * 5 / 9, "K"),
+    "degF": (5 / 9, 273.15 - 32 * 5 / 9, "K"),
+}
+
+# Dimensionless ratios
+_RATIO_UNITS = {"%": 1e-2, "ppm": 1e-6, "ppb": 1e-9}
+
+_FACTOR_RE = re.compile(r"^(?P<unit>[^\^\d\-+]+)(?:\^?(?P<exp>[-+]?\d+))?$")
+_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺", "0123456789-+")
+
+
+def _parse_factor(token: str) -> tuple[float, dict[str, int]] | None:
+    match = _FACTOR_RE.match(token.translate(_SUPERSCRIPTS))
+    if not match:
+        return None
+
+    unit, exponent = match.group("unit"), int(match.group("exp") or 1)
+    if unit in _BASE_UNITS:
+        factor, dimensions = _BASE_UNITS[unit]
+    else:
+        prefix = next((p for p in sorted(_PREFIXES, key=len, reverse=True) if unit.startswith(p) and unit[len(p) :] in _BASE_UNITS), None)
+        if prefix is None:
+            return None
+        base_factor, dimensions = _BASE_UNITS[unit[len(prefix) :]]
+        factor = _PREFIXES[prefix] * base_factor
+
+    return factor**exponent, {name: power * exponent for name, power in dimensions.items()}
+
+
+def _format_dimensions(dimensions: dict[str, int]) -> str:
+    numerator = [name if power == 1 else f"{name}^{power}" for name, power in dimensions.items() if power > 0]
+    denominator = [name if power == -1 else f"{name}^{-power}" for name, power in dimensions.items() if power < 0]
+    text = "·".join(numerator) or ("1" if denominator else "")
+    if denominator:
+        text += "/" + "/".join(denominator)
+    return text
+
+
+@lru_cache(maxsize=1024)
+def parse_unit(unit: str) -> tuple[float, float, str] | None:
+    """Parse a unit string into (factor, offset, SI unit) with `si = value * factor + offset`.
+
+    Supports SI prefixes, products written with a space, "*" or "·", divisions with "/",
+    and integer exponents ("m^2", "m2", "m⁻¹"). Returns None if the unit is not understood.
+    """
+    unit = unit.strip()
+    if unit in _AFFINE_UNITS:
+        return _AFFINE_UNITS[unit]
+    if unit in _RATIO_UNITS:
+        return _RATIO_UNITS[unit], 0.0, ""
+    if unit == "dBm":
+        # Logarithmic power, it has no linear SI equivalent
+        return 1.0, 0.0, "dBm"
+
+    total_factor = 1.0
+    dimensions: dict[str, int] = {}
+    for i, group in enumerate(unit.split("/")):
+        tokens = [token for token in re.split(r"[\s*·.]+", group) if token]
+        if i == 0 and tokens == ["1"]:
+            continue
+        if not tokens:
+            return None
+        sign = 1 if i == 0 else -1
+        for token in tokens:
+            parsed = _parse_factor(token)
+            if parsed is None:
+                return None
+            factor, factor_dimensions = parsed
+            total_factor *= factor**sign
+            for name, power in factor_dimensions.items():
+                dimensions[name] = dimensions.get(name, 0) + sign * power
+
+    return total_factor, 0.0, _format_dimensions({name: power for name, power in dimensions.items() if power})
+
+
+def to_si(values: Sequence[float | None] | np.ndarray, units: Sequence[str | None]) -> tuple[np.ndarray, list[str | None]]:
+    """Convert a column of values with per-row units to SI.
+
+    Each distinct unit is parsed once and the conversion is applied to the whole column at once.
+    Missing values become NaN; rows whose unit is missing or not understood keep their value and unit.
+    """
+    values = np.asarray([np.nan if value is None else value for value in values], dtype=float)
+    if values.size == 0:
+        return values, []
+
+    unit_keys = np.asarray(["" if unit is None else unit for unit in units], dtype=object)
+    unique_units, inverse = np.unique(unit_keys, return_inverse=True)
+
+    factors = np.ones(len(unique_units))
+    offsets = np.zeros(len(unique_units))
+    si_units: list[str | None] = []
+    for i, unit in enumerate(unique_units):
+        parsed = parse_unit(unit) if unit else None
+        if parsed is None:
+            si_units.append(unit or None)
+            continue
+        factors[i], offsets[i], si_unit = parsed
+        si_units.append(si_unit)
+
+    return values * factors[inverse] + offsets[inverse], [si_units[i] for i in inverse]
@@ -5,6 +5,7 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared.utils.prompt_utils import get_feedback_prompt
@@ -18,6 +19,7 @@ mcp = FastMCP(
     """ + get_feedback_prompt(["generate_code", "execute_code"]),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
@@ -50,7 +52,7 @@ async def generate_code(
         raise ToolError(f"Invalid problem_type '{problem_type}'. Must be one of: {', '.join(sorted(valid_types))}")
 
     try:
-        response = argmin_service.generate_code(problem_description, problem_type)
+        response = await argmin_service.generate_code(problem_description, problem_type)
     except Exception as e:
         raise ToolError(f"Failed to generate code: {e!s}") from e
 
@@ -83,7 +85,7 @@ async def execute_code(
 ) -> ToolResult:
     """Execute Python code in the argmin sandbox."""
     try:
-        response = argmin_service.execute_code(code)
+        response = await argmin_service.execute_code(code)
     except Exception as e:
         raise ToolError(f"Failed to execute code: {e!s}") from e
 
@@ -10,7 +10,7 @@ from ....shared.models.singleton_base import SingletonBase
 class ArgminService(SingletonBase):
     """Thin proxy service for argmin code generation and execution endpoints."""
 
-    def generate_code(self, problem_description: str, problem_type: str) -> dict[str, Any]:
+    async def generate_code(self, problem_description: str, problem_type: str) -> dict[str, Any]:
         """
         Generate Python code for a numerical problem.
 
@@ -21,16 +21,15 @@ class ArgminService(SingletonBase):
         Returns:
             dict with keys: code, explanation, error
         """
-        with AxiomaticAPIClient() as client:
-            return client.post(
-                ApiRoutes.ARGMIN_WRITE_CODE,
-                data={
-                    "problem_description": problem_description,
-                    "problem_type": problem_type,
-                },
-            )
-
-    def execute_code(self, code: str) -> dict[str, Any]:
+        return await AxiomaticAPIClient().post(
+            ApiRoutes.ARGMIN_WRITE_CODE,
+            data={
+                "problem_description": problem_description,
+                "problem_type": problem_type,
+            },
+        )
+
+    async def execute_code(self, code: str) -> dict[str, Any]:
         """
         Execute Python code in the argmin sandbox.
 
@@ -40,8 +39,7 @@ class ArgminService(SingletonBase):
         Returns:
             dict with keys: success, result, error, stdout, execution_time
         """
-        with AxiomaticAPIClient() as client:
-            return client.post(
-                ApiRoutes.ARGMIN_EXECUTE,
-                data={"code": code},
-            )
+        return await AxiomaticAPIClient().post(
+            ApiRoutes.ARGMIN_EXECUTE,
+            data={"code": code},
+        )
@@ -2,14 +2,75 @@
 
 This module provides helper functions for loading and transforming tabular data files
 into the format required by the Axiomatic API optimization tools.
+
+A fitting session reads the same data file many times, once per tool call. Parsed files are
+kept in memory as read-only NumPy columns and reused while the file's size and modification
+time are unchanged.
 """
 
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+DATA_CACHE_MAX_BYTES = int(os.getenv("AXIOMATIC_DATA_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+FORMAT_MAP = {".csv": "csv", ".xlsx": "excel", ".xls": "excel", ".json": "json", ".parquet": "parquet"}
+
+
+class DataFileCache:
+    """In-process cache of parsed data files with least-recently-used eviction.
+
+    Entries are keyed by (resolved path, size, mtime_ns, format), so an edited file is parsed
+    again, and hold the columns of the file as read-only NumPy arrays. The total size of the
+    arrays, including the objects of object columns, is bounded by `max_bytes`. Methods are
+    thread-safe, tools call them through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, dict[str, np.ndarray]] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def get(self, key: tuple) -> dict[str, np.ndarray] | None:
+        with self._lock:
+            columns = self._entries.get(key)
+            if columns is not None:
+                self._entries.move_to_end(key)
+            return columns
+
+    def set(self, key: tuple, columns: dict[str, np.ndarray]) -> None:
+        # Object columns such as strings only hold pointers, count the objects they point to as well
+        size = int(pd.DataFrame(columns, copy=False).memory_usage(index=False, deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._entries[key] = columns
+            self._entries.move_to_end(key)
+            self._sizes[key] = size
+
+            total = self.nbytes
+            while total > self.max_bytes:
+                oldest, _ = self._entries.popitem(last=False)
+                total -= self._sizes.pop(oldest)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+
+data_file_cache = DataFileCache(DATA_CACHE_MAX_BYTES)
+
 
 def validate_file_access(file_path: str) -> None:
     """Validate that a file exists and is readable.
@@ -37,6 +98,25 @@ def validate_file_access(file_path: str) -> None:
         raise PermissionError(f"Cannot read data file: {file_path}")
 
 
+def detect_file_format(path_obj: Path, file_format: str | None = None) -> str:
+    """Return `file_format`, or the format of the file's extension if it is None.
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    if file_format is not None:
+        return file_format
+
+    file_format = FORMAT_MAP.get(path_obj.suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Cannot auto-detect file format for {path_obj}. "
+            f"Supported extensions: {list(FORMAT_MAP.keys())}. "
+            f"Please specify file_format parameter explicitly."
+        )
+    return file_format
+
+
 def load_data_file(file_path: str, file_format: str | None = None) -> pd.DataFrame:
     """Load a data file using pandas with automatic format detection.
 
@@ -57,18 +137,7 @@ def load_data_file(file_path: str, file_format: str | None = None) -> pd.DataFra
 
     path_obj = Path(file_path)
 
-    # Auto-detect format if not specified
-    if file_format is None:
-        extension = path_obj.suffix.lower()
-        format_map = {".csv": "csv", ".xlsx": "excel", ".xls": "excel", ".json": "json", ".parquet": "parquet"}
-        file_format = format_map.get(extension)
-
-        if file_format is None:
-            raise ValueError(
-                f"Cannot auto-detect file format for {file_path}. "
-                f"Supported extensions: {list(format_map.keys())}. "
-                f"Please specify file_format parameter explicitly."
-            )
+    file_format = detect_file_format(path_obj, file_format)
 
     # Load data based on format
     try:
@@ -91,6 +160,47 @@ def load_data_file(file_path: str, file_format: str | None = None) -> pd.DataFra
     return df
 
 
+def load_data_columns(file_path: str, file_format: str | None = None) -> dict[str, np.ndarray]:
+    """Load the columns of a data file as read-only NumPy arrays, from `data_file_cache` if the file is unchanged.
+
+    Args:
+        file_path: Path to the data file
+        file_format: Optional file format specification, see `load_data_file`
+
+    Returns:
+        Column name to read-only array, in the order of the file
+
+    Raises:
+        ValueError, FileNotFoundError, Exception: As `load_data_file`
+    """
+    validate_file_access(file_path)
+
+    path_obj = Path(file_path)
+    file_format = detect_file_format(path_obj, file_format)
+    # Stat before parsing, so a file changing meanwhile is never cached under its new size and time
+    stat = path_obj.stat()
+    key = (str(path_obj.resolve()), stat.st_size, stat.st_mtime_ns, file_format)
+
+    columns = data_file_cache.get(key)
+    if columns is not None:
+        return columns
+
+    df = load_data_file(file_path, file_format)
+    columns = {}
+    for name, series in df.items():
+        column = series.to_numpy(copy=True)
+        column.flags.writeable = False
+        columns[name] = column
+
+    data_file_cache.set(key, columns)
+    return columns
+
+
+def load_data_frame(file_path: str, file_format: str | None = None) -> pd.DataFrame:
+    """`load_data_file` served from `data_file_cache`, see `load_data_columns`."""
+    return pd.DataFrame(load_data_columns(file_path, file_format), copy=False)
+
+
 def validate_column_mapping(df: pd.DataFrame, input_data: list[dict], output_data: dict) -> None:
     """Validate that the column mapping is valid for the given DataFrame.
 
@@ -262,7 +372,7 @@ def resolve_output_data_only(data_file: str, output_data: dict, file_format: str
         ValueError: If file or mapping is invalid
     """
     # Use file-based approach only
-    df = load_data_file(data_file, file_format)
+    df = load_data_frame(data_file, file_format)
 
     # Validate the output data specification
     output_spec = output_data
@@ -353,5 +463,5 @@ def resolve_data_input(data_file: str, input_data: list[dict], output_data: dict
         ValueError: If file or mapping is invalid
     """
     # Use file-based approach only
-    df = load_data_file(data_file, file_format)
+    df = load_data_frame(data_file, file_format)
     return transform_file_to_optimization_format(df, input_data, output_data)
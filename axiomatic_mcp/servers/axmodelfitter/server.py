@@ -7,6 +7,7 @@ using the Axiomatic AI platform's optimization API. It includes comprehensive
 guidance, examples, and validation to help LLMs use the API correctly.
 """
 
+import asyncio
 import json
 from typing import Annotated
 
@@ -15,6 +16,7 @@ from fastmcp import FastMCP
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...shared import AxiomaticAPIClient
 from .data_file_utils import resolve_data_input, resolve_output_data_only
@@ -340,7 +342,7 @@ def compute_aic_bic_from_loss_and_data(
     }
 
 
-def evaluate_loss(payload: dict) -> dict:
+async def evaluate_loss(payload: dict) -> dict:
     """Evaluate the loss/cost of a model using the provided payload.
 
     Args:
@@ -352,13 +354,12 @@ def evaluate_loss(payload: dict) -> dict:
     Raises:
         Exception: If API call fails
     """
-    with AxiomaticAPIClient() as client:
-        response = client.post("/digital-twin/custom_evaluate_cost", data=payload)
+    response = await AxiomaticAPIClient().post("/digital-twin/custom_evaluate_cost", data=payload)
 
     return response
 
 
-def evaluate_model(payload: dict) -> dict:
+async def evaluate_model(payload: dict) -> dict:
     """Evaluate/predict outputs of a model using the provided payload.
 
     Args:
@@ -370,8 +371,7 @@ def evaluate_model(payload: dict) -> dict:
     Raises:
         Exception: If API call fails
     """
-    with AxiomaticAPIClient() as client:
-        response = client.post("/digital-twin/custom_predict", data=payload)
+    response = await AxiomaticAPIClient().post("/digital-twin/custom_predict", data=payload)
 
     return response
 
@@ -447,6 +447,7 @@ mcp = FastMCP(
     """,
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
 )
 
 
@@ -518,8 +519,8 @@ async def fit_model(
         if output_data is None:
             raise ValueError("output_data is required when using file-based input.")
 
-        resolved_input_data, resolved_output_data = resolve_data_input(
-            data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
+        resolved_input_data, resolved_output_data = await asyncio.to_thread(
+            resolve_data_input, data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
         )
 
         # Validate inputs using helper function
@@ -558,8 +559,7 @@ async def fit_model(
 
     try:
         # Call the API
-        with AxiomaticAPIClient() as client:
-            response = client.post("/digital-twin/custom_optimize", data=request_data)
+        response = await AxiomaticAPIClient().post("/digital-twin/custom_optimize", data=request_data)
 
         # Format results
         success = response.get("success", False)
@@ -1071,7 +1071,9 @@ async def calculate_information_criteria(
 
     try:
         # Resolve output data from file only
-        resolved_output_values = resolve_output_data_only(data_file=data_file, output_data=output_data, file_format=file_format)
+        resolved_output_values = await asyncio.to_thread(
+            resolve_output_data_only, data_file=data_file, output_data=output_data, file_format=file_format
+        )
 
         # Handle string-to-float conversion for sigma (JSON might pass it as string)
         if sigma is not None:
@@ -1329,7 +1331,9 @@ async def calculate_r_squared(
 
     try:
         # Resolve output data from file only
-        resolved_output_values = resolve_output_data_only(data_file=data_file, output_data=output_data, file_format=file_format)
+        resolved_output_values = await asyncio.to_thread(
+            resolve_output_data_only, data_file=data_file, output_data=output_data, file_format=file_format
+        )
 
         if len(resolved_output_values) == 0:
             raise ValueError("Output values cannot be empty")
@@ -1448,13 +1452,14 @@ async def cross_validate_model(
     optimizer_type: Annotated[str, "Optimizer: 'nlopt' (best default), 'scipy' (simple), 'nevergrad' (gradient-free)"] = "nlopt",
     max_time: Annotated[int, "Maximum optimization time in seconds per fold"] = 5,
     optimizer_config: Annotated[dict | None, "Optimizer config: {'use_gradient': True, 'tol': 1e-6, 'max_function_eval': 1000000}"] = None,
+    max_concurrency: Annotated[int, "Maximum number of folds optimized at the same time"] = 4,
 ) -> ToolResult:
     """Perform cross-validation on model."""
 
     try:
         # Resolve data input from file only
-        resolved_input_data, resolved_output_data = resolve_data_input(
-            data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
+        resolved_input_data, resolved_output_data = await asyncio.to_thread(
+            resolve_data_input, data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
         )
 
         # Import scikit-learn here to avoid dependency if not used
@@ -1496,13 +1501,8 @@ async def cross_validate_model(
         if len(splits) == 0:
             return ToolResult(content=[TextContent(type="text", text="No validation splits generated. Check your parameters.")])
 
-        # Prepare results storage
-        fold_results = []
-        test_losses = []
-        test_r2s = []
-
-        # Process each fold
-        for fold_idx, (train_indices, test_indices) in enumerate(splits):
+        # Process a single fold: optimize on train split, evaluate loss on test split
+        async def run_fold(fold_idx: int, train_indices, test_indices) -> dict:
             try:
                 # Create train data for this fold
                 train_input_data = []
@@ -1537,17 +1537,14 @@ async def cross_validate_model(
                     prepare_bounds_for_optimization(fold_bounds, input_names, const_names, train_output_data["name"])
 
                 except ValueError as validation_error:
-                    fold_results.append(
-                        {
-                            "fold": fold_idx + 1,
-                            "train_size": len(train_indices),
-                            "test_size": len(test_indices),
-                            "test_loss": "Failed",
-                            "test_r2": "Failed",
-                            "error": f"Validation failed: {validation_error}",
-                        }
-                    )
-                    continue
+                    return {
+                        "fold": fold_idx + 1,
+                        "train_size": len(train_indices),
+                        "test_size": len(test_indices),
+                        "test_loss": "Failed",
+                        "test_r2": "Failed",
+                        "error": f"Validation failed: {validation_error}",
+                    }
 
                 # Build optimization request for train data
                 train_payload = {
@@ -1568,37 +1565,30 @@ async def cross_validate_model(
                 }
 
                 # Optimize model on training data
-                with AxiomaticAPIClient() as client:
-                    train_response = client.post("/digital-twin/custom_optimize", data=train_payload)
+                train_response = await AxiomaticAPIClient().post("/digital-twin/custom_optimize", data=train_payload)
 
                 # Check if optimization succeeded
                 if not train_response.get("success", False):
-                    fold_results.append(
-                        {
-                            "fold": fold_idx + 1,
-                            "train_size": len(train_indices),
-                            "test_size": len(test_indices),
-                            "test_loss": "Failed",
-                            "test_r2": "Failed",
-                            "error": f"Training optimization failed: {train_response.get('error', 'Unknown error')}",
-                        }
-                    )
-                    continue
+                    return {
+                        "fold": fold_idx + 1,
+                        "train_size": len(train_indices),
+                        "test_size": len(test_indices),
+                        "test_loss": "Failed",
+                        "test_r2": "Failed",
+                        "error": f"Training optimization failed: {train_response.get('error', 'Unknown error')}",
+                    }
 
                 # Get optimized parameters from training
                 optimized_params = train_response.get("parameters", [])
                 if not optimized_params:
-                    fold_results.append(
-                        {
-                            "fold": fold_idx + 1,
-                            "train_size": len(train_indices),
-                            "test_size": len(test_indices),
-                            "test_loss": "Failed",
-                            "test_r2": "Failed",
-                            "error": "No optimized parameters returned from training",
-                        }
-                    )
-                    continue
+                    return {
+                        "fold": fold_idx + 1,
+                        "train_size": len(train_indices),
+                        "test_size": len(test_indices),
+                        "test_loss": "Failed",
+                        "test_r2": "Failed",
+                        "error": "No optimized parameters returned from training",
+                    }
 
                 # Create test data for this fold
                 test_input_data = []
@@ -1623,50 +1613,52 @@ async def cross_validate_model(
                 }
 
                 # Evaluate loss on test fold
-                loss_response = evaluate_loss(loss_payload)
+                loss_response = await evaluate_loss(loss_payload)
                 test_loss = loss_response.get("cost_value")
 
                 if test_loss is None:
-                    fold_results.append(
-                        {
-                            "fold": fold_idx + 1,
-                            "train_size": len(train_indices),
-                            "test_size": len(test_indices),
-                            "test_loss": "Failed",
-                            "test_r2": "Failed",
-                            "error": "Test loss evaluation failed",
-                        }
-                    )
-                    continue
-
-                # Calculate R² for this fold using helper function
-                r2 = compute_r_squared_from_mse_and_data(test_loss, test_output_magnitudes)
-
-                # Store results
-                fold_results.append(
-                    {
+                    return {
                         "fold": fold_idx + 1,
                         "train_size": len(train_indices),
                         "test_size": len(test_indices),
-                        "test_loss": float(test_loss),
-                        "test_r2": float(r2),
+                        "test_loss": "Failed",
+                        "test_r2": "Failed",
+                        "error": "Test loss evaluation failed",
                     }
-                )
 
-                test_losses.append(test_loss)
-                test_r2s.append(r2)
+                # Calculate R² for this fold using helper function
+                r2 = compute_r_squared_from_mse_and_data(test_loss, test_output_magnitudes)
+
+                return {
+                    "fold": fold_idx + 1,
+                    "train_size": len(train_indices),
+                    "test_size": len(test_indices),
+                    "test_loss": float(test_loss),
+                    "test_r2": float(r2),
+                }
 
             except Exception as fold_error:
-                fold_results.append(
-                    {
-                        "fold": fold_idx + 1,
-                        "train_size": len(train_indices),
-                        "test_size": len(test_indices),
-                        "test_loss": "Failed",
-                        "test_r2": "Failed",
-                        "error": str(fold_error),
-                    }
-                )
+                return {
+                    "fold": fold_idx + 1,
+                    "train_size": len(train_indices),
+                    "test_size": len(test_indices),
+                    "test_loss": "Failed",
+                    "test_r2": "Failed",
+                    "error": str(fold_error),
+                }
+
+        # Folds are independent, so their optimizations run concurrently, a few at a time
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_fold_bounded(fold_idx: int, train_indices, test_indices) -> dict:
+            async with semaphore:
+                return await run_fold(fold_idx, train_indices, test_indices)
+
+        fold_results = await asyncio.gather(
+            *(run_fold_bounded(fold_idx, train_indices, test_indices) for fold_idx, (train_indices, test_indices) in enumerate(splits))
+        )
+        test_losses = [result["test_loss"] for result in fold_results if isinstance(result["test_loss"], float)]
+        test_r2s = [result["test_r2"] for result in fold_results if isinstance(result["test_r2"], float)]
 
         # Calculate summary statistics
         valid_losses = [x for x in test_losses if isinstance(x, int | float) and not np.isnan(x)]
@@ -1816,7 +1808,9 @@ async def compare_models(
 
     try:
         # Resolve output data from file first
-        resolved_output_values = resolve_output_data_only(data_file=data_file, output_data=output_data, file_format=file_format)
+        resolved_output_values = await asyncio.to_thread(
+            resolve_output_data_only, data_file=data_file, output_data=output_data, file_format=file_format
+        )
 
         if sigma is not None:
             try:
@@ -2176,8 +2170,8 @@ async def compute_parameter_covariance(
             except Exception as e:
                 raise ValueError(f"variance must be a number. Error: {e!s}") from e
 
-        resolved_input_data, resolved_output_data = resolve_data_input(
-            data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
+        resolved_input_data, resolved_output_data = await asyncio.to_thread(
+            resolve_data_input, data_file=data_file, input_data=input_data, output_data=output_data, file_format=file_format
         )
 
         input_names, const_names, param_names, bounds_names, n = validate_optimization_inputs(
@@ -52,8 +52,7 @@ class CovarianceService(SingletonBase):
                 - markdown_report: str (formatted results)
         """
         try:
-            with AxiomaticAPIClient() as client:
-                response = client.post("/digital-twin/compute-parameter-covariance", data=request_data)
+            response = await AxiomaticAPIClient().post("/digital-twin/compute-parameter-covariance", data=request_data)
 
             if not self._has_valid_covariance(response):
                 return self._format_error_response(response)
@@ -1,5 +1,6 @@
 """Documents MCP server for filesystem document operations."""
 
+import asyncio
 import base64
 import re
 from pathlib import Path
@@ -10,58 +11,122 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
-from ...shared.documents.pdf_to_markdown import pdf_to_markdown
+from ...shared.documents.equation_index import ENTRY_KINDS, equation_index
+from ...shared.documents.pdf_to_markdown import DEFAULT_CHUNK_CONCURRENCY, ParseResponse, pdf_to_markdown, replace_placeholders
 from ...shared.utils.prompt_utils import get_feedback_prompt
 
 mcp = FastMCP(
     name="AxDocumentParser Server",
     instructions="""This server provides tools to read, analyze, and process documents
     from the filesystem using the Axiomatic_AI Platform.
-    """ + get_feedback_prompt("parse_pdf_to_md"),
+    """ + get_feedback_prompt("parse_pdf_to_md, parse_pdfs_to_md, search_equations"),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
 
+def write_base64_image(image_path: Path, base64_string: str) -> None:
+    if base64_string.startswith("data:image/"):
+        image_data = re.match(r"data:image/[^;]+;base64,(.*)", base64_string, re.DOTALL).group(1)
+    else:
+        image_data = base64_string
+
+    image_path.write_bytes(base64.b64decode(image_data))
+
+
+async def save_parse_response(file_path: Path, response: ParseResponse) -> tuple[Path, str]:
+    """Write the markdown and its images next to the PDF.
+
+    Images are decoded and written concurrently in worker threads, and all image
+    placeholders in the markdown are rewritten in a single pass.
+
+    Returns:
+        The markdown file path and the rewritten markdown.
+    """
+    name = file_path.parent / (file_path.stem + ".md")
+
+    renamed_images = {image_name: f"{file_path.stem}_fig_{counter}.png" for counter, image_name in enumerate(response.images, start=1)}
+
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(write_base64_image, file_path.parent / renamed_images[image_name], base64_string)
+            for image_name, base64_string in response.images.items()
+        )
+    )
+
+    markdown = replace_placeholders(response.markdown, renamed_images)
+    await asyncio.to_thread(name.write_text, markdown, encoding="utf-8")
+
+    return name, markdown
+
+
+def resolve_pdf_paths(path: str, recursive: bool = False) -> list[Path]:
+    """Resolve a directory or a glob pattern (e.g. /papers/**/*.pdf) to the PDF files it matches."""
+    target = Path(path).expanduser()
+
+    if target.is_dir():
+        candidates = target.rglob("*") if recursive else target.glob("*")
+    else:
+        # Split the pattern into the literal root directory and the glob relative to it
+        parts = target.parts
+        wildcard_idx = next((i for i, part in enumerate(parts) if any(c in part for c in "*?[")), len(parts))
+        if wildcard_idx == len(parts):
+            candidates = [target]
+        else:
+            root = Path(*parts[:wildcard_idx]) if wildcard_idx else Path.cwd()
+            candidates = root.glob(str(Path(*parts[wildcard_idx:])))
+
+    return sorted(p for p in candidates if p.is_file() and p.suffix.lower() == ".pdf")
+
+
+def count_pdf_pages(file_path: Path) -> int | None:
+    from pypdf import PdfReader
+
+    try:
+        return len(PdfReader(file_path).pages)
+    except Exception:
+        return None
+
+
+def is_markdown_current(file_path: Path) -> bool:
+    markdown_path = file_path.parent / (file_path.stem + ".md")
+    return markdown_path.exists() and markdown_path.stat().st_mtime >= file_path.stat().st_mtime
+
+
+def glob_escape(value: str) -> str:
+    return re.sub(r"([*?\[])", r"[\1]", value)
+
+
+def count_saved_images(file_path: Path) -> int:
+    return sum(1 for _ in file_path.parent.glob(f"{glob_escape(file_path.stem)}_fig_*.png"))
+
+
 @mcp.tool(
     name="parse_pdf_to_md",
     description="""
     Convert a PDF document to markdown using Axiomatic's advanced OCR.
     The output will be a markdown file with the same name as the input file,
     and the images will be saved in the same directory as the input file.
+    For large documents (e.g. theses, books), set pages_per_chunk to parse page ranges in parallel.
     """,
     tags=["document", "filesystem", "analyze"],
 )
 async def document_to_markdown(
     file_path: Annotated[Path, "The absolute path to the PDF file to analyze"],
+    pages_per_chunk: Annotated[
+        int | None,
+        "Split the PDF into chunks of this many pages and parse them in parallel. Recommended for documents over ~50 pages",
+    ] = None,
+    max_concurrency: Annotated[int, "Maximum number of chunks parsed at the same time when pages_per_chunk is set"] = DEFAULT_CHUNK_CONCURRENCY,
 ) -> ToolResult:
     try:
-        response = await pdf_to_markdown(file_path)
-        markdown = response.markdown
-        name = file_path.parent / (file_path.stem + ".md")
-
-        counter = 1
-        for image_name, base64_string in response.images.items():
-            renamed_image = f"{file_path.stem}_fig_{counter}.png"
-
-            image_path = file_path.parent / renamed_image
-
-            if base64_string.startswith("data:image/"):
-                image_data = re.match(r"data:image/[^;]+;base64,(.*)", base64_string).group(1)
-            else:
-                image_data = base64_string
-
-            with Path.open(image_path, "wb") as image_file:
-                image_file.write(base64.b64decode(image_data))
-
-            markdown = markdown.replace(image_name, renamed_image)
-            counter += 1
-
-        with Path.open(name, "w", encoding="utf-8") as f:
-            f.write(markdown)
+        response = await pdf_to_markdown(file_path, pages_per_chunk=pages_per_chunk, max_concurrency=max_concurrency)
+        name, markdown = await save_parse_response(file_path, response)
 
         return ToolResult(
             content=[
@@ -79,3 +144,120 @@ async def document_to_markdown(
         )
     except Exception as e:
         raise ToolError(f"Failed to analyze PDF document: {e!s}") from e
+
+
+@mcp.tool(
+    name="parse_pdfs_to_md",
+    description="""
+    Convert every PDF in a directory (or matching a glob pattern such as /papers/**/*.pdf) to markdown in one call.
+    Files are parsed in parallel; each markdown file and its images are saved next to its PDF, exactly like parse_pdf_to_md.
+    PDFs whose markdown file is already newer than the PDF are skipped unless overwrite is set.
+    Returns a compact manifest of converted, skipped and failed files instead of the markdown content.
+    """,
+    tags=["document", "filesystem", "analyze", "batch"],
+)
+async def documents_to_markdown(
+    path: Annotated[str, "Absolute path to a directory of PDFs, or a glob pattern such as /papers/**/*.pdf"],
+    recursive: Annotated[bool, "When path is a directory, also convert PDFs in its subdirectories"] = False,
+    max_concurrency: Annotated[int, "Maximum number of PDFs parsed at the same time"] = DEFAULT_CHUNK_CONCURRENCY,
+    overwrite: Annotated[bool, "Re-convert PDFs even if their markdown file is already up to date"] = False,
+) -> ToolResult:
+    pdf_paths = await asyncio.to_thread(resolve_pdf_paths, path, recursive)
+    if not pdf_paths:
+        raise ToolError(f"No PDF files found for: {path}")
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def convert(file_path: Path) -> dict:
+        markdown_path = file_path.parent / (file_path.stem + ".md")
+        try:
+            pages = await asyncio.to_thread(count_pdf_pages, file_path)
+
+            if not overwrite and await asyncio.to_thread(is_markdown_current, file_path):
+                return {
+                    "status": "skipped",
+                    "pdf_path": str(file_path),
+                    "markdown_path": str(markdown_path),
+                    "pages": pages,
+                    "images": await asyncio.to_thread(count_saved_images, file_path),
+                }
+
+            async with semaphore:
+                response = await pdf_to_markdown(file_path)
+            await save_parse_response(file_path, response)
+
+            return {
+                "status": "converted",
+                "pdf_path": str(file_path),
+                "markdown_path": str(markdown_path),
+                "pages": pages,
+                "images": len(response.images),
+            }
+        except Exception as e:
+            return {"status": "failed", "pdf_path": str(file_path), "error": str(e)}
+
+    results = await asyncio.gather(*(convert(file_path) for file_path in pdf_paths))
+
+    manifest = {
+        status: [{k: v for k, v in r.items() if k != "status"} for r in results if r["status"] == status]
+        for status in ("converted", "skipped", "failed")
+    }
+
+    lines = [
+        f"Processed {len(results)} PDFs: {len(manifest['converted'])} converted, "
+        f"{len(manifest['skipped'])} skipped, {len(manifest['failed'])} failed"
+    ]
+    for r in results:
+        if r["status"] == "failed":
+            lines.append(f"- FAILED {r['pdf_path']}: {r['error']}")
+        else:
+            lines.append(f"- {r['status']} {r['markdown_path']} (pages: {r['pages'] if r['pages'] is not None else '?'}, images: {r['images']})")
+
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(lines))],
+        structured_content=manifest,
+    )
+
+
+@mcp.tool(
+    name="search_equations",
+    description="""
+    Search the equations, section headings and figure captions of every PDF parsed so far, without re-parsing anything.
+    Use symbols for what must appear in the equation (LaTeX or plain, e.g. n_{eff} or "n eff") and query for words
+    expected around it (e.g. "dispersion relation"). Returns matching entries with their PDF, markdown file, section and line.
+    """,
+    tags=["document", "search", "equations", "index"],
+)
+async def search_equations(
+    query: Annotated[str | None, "Words to look for in headings, captions and the text around equations"] = None,
+    symbols: Annotated[str | None, "Symbols that must appear in the equation, in order, e.g. n_{\\mathrm{eff}} or omega(k)"] = None,
+    kinds: Annotated[list[str] | None, f"Restrict results to these entry kinds: {', '.join(ENTRY_KINDS)}"] = None,
+    document: Annotated[str | None, "Restrict results to PDFs whose path contains this string"] = None,
+    limit: Annotated[int, "Maximum number of results"] = 20,
+) -> ToolResult:
+    if kinds and (unknown := set(kinds) - set(ENTRY_KINDS)):
+        raise ToolError(f"Unknown entry kinds: {', '.join(sorted(unknown))}. Valid kinds: {', '.join(ENTRY_KINDS)}")
+
+    try:
+        results = await asyncio.to_thread(equation_index.search, query, symbols, kinds, document, limit)
+    except Exception as e:
+        raise ToolError(f"Failed to search the equation index: {e!s}") from e
+
+    for result in results:
+        pdf_path = Path(result["pdf_path"])
+        result["markdown_path"] = str(pdf_path.parent / (pdf_path.stem + ".md"))
+
+    if not results:
+        text = "No matching entries. Only PDFs parsed with parse_pdf_to_md or parse_pdfs_to_md are indexed."
+    else:
+        lines = [f"Found {len(results)} matching entries:"]
+        for r in results:
+            location = f"{r['markdown_path']}:{r['line']}" if r["line"] is not None else r["pdf_path"]
+            section = f" [{r['section']}]" if r["section"] else ""
+            lines.append(f"- {r['kind']}: {r['text']} ({location}){section}")
+        text = "\n".join(lines)
+
+    return ToolResult(
+        content=[TextContent(type="text", text=text)],
+        structured_content={"results": results},
+    )
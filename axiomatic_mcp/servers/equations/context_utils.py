@@ -0,0 +1,193 @@
+"""Local relevance filtering of document markdown for the AxEquationExplorer server.
+
+Derivation requests only need the parts of a document that relate to the task. This module
+splits markdown into sections, ranks them against the task with BM25, and builds a compact
+context made of an index of every display equation plus the top ranked sections.
+Everything runs locally, no network calls are made.
+"""
+
+import math
+import re
+from collections import Counter
+
+# Documents shorter than this are always sent in full
+MIN_FILTER_CHARS = 20_000
+MAX_CHUNK_CHARS = 4_000
+DEFAULT_TOP_K = 8
+DEFAULT_MAX_CONTEXT_CHARS = 20_000
+# Share of the context budget the equation index may take, the rest is left for excerpts
+EQUATION_INDEX_BUDGET_SHARE = 0.5
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_HEADING_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+_DISPLAY_EQUATION_RE = re.compile(
+    r"\$\$(.+?)\$\$|\\\[(.+?)\\\]|\\begin\{(equation|align|eqnarray|gather|multline)\*?\}(.+?)\\end\{\3\*?\}",
+    re.DOTALL,
+)
+_TOKEN_RE = re.compile(r"[a-z]+|\d+")
+
+_STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "which",
+        "with",
+        "find",
+        "derive",
+        "express",
+        "check",
+        "verify",
+        "equation",
+        "expression",
+        "terms",
+        "using",
+        "use",
+    ]
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens. LaTeX commands such as \\alpha or n_{eff} yield 'alpha', 'n', 'eff'."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def split_sections(markdown: str, max_chunk_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    """Split markdown at headings, then split long sections at paragraph boundaries."""
+    starts = [m.start() for m in _HEADING_RE.finditer(markdown)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    sections = [markdown[start:end].strip() for start, end in zip(starts, [*starts[1:], len(markdown)], strict=True)]
+
+    chunks = []
+    for section in sections:
+        if not section:
+            continue
+        if len(section) <= max_chunk_chars:
+            chunks.append(section)
+            continue
+
+        current = ""
+        for paragraph in section.split("\n\n"):
+            if current and len(current) + len(paragraph) + 2 > max_chunk_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+        if current:
+            chunks.append(current)
+
+    return chunks
+
+
+def extract_display_equations(markdown: str) -> list[str]:
+    equations = []
+    for match in _DISPLAY_EQUATION_RE.finditer(markdown):
+        body = match.group(1) or match.group(2) or match.group(4) or ""
+        body = " ".join(body.split())
+        if body:
+            equations.append(body)
+    return equations
+
+
+def build_equation_index(equations: list[str], max_chars: int) -> str:
+    """Numbered list of equations, cut off with a note once it would exceed `max_chars`."""
+    lines = []
+    length = 0
+    for i, equation in enumerate(equations, start=1):
+        line = f"({i}) $${equation}$$"
+        if length + len(line) + 1 > max_chars:
+            lines.append(f"[... {len(equations) - i + 1} more equations omitted]")
+            break
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def bm25_scores(query_tokens: list[str], documents: list[list[str]]) -> list[float]:
+    n_docs = len(documents)
+    if n_docs == 0 or not query_tokens:
+        return [0.0] * n_docs
+
+    avg_len = sum(len(doc) for doc in documents) / n_docs or 1.0
+    document_frequency = Counter(token for doc in documents for token in set(doc))
+    query_terms = set(query_tokens)
+
+    scores = []
+    for doc in documents:
+        term_frequency = Counter(doc)
+        score = 0.0
+        for term in query_terms:
+            tf = term_frequency.get(term, 0)
+            if tf == 0:
+                continue
+            df = document_frequency[term]
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            score += idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_len))
+        scores.append(score)
+
+    return scores
+
+
+def build_task_context(
+    markdown: str,
+    task: str,
+    top_k: int = DEFAULT_TOP_K,
+    max_context_chars: int = DEFAULT_MAX_CONTEXT_CHARS,
+) -> str:
+    """Build the markdown context sent to the backend for a derivation task.
+
+    Returns the full markdown when the document is short or nothing in it matches the task.
+    Otherwise returns an index of the display equations followed by the `top_k` sections most
+    relevant to the task, in document order, within a budget of `max_context_chars`. The index
+    takes at most `EQUATION_INDEX_BUDGET_SHARE` of that budget.
+    """
+    if len(markdown) <= max(MIN_FILTER_CHARS, max_context_chars):
+        return markdown
+
+    chunks = split_sections(markdown)
+    scores = bm25_scores(tokenize(task), [tokenize(chunk) for chunk in chunks])
+    ranked = [idx for idx in sorted(range(len(chunks)), key=lambda i: scores[i], reverse=True) if scores[idx] > 0]
+    if not ranked:
+        return markdown
+
+    equations = extract_display_equations(markdown)
+    equation_index = build_equation_index(equations, int(max_context_chars * EQUATION_INDEX_BUDGET_SHARE))
+
+    budget = max_context_chars - len(equation_index)
+    selected = []
+    for idx in ranked[:top_k]:
+        if len(chunks[idx]) > budget and selected:
+            continue
+        selected.append(idx)
+        budget -= len(chunks[idx])
+
+    excerpts = "\n\n[...]\n\n".join(chunks[idx] for idx in sorted(selected))
+
+    parts = []
+    if equation_index:
+        parts.append(f"# Equation index (display equations in the document)\n\n{equation_index}")
+    parts.append(f"# Relevant excerpts\n\n{excerpts}")
+    return "\n\n".join(parts)
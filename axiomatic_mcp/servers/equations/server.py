@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import Annotated
 
@@ -6,11 +7,14 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared.api_client import AxiomaticAPIClient
 from ...shared.documents.pdf_to_markdown import pdf_to_markdown
 from ...shared.utils.prompt_utils import get_feedback_prompt
+from .context_utils import build_task_context
+from .verification import DEFAULT_VERIFY_TIMEOUT, MAX_VERIFY_WORKERS, format_verification, verify_code_file
 
 
 async def _get_document_content(document: Path | str) -> str:
@@ -23,8 +27,7 @@ async def _get_document_content(document: Path | str) -> str:
             response = await pdf_to_markdown(document)
             return response.markdown
         elif document.suffix.lower() in [".md", ".txt"]:
-            with Path.open(document, encoding="utf-8") as f:
-                return f.read()
+            return await asyncio.to_thread(document.read_text, encoding="utf-8")
         else:
             raise ValueError(f"Unsupported file type: {document.suffix}. Supported types: .pdf, .md, .txt")
 
@@ -35,18 +38,126 @@ async def _get_document_content(document: Path | str) -> str:
                 response = await pdf_to_markdown(potential_path)
                 return response.markdown
             elif potential_path.suffix.lower() in [".md", ".txt"]:
-                with Path.open(potential_path, encoding="utf-8") as f:
-                    return f.read()
+                return await asyncio.to_thread(potential_path.read_text, encoding="utf-8")
 
     return document
 
 
+def _get_code_file_path(document: Path | str, suffix: str = "") -> Path:
+    """Path of the generated code file: next to the source document, or in the cwd for raw content."""
+    if isinstance(document, Path) or (isinstance(document, str) and Path(document).exists()):
+        doc_path = Path(document)
+        return doc_path.parent / f"{doc_path.stem}_code{suffix}.py"
+    return Path.cwd() / f"expression_code{suffix}.py"
+
+
+async def _run_equation_task(endpoint: str, doc_content: str, task: str, full_document: bool) -> dict:
+    if not full_document:
+        doc_content = await asyncio.to_thread(build_task_context, doc_content, task)
+
+    input_body = {"markdown": doc_content, "task": task}
+    return await AxiomaticAPIClient().post(endpoint, data=input_body)
+
+
+async def _verify_code(file_path: Path, timeout: float) -> dict:
+    """Verification is best effort: a failure to even start the job is reported, never raised."""
+    try:
+        return await verify_code_file(file_path, timeout=timeout)
+    except Exception as e:
+        return {"status": "error", "error": str(e), "duration_s": 0.0}
+
+
+def _build_task_result(response: dict, file_path: Path, verification: dict | None) -> ToolResult:
+    content = [
+        TextContent(type="text", text=f"Explanation: {response.get('explanation', '')}"),
+        TextContent(type="text", text=f"Code: {response.get('code', '')}"),
+    ]
+    if verification is None:
+        return ToolResult(content=content)
+
+    content.append(TextContent(type="text", text=format_verification(verification)))
+    return ToolResult(content=content, structured_content={"code_path": str(file_path), "verification": verification})
+
+
+async def _run_equation_tasks(
+    endpoint: str,
+    file_prefix: str,
+    document: Path | str,
+    tasks: list[str],
+    full_document: bool,
+    max_concurrency: int,
+    verify: bool = False,
+    verify_timeout: float = DEFAULT_VERIFY_TIMEOUT,
+) -> list[dict]:
+    """Resolve the document once, then run every task concurrently, writing one code file per task.
+
+    Code files are named `<document>_code_<file_prefix>_<n>.py`, so the batch tools never overwrite
+    each other's files.
+
+    With `verify`, each code file is executed locally as soon as it is written, so verification
+    of early tasks overlaps with derivations still in flight.
+    """
+    if not tasks:
+        raise ValueError("At least one task is required")
+
+    doc_content = await _get_document_content(document)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    verify_semaphore = asyncio.Semaphore(max(1, MAX_VERIFY_WORKERS))
+
+    async def run(idx: int, task: str) -> dict:
+        try:
+            async with semaphore:
+                response = await _run_equation_task(endpoint, doc_content, task, full_document)
+
+            file_path = _get_code_file_path(document, f"_{file_prefix}_{idx}")
+            await asyncio.to_thread(file_path.write_text, response.get("code", ""), encoding="utf-8")
+
+            result = {
+                "task": task,
+                "code_path": str(file_path),
+                "explanation": response.get("explanation", ""),
+                "code": response.get("code", ""),
+            }
+            if verify:
+                async with verify_semaphore:
+                    result["verification"] = await _verify_code(file_path, verify_timeout)
+            return result
+        except Exception as e:
+            return {"task": task, "error": str(e)}
+
+    return await asyncio.gather(*(run(idx, task) for idx, task in enumerate(tasks, start=1)))
+
+
+def _format_batch_results(results: list[dict]) -> ToolResult:
+    content = []
+    for idx, result in enumerate(results, start=1):
+        if "error" in result:
+            text = f"## Task {idx}: {result['task']}\n\nFailed: {result['error']}"
+        else:
+            text = (
+                f"## Task {idx}: {result['task']}\n\n"
+                f"Code saved to: {result['code_path']}\n\n"
+                f"Explanation: {result['explanation']}\n\n"
+                f"Code: {result['code']}"
+            )
+            if "verification" in result:
+                text += f"\n\n{format_verification(result['verification'])}"
+        content.append(TextContent(type="text", text=text))
+
+    return ToolResult(content=content, structured_content={"results": results})
+
+
+DERIVE_ENDPOINT = "/equations/derive/markdown"
+# Note: Using the same endpoint for now, but this could be changed to a dedicated checking endpoint
+CHECK_ENDPOINT = "/equations/check/markdown"
+
 mcp = FastMCP(
     name="AxEquationExplorer Server",
     instructions="""This server provides tools to compose and analyze equations.
-    """ + get_feedback_prompt("find_functional_form, check_equation"),
+    """ + get_feedback_prompt("find_functional_form, check_equation, find_functional_forms, check_equations"),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
@@ -62,6 +173,9 @@ mcp = FastMCP(
 async def find_expression(
     document: Annotated[Path | str, "Either a file path to a PDF document or the document content as a string"],
     task: Annotated[str, "The task to be done for expression composition"],
+    full_document: Annotated[bool, "Send the whole document instead of only the equations and sections relevant to the task"] = False,
+    verify: Annotated[bool, "Run the generated code in a separate, memory-limited child process and report the outcome of its tests"] = False,
+    verify_timeout: Annotated[float, "Maximum number of seconds the verification may run"] = DEFAULT_VERIFY_TIMEOUT,
 ) -> ToolResult:
     """If you have scientific text with equations, but you don't see the equation you're
     interested in then use this tool and simply say: 'Express the energy in terms of
@@ -69,25 +183,13 @@ async def find_expression(
     together with sympy code that explains how it was derived."""
     try:
         doc_content = await _get_document_content(document)
+        response = await _run_equation_task(DERIVE_ENDPOINT, doc_content, task, full_document)
 
-        input_body = {"markdown": doc_content, "task": task}
-        response = AxiomaticAPIClient().post("/equations/derive/markdown", data=input_body)
+        file_path = _get_code_file_path(document)
+        await asyncio.to_thread(file_path.write_text, response.get("code", ""), encoding="utf-8")
 
-        if isinstance(document, Path) or (isinstance(document, str) and Path(document).exists()):
-            doc_path = Path(document)
-            file_path = doc_path.parent / f"{doc_path.stem}_code.py"
-        else:
-            file_path = Path.cwd() / "expression_code.py"
-
-        with Path.open(file_path, "w", encoding="utf-8") as f:
-            f.write(response.get("code", ""))
-
-        return ToolResult(
-            content=[
-                TextContent(type="text", text=f"Explanation: {response.get('explanation', '')}"),
-                TextContent(type="text", text=f"Code: {response.get('code', '')}"),
-            ]
-        )
+        verification = await _verify_code(file_path, verify_timeout) if verify else None
+        return _build_task_result(response, file_path, verification)
 
     except Exception as e:
         raise ToolError(f"Failed to derive the equation in the document: {e!s}") from e
@@ -104,31 +206,78 @@ async def find_expression(
 async def check_equation(
     document: Annotated[Path | str, "Either a file path to a PDF document or the document content as a string"],
     task: Annotated[str, "The task to be done for equation checking (e.g., 'check if E=mc² is correct')"],
+    full_document: Annotated[bool, "Send the whole document instead of only the equations and sections relevant to the task"] = False,
+    verify: Annotated[bool, "Run the generated code in a separate, memory-limited child process and report the outcome of its tests"] = False,
+    verify_timeout: Annotated[float, "Maximum number of seconds the verification may run"] = DEFAULT_VERIFY_TIMEOUT,
 ) -> ToolResult:
     """Use this tool to validate equations or check for errors in mathematical expressions.
     For example: 'Check if the equation F = ma is dimensionally consistent' or
     'Verify the correctness of the Maxwell equations in the document'."""
     try:
         doc_content = await _get_document_content(document)
-        input_body = {"markdown": doc_content, "task": task}
-        # Note: Using the same endpoint for now, but this could be changed to a dedicated checking endpoint
-        response = AxiomaticAPIClient().post("/equations/check/markdown", data=input_body)
+        response = await _run_equation_task(CHECK_ENDPOINT, doc_content, task, full_document)
 
-        if isinstance(document, Path) or (isinstance(document, str) and Path(document).exists()):
-            doc_path = Path(document)
-            file_path = doc_path.parent / f"{doc_path.stem}_code.py"
-        else:
-            file_path = Path.cwd() / "expression_code.py"
+        file_path = _get_code_file_path(document)
+        await asyncio.to_thread(file_path.write_text, response.get("code", ""), encoding="utf-8")
+
+        verification = await _verify_code(file_path, verify_timeout) if verify else None
+        return _build_task_result(response, file_path, verification)
+
+    except Exception as e:
+        raise ToolError(f"Failed to check equations in document: {e!s}") from e
+
+
+@mcp.tool(
+    name="find_functional_forms",
+    description=(
+        "Batch version of find_functional_form: derive several expressions from the same source document in one call. "
+        "The document is parsed once and all derivations run in parallel. "
+        "Each task's code is saved to its own file (<document>_code_derive_<n>.py, numbered in task order)."
+    ),
+    tags=["equations", "compose", "derive", "find", "function-finder", "batch"],
+)
+async def find_expressions(
+    document: Annotated[Path | str, "Either a file path to a PDF document or the document content as a string"],
+    tasks: Annotated[list[str], "The expression composition tasks, one per expression"],
+    full_document: Annotated[bool, "Send the whole document instead of only the equations and sections relevant to each task"] = False,
+    verify: Annotated[
+        bool, "Run each generated code file in parallel in a separate, memory-limited child process and report the outcome of its tests"
+    ] = False,
+    verify_timeout: Annotated[float, "Maximum number of seconds each verification may run"] = DEFAULT_VERIFY_TIMEOUT,
+    max_concurrency: Annotated[int, "Maximum number of derivations running at the same time"] = 4,
+) -> ToolResult:
+    """Derive several expressions from one document concurrently."""
+    try:
+        results = await _run_equation_tasks(DERIVE_ENDPOINT, "derive", document, tasks, full_document, max_concurrency, verify, verify_timeout)
+    except Exception as e:
+        raise ToolError(f"Failed to derive the equations in the document: {e!s}") from e
 
-        with Path.open(file_path, "w", encoding="utf-8") as f:
-            f.write(response.get("code", ""))
+    return _format_batch_results(results)
 
-        return ToolResult(
-            content=[
-                TextContent(type="text", text=f"Explanation: {response.get('explanation', '')}"),
-                TextContent(type="text", text=f"Code: {response.get('code', '')}"),
-            ]
-        )
 
+@mcp.tool(
+    name="check_equations",
+    description=(
+        "Batch version of check_equation: check several equations against the same source document in one call. "
+        "The document is parsed once and all checks run in parallel. "
+        "Each task's code is saved to its own file (<document>_code_check_<n>.py, numbered in task order)."
+    ),
+    tags=["equations", "check", "error-correction", "validate", "batch"],
+)
+async def check_equations(
+    document: Annotated[Path | str, "Either a file path to a PDF document or the document content as a string"],
+    tasks: Annotated[list[str], "The equation checking tasks, one per equation (e.g., 'check if E=mc² is correct')"],
+    full_document: Annotated[bool, "Send the whole document instead of only the equations and sections relevant to each task"] = False,
+    verify: Annotated[
+        bool, "Run each generated code file in parallel in a separate, memory-limited child process and report the outcome of its tests"
+    ] = False,
+    verify_timeout: Annotated[float, "Maximum number of seconds each verification may run"] = DEFAULT_VERIFY_TIMEOUT,
+    max_concurrency: Annotated[int, "Maximum number of checks running at the same time"] = 4,
+) -> ToolResult:
+    """Check several equations in one document concurrently."""
+    try:
+        results = await _run_equation_tasks(CHECK_ENDPOINT, "check", document, tasks, full_document, max_concurrency, verify, verify_timeout)
     except Exception as e:
         raise ToolError(f"Failed to check equations in document: {e!s}") from e
+
+    return _format_batch_results(results)
@@ -0,0 +1,96 @@
+"""Local verification of the sympy code generated by the AxEquationExplorer tools.
+
+Each code file is executed in its own child process (see `verification_runner.py`) with a
+timeout and an address-space limit, so a hanging or memory hungry derivation cannot take the
+server down. Jobs are independent processes, which lets batch tools verify all their tasks in
+parallel.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .verification_runner import MAX_OUTPUT_CHARS, RESULT_MARKER
+
+DEFAULT_VERIFY_TIMEOUT = 60.0
+VERIFY_MEMORY_MB = int(os.getenv("AXIOMATIC_VERIFY_MEMORY_MB", "2048"))
+MAX_VERIFY_WORKERS = int(os.getenv("AXIOMATIC_VERIFY_WORKERS", str(os.cpu_count() or 1)))
+
+# Interpreter used to run generated code, it needs sympy installed (the `verify` extra)
+VERIFY_PYTHON = os.getenv("AXIOMATIC_VERIFY_PYTHON", sys.executable)
+
+RUNNER_PATH = Path(__file__).with_name("verification_runner.py")
+
+# Generated code must not see credentials of the server process
+_HIDDEN_ENV_VARS = ("AXIOMATIC_API_KEY",)
+
+
+def _child_env() -> dict[str, str]:
+    return {key: value for key, value in os.environ.items() if key not in _HIDDEN_ENV_VARS}
+
+
+def parse_runner_output(stdout: str) -> dict | None:
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER) :])
+    return None
+
+
+async def verify_code_file(
+    code_path: Path,
+    timeout: float = DEFAULT_VERIFY_TIMEOUT,
+    memory_mb: int = VERIFY_MEMORY_MB,
+) -> dict:
+    """Run a generated code file in a child process and report its outcome.
+
+    The module is executed as `__main__`, then its `test_*` functions are called. The result
+    holds a `status` ("passed", "failed", "timeout" or "error"), the string form of
+    `composed_equation` when defined, per-test outcomes, captured output and the error if any.
+    """
+    start = time.monotonic()
+    process = await asyncio.create_subprocess_exec(
+        VERIFY_PYTHON,
+        str(RUNNER_PATH),
+        str(code_path),
+        str(memory_mb),
+        cwd=code_path.parent,
+        env=_child_env(),
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError:
+        return {"status": "timeout", "error": f"Verification timed out after {timeout:g}s", "duration_s": round(time.monotonic() - start, 3)}
+    finally:
+        # Also reached when the call is cancelled, which would otherwise orphan the child
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    result = parse_runner_output(stdout.decode("utf-8", errors="replace"))
+    if result is None:
+        # The process died before reporting, e.g. killed by the memory limit
+        result = {
+            "status": "error",
+            "error": f"Verification process exited with code {process.returncode}",
+            "output": stderr.decode("utf-8", errors="replace")[-MAX_OUTPUT_CHARS:],
+        }
+
+    result["duration_s"] = round(time.monotonic() - start, 3)
+    return result
+
+
+def format_verification(result: dict) -> str:
+    lines = [f"Verification: {result['status']} ({result['duration_s']}s)"]
+    if result.get("composed_equation") is not None:
+        lines.append(f"composed_equation = {result['composed_equation']}")
+    lines.extend(f"- {name}: {outcome}" for name, outcome in result.get("tests", {}).items())
+    if result.get("error"):
+        lines.append(f"Error: {result['error']}")
+    return "\n".join(lines)
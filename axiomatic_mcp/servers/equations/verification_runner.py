@@ -0,0 +1,86 @@
+"""Execute one generated equations code file and report the outcome as JSON.
+
+This file is run as a standalone script in a child process by `verification.py`; it must not
+import axiomatic_mcp so that starting a verification job stays cheap.
+
+Usage: python verification_runner.py <code_file> <memory_limit_mb>
+"""
+
+import contextlib
+import inspect
+import io
+import json
+import runpy
+import sys
+import traceback
+
+RESULT_MARKER = "__AXIOMATIC_VERIFICATION_RESULT__"
+MAX_OUTPUT_CHARS = 4_000
+
+
+def _limit_memory(memory_mb: int) -> None:
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows, the job then only has a timeout
+        return
+
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _format_exception(e: BaseException) -> str:
+    return "".join(traceback.format_exception(type(e), e, e.__traceback__, limit=-5))
+
+
+def _run_tests(namespace: dict) -> dict[str, str]:
+    """Call the pytest-style `test_*` functions defined by the generated code."""
+    tests = {}
+    for name, value in namespace.items():
+        if not name.startswith("test_") or not inspect.isfunction(value):
+            continue
+        if any(p.default is inspect.Parameter.empty for p in inspect.signature(value).parameters.values()):
+            tests[name] = "skipped: requires fixtures"
+            continue
+        try:
+            value()
+            tests[name] = "passed"
+        except Exception as e:
+            tests[name] = f"failed: {type(e).__name__}: {e}"
+    return tests
+
+
+def main() -> None:
+    code_path, memory_mb = sys.argv[1], int(sys.argv[2])
+    if memory_mb > 0:
+        _limit_memory(memory_mb)
+
+    result = {"status": "passed", "composed_equation": None, "tests": {}, "error": None}
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            namespace = runpy.run_path(code_path, run_name="__main__")
+        except SystemExit as e:
+            namespace = {}
+            if e.code not in (None, 0):
+                result["status"] = "failed"
+                result["error"] = f"SystemExit: {e.code}"
+        except BaseException as e:
+            namespace = {}
+            result["status"] = "failed"
+            result["error"] = _format_exception(e)
+
+        if "composed_equation" in namespace:
+            result["composed_equation"] = str(namespace["composed_equation"])
+
+        result["tests"] = _run_tests(namespace)
+        if any(outcome.startswith("failed") for outcome in result["tests"].values()):
+            result["status"] = "failed"
+
+    result["output"] = output.getvalue()[-MAX_OUTPUT_CHARS:]
+    sys.__stdout__.write(f"\n{RESULT_MARKER}{json.dumps(result)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared.utils.prompt_utils import get_feedback_prompt
@@ -23,6 +24,7 @@ mcp = FastMCP(
     + get_feedback_prompt(["generate_code", "execute_code"]),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
@@ -44,7 +46,7 @@ async def generate_code(
 ) -> ToolResult:
     """Generate Python fitting code from a problem description."""
     try:
-        response = model_fitter_service.generate_code(problem_description)
+        response = await model_fitter_service.generate_code(problem_description)
     except Exception as e:
         raise ToolError(f"Failed to generate code: {e!s}") from e
 
@@ -75,7 +77,7 @@ async def execute_code(
 ) -> ToolResult:
     """Execute Python fitting code in the model fitter sandbox."""
     try:
-        response = model_fitter_service.execute_code(code)
+        response = await model_fitter_service.execute_code(code)
     except Exception as e:
         raise ToolError(f"Failed to execute code: {e!s}") from e
 
@@ -10,6 +10,7 @@ from fastmcp import Context, FastMCP
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared.utils.prompt_utils import get_feedback_prompt
@@ -29,6 +30,7 @@ mcp = FastMCP(
     """ + get_feedback_prompt("design_circuit, simulate_circuit, list_available_pdks, get_pdk_info")),
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 circuit_service = CircuitService()
@@ -56,7 +58,7 @@ async def design(
     """Design a photonic integrated circuit."""
     if not pdk_type:
         try:
-            pdk_types = pdk_service.list_pdks()
+            pdk_types = await pdk_service.list_pdks()
             flattened_pdks = flatten_pdks_response(pdk_types)
             pdk_type = await ctx.elicit(message="Please select a PDK to generate the circuit", response_type=flattened_pdks)
 
@@ -73,7 +75,7 @@ async def design(
     if existing_code:
         refine_body["code"] = existing_code
 
-    refine_response = circuit_service.generate_pic_circuit(refine_body)
+    refine_response = await circuit_service.generate_pic_circuit(refine_body)
     code: str = refine_response["code"]
 
     formalize_body = {
@@ -82,7 +84,7 @@ async def design(
         "statements": [],
     }
 
-    formalize_response = circuit_service.get_statements(formalize_body)
+    formalize_response = await circuit_service.get_statements(formalize_body)
 
     file_path = output_path or Path.cwd()
 
@@ -317,7 +319,7 @@ async def optimize_circuit(
     tags=["design", "pdk"],
 )
 async def list_pdks():
-    all_pdks = pdk_service.list_pdks()
+    all_pdks = await pdk_service.list_pdks()
     return ToolResult(
         content=[TextContent(type="text", text="Listing available PDKs")],
         structured_content=all_pdks,
@@ -332,7 +334,7 @@ async def list_pdks():
 async def get_pdk_info(
     pdk_type: Annotated[str, "The name of the PDK. This is either provided by the user, or provided by the list_available_pdks tool"],
 ):
-    response = pdk_service.get_pdk_info(pdk_type)
+    response = await pdk_service.get_pdk_info(pdk_type)
     return ToolResult(
         content=[TextContent(type="text", text=f"Retrieved information for PDK: {pdk_type}")],
         structured_content=response,
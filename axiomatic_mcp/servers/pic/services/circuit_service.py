@@ -1,4 +1,5 @@
-import contextlib
+import asyncio
+import functools
 import io
 import json
 from importlib.resources import files
@@ -24,15 +25,8 @@ class CircuitService(SingletonBase):
         # Merge user code + template
         full_code = f"{current_file_content.decode()}\n\n{template_code}"
 
-        # Sandbox namespace
-        namespace: dict[str, object] = {}
-
-        # Capture stdout while executing code
-        buf = io.StringIO()
-        with contextlib.redirect_stdout(buf):
-            exec(full_code, namespace)
-
-        stdout = buf.getvalue().strip()
+        # Executing the circuit code is CPU bound, keep it off the event loop
+        stdout = await asyncio.to_thread(self._execute_netlist_code, full_code)
 
         # Parse stdout as JSON
         try:
@@ -40,8 +34,20 @@ class CircuitService(SingletonBase):
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse template output: {stdout}") from e
 
-    def generate_pic_circuit(self, body: dict) -> Any:
-        return AxiomaticAPIClient().post(ApiRoutes.REFINE_CIRCUIT, body)
+    @staticmethod
+    def _execute_netlist_code(full_code: str) -> str:
+        # Capture what the code prints with a print bound to a local buffer. Redirecting sys.stdout
+        # is process-wide: concurrent extractions would mix their output, and the stdio transport
+        # of the server could be left redirected.
+        buf = io.StringIO()
+        namespace: dict[str, object] = {"print": functools.partial(print, file=buf)}
+
+        exec(full_code, namespace)
+
+        return buf.getvalue().strip()
+
+    async def generate_pic_circuit(self, body: dict) -> Any:
+        return await AxiomaticAPIClient().post(ApiRoutes.REFINE_CIRCUIT, body)
 
-    def get_statements(self, body: dict) -> Any:
-        return AxiomaticAPIClient().post(ApiRoutes.FORMALIZE_CIRCUIT, body)
+    async def get_statements(self, body: dict) -> Any:
+        return await AxiomaticAPIClient().post(ApiRoutes.FORMALIZE_CIRCUIT, body)
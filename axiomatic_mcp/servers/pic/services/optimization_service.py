@@ -15,7 +15,7 @@ class OptimizationService(SingletonBase):
         }
         """
 
-        response = AxiomaticAPIClient().post(ApiRoutes.GET_OPTIMIZED_CODE, data=query)
+        response = await AxiomaticAPIClient().post(ApiRoutes.GET_OPTIMIZED_CODE, data=query)
 
         if not response:
             raise RuntimeError("No response from get_optimized_code API")
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from ....shared import AxiomaticAPIClient
@@ -6,9 +7,12 @@ from ....shared.models.singleton_base import SingletonBase
 
 
 class PdkService(SingletonBase):
-    def list_pdks(self) -> dict[str, Any]:
-        all_pdks = AxiomaticAPIClient().get(ApiRoutes.PDK_LIST)
-        available_pdks = AxiomaticAPIClient().get(ApiRoutes.PDK_PERMISSION)
+    async def list_pdks(self) -> dict[str, Any]:
+        client = AxiomaticAPIClient()
+        all_pdks, available_pdks = await asyncio.gather(
+            client.get(ApiRoutes.PDK_LIST),
+            client.get(ApiRoutes.PDK_PERMISSION),
+        )
 
         permissions = available_pdks.get("permissions", [])
 
@@ -18,6 +22,6 @@ class PdkService(SingletonBase):
 
         return all_pdks
 
-    def get_pdk_info(self, pdk_type: str):
-        response = AxiomaticAPIClient().get(ApiRoutes.PDK_INFO.format(pdk_type=pdk_type))
+    async def get_pdk_info(self, pdk_type: str):
+        response = await AxiomaticAPIClient().get(ApiRoutes.PDK_INFO.format(pdk_type=pdk_type))
         return response
@@ -14,7 +14,7 @@ class SimulationService(SingletonBase):
             "wavelengths": ...
         }
         """
-        response = AxiomaticAPIClient().post(ApiRoutes.GET_SAX_SPECTRUM, data=query)
+        response = await AxiomaticAPIClient().post(ApiRoutes.GET_SAX_SPECTRUM, data=query)
 
         if not response:
             raise RuntimeError("No response from get_sax_spectrum API")
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Any
 
 from ....shared import AxiomaticAPIClient
@@ -15,11 +14,7 @@ class StatementsService(SingletonBase):
             "statements": ...
         }
         """
-        response = await asyncio.to_thread(
-            AxiomaticAPIClient().post,
-            ApiRoutes.VALIDATE_STATEMENTS,
-            query,
-        )
+        response = await AxiomaticAPIClient().post(ApiRoutes.VALIDATE_STATEMENTS, query)
 
         if not response:
             raise RuntimeError("No response from validate_statements API")
@@ -0,0 +1,118 @@
+"""Deterministic downsampling of extracted plot series.
+
+All methods select a subset of the points of a series and return their indices ordered by x,
+so identical inputs always give identical outputs:
+
+- ``lttb``: Largest-Triangle-Three-Buckets, keeps the points that contribute most to the
+  visual shape of the curve (peaks, dips, knees).
+- ``minmax``: the lowest and highest point of each bucket, keeps every extremum.
+- ``uniform``: the points closest to evenly spaced x positions.
+- ``random``: a uniform random subset drawn with a fixed seed.
+"""
+
+import numpy as np
+
+DOWNSAMPLING_METHODS = ("lttb", "minmax", "uniform", "random")
+DEFAULT_DOWNSAMPLING = "lttb"
+RANDOM_SEED = 0
+
+
+def check_downsampling_method(method: str) -> str:
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f"Unknown downsampling method: {method}. Supported methods: {', '.join(DOWNSAMPLING_METHODS)}")
+    return method
+
+
+def _bucket_bounds(n_points: int, n_buckets: int) -> np.ndarray:
+    """Start offsets of `n_buckets` contiguous, nearly equal buckets over `n_points`, plus the end."""
+    return (np.arange(n_buckets + 1) * n_points) // n_buckets
+
+
+def lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets over x-sorted points, returns the selected indices."""
+    n_points = x.size
+    if max_points >= n_points:
+        return np.arange(n_points)
+    if max_points < 3:
+        return np.array([0, n_points - 1][: max(0, max_points)], dtype=np.intp)
+
+    # First and last points are always kept, the others are split into max_points - 2 buckets
+    bounds = 1 + _bucket_bounds(n_points - 2, max_points - 2)
+    # Mean of every bucket, the third vertex of the triangles of the previous bucket
+    counts = np.diff(bounds)
+    mean_x = np.add.reduceat(x[1:-1], bounds[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:-1], bounds[:-1] - 1) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0], selected[-1] = 0, n_points - 1
+    previous = 0
+    for bucket, (start, end) in enumerate(zip(bounds[:-1].tolist(), bounds[1:].tolist(), strict=True)):
+        # Twice the area of the triangle (previous selected point, candidate, mean of the next bucket)
+        areas = np.abs((x[previous] - next_x[bucket]) * (y[start:end] - y[previous]) - (x[previous] - x[start:end]) * (next_y[bucket] - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def min_max_per_bucket(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Lowest and highest point of each of max_points // 2 buckets of x-sorted points, returns the selected indices."""
+    n_points = x.size
+    if max_points >= n_points:
+        return np.arange(n_points)
+    if max_points < 2:
+        return np.array([int(np.argmax(y))][: max(0, max_points)], dtype=np.intp)
+
+    n_buckets = max_points // 2
+    bucket_ids = np.repeat(np.arange(n_buckets), np.diff(_bucket_bounds(n_points, n_buckets)))
+    # Within each bucket, points ordered by y: the first is the minimum and the last the maximum
+    by_y = np.lexsort((y, bucket_ids))
+    bounds = _bucket_bounds(n_points, n_buckets)
+    return np.unique(np.concatenate([by_y[bounds[:-1]], by_y[bounds[1:] - 1]]))
+
+
+def uniform_in_x(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Points closest to max_points evenly spaced x positions of x-sorted points, returns the selected indices.
+
+    Fewer points are returned where x is sparse and several targets share the same nearest point.
+    """
+    n_points = x.size
+    if max_points >= n_points:
+        return np.arange(n_points)
+    if max_points < 1:
+        return np.array([], dtype=np.intp)
+
+    targets = np.linspace(x[0], x[-1], max_points)
+    right = np.clip(np.searchsorted(x, targets), 1, n_points - 1)
+    left = right - 1
+    nearest = np.where(targets - x[left] <= x[right] - targets, left, right)
+    return np.unique(nearest)
+
+
+def seeded_random(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """A random subset of max_points points drawn with a fixed seed, returns the selected indices in order."""
+    n_points = x.size
+    if max_points >= n_points:
+        return np.arange(n_points)
+    rng = np.random.default_rng(RANDOM_SEED)
+    return np.sort(rng.choice(n_points, size=max(0, max_points), replace=False))
+
+
+_METHODS = {
+    "lttb": lttb,
+    "minmax": min_max_per_bucket,
+    "uniform": uniform_in_x,
+    "random": seeded_random,
+}
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, max_points: int, method: str = DEFAULT_DOWNSAMPLING) -> np.ndarray:
+    """Indices of at most `max_points` points of the series selected by `method`, ordered by x.
+
+    The series does not need to be sorted; ties in x keep their original order.
+    """
+    check_downsampling_method(method)
+    order = np.argsort(x, kind="stable")
+    selected = _METHODS[method](x[order], y[order], max_points)
+    return order[selected]
@@ -0,0 +1,327 @@
+"""Local digitizer for clean, machine-generated line plots, such as matplotlib figures.
+
+A fast path that avoids the plot endpoint, in three steps on the pixel array:
+
+1. Axes box: the long, dark and unsaturated lines of the image (the spines).
+2. Calibration: the major tick marks outside the box are located in pixels and mapped to the
+   values of the first and last labelled ticks given by the caller, linearly or logarithmically.
+   No text is read.
+3. Series: saturated pixels inside the box are clustered by hue and each cluster is traced
+   column by column along the path with the smallest jumps, which steps over legend entries,
+   text and crossings of other series.
+
+Every step scores its result between 0 and 1 and the overall confidence is the lowest score.
+Scatter plots, black or gray series, inward ticks and axes without a full box give a low
+confidence, and callers are expected to fall back to the remote service then. Reading image
+files requires Pillow, which is an optional dependency.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_MIN_CONFIDENCE = 0.8
+
+# Pixel classes, on 0-255 RGB
+_DARK_LUMINANCE = 110
+_GRAY_CHROMA = 50
+_SERIES_CHROMA = 60
+
+# Spines must cover this fraction of the box sides
+_MIN_SPINE_COVERAGE = 0.9
+# Ticks are searched up to this many pixels outside the box
+_MAX_TICK_LENGTH = 20
+# Minor ticks are shorter than this fraction of the longest tick
+_MAJOR_TICK_RATIO = 0.75
+
+# Hue clustering
+_HUE_BIN_DEGREES = 5
+_MAX_HUE_DISTANCE = 20
+_MIN_CLUSTER_FRACTION = 0.02
+_MIN_CLUSTER_PIXELS = 20
+
+# Tracing: rows further apart than this are separate groups of a column
+_MAX_ROW_GAP = 2
+# Columns that can be skipped between two points of a dashed or dotted line, as a fraction of the box width
+_MAX_SKIP_FRACTION = 0.02
+# Cost of a vertical jump of one pixel between consecutive runs, in pixels covered
+_JUMP_COST = 0.2
+# Cost of each skipped column, in pixels covered
+_SKIP_COST = 0.05
+# Traced series narrower than this fraction of the box are text or markers, not series
+_MIN_SERIES_WIDTH_FRACTION = 0.1
+
+
+@dataclass
+class AxisCalibration:
+    """Values of the first (left or bottom) and last (right or top) labelled major ticks of an axis."""
+
+    first_tick: float
+    last_tick: float
+    log_scale: bool = False
+
+    def __post_init__(self):
+        if self.first_tick == self.last_tick:
+            raise ValueError("The first and last tick values of an axis must differ")
+        if self.log_scale and (self.first_tick <= 0 or self.last_tick <= 0):
+            raise ValueError("Tick values of a logarithmic axis must be positive")
+
+
+@dataclass
+class AxesBox:
+    """Inner edges of the spines, in pixels, and the outer edges where ticks start."""
+
+    top: int
+    bottom: int
+    left: int
+    right: int
+    outer_bottom: int
+    outer_left: int
+
+
+@dataclass
+class LocalDigitization:
+    series: list[tuple[int, np.ndarray, np.ndarray]] = field(default_factory=list)
+    colors: list[str] = field(default_factory=list)
+    confidence: float = 0.0
+    scores: dict[str, float] = field(default_factory=dict)
+    note: str | None = None
+
+    def summary(self) -> str:
+        scores = ", ".join(f"{name} {score:.2f}" for name, score in self.scores.items())
+        text = f"Local digitizer: confidence {self.confidence:.2f}" + (f" ({scores})" if scores else "")
+        return f"{text}, {self.note}" if self.note else text
+
+
+def _runs(indices: np.ndarray) -> list[tuple[int, int]]:
+    """(first, last) of every run of consecutive integers in sorted `indices`."""
+    if indices.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) > 1)
+    starts = np.concatenate([[indices[0]], indices[breaks + 1]])
+    ends = np.concatenate([indices[breaks], [indices[-1]]])
+    return list(zip(starts.tolist(), ends.tolist(), strict=True))
+
+
+def _classify_pixels(rgb: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Masks of dark gray pixels (spines, ticks, text) and saturated pixels, and the hue of the saturated pixels in degrees."""
+    rgb = rgb.astype(np.int32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    high, low = rgb.max(axis=-1), rgb.min(axis=-1)
+    chroma = high - low
+    # Integer approximation of 0.299 R + 0.587 G + 0.114 B
+    luminance = (77 * r + 150 * g + 29 * b) >> 8
+
+    dark = (luminance < _DARK_LUMINANCE) & (chroma < _GRAY_CHROMA)
+    saturated = chroma >= _SERIES_CHROMA
+
+    # Hue only matters for the few saturated pixels
+    r, g, b, high, chroma = (channel[saturated].astype(np.float32) for channel in (r, g, b, high, chroma))
+    hue = np.zeros(saturated.shape, dtype=np.float32)
+    hue[saturated] = 60.0 * np.select([high == r, high == g], [((g - b) / chroma) % 6, (b - r) / chroma + 2], (r - g) / chroma + 4)
+    return dark, saturated, hue
+
+
+def find_axes_box(dark: np.ndarray) -> tuple[AxesBox | None, float]:
+    """Locate the axes box from its four spines and score how completely they are drawn."""
+    height, width = dark.shape
+    column_counts, row_counts = dark.sum(axis=0), dark.sum(axis=1)
+    if column_counts.max() < 0.2 * height or row_counts.max() < 0.2 * width:
+        return None, 0.0
+
+    column_runs = _runs(np.flatnonzero(column_counts >= 0.5 * column_counts.max()))
+    row_runs = _runs(np.flatnonzero(row_counts >= 0.5 * row_counts.max()))
+    if len(column_runs) < 2 or len(row_runs) < 2:
+        return None, 0.0
+
+    (outer_left, left), (right, _) = column_runs[0], column_runs[-1]
+    (_, top), (bottom, outer_bottom) = row_runs[0], row_runs[-1]
+    if right - left < 0.2 * width or bottom - top < 0.2 * height:
+        return None, 0.0
+
+    box = AxesBox(top=top + 1, bottom=bottom - 1, left=left + 1, right=right - 1, outer_bottom=outer_bottom, outer_left=outer_left)
+    coverage = min(
+        dark[top : bottom + 1, outer_left : left + 1].any(axis=1).mean(),
+        dark[top : bottom + 1, right : column_runs[-1][1] + 1].any(axis=1).mean(),
+        dark[row_runs[0][0] : top + 1, left : right + 1].any(axis=0).mean(),
+        dark[bottom : outer_bottom + 1, left : right + 1].any(axis=0).mean(),
+    )
+    score = 1.0 if coverage >= _MIN_SPINE_COVERAGE else float(coverage) / 2
+    return box, score
+
+
+def _tick_centers(lengths: np.ndarray, offset: int) -> np.ndarray:
+    """Centers of the major ticks from the tick length at every pixel along an axis."""
+    ticks = []
+    for start, end in _runs(np.flatnonzero(lengths >= 2)):
+        span = lengths[start : end + 1]
+        ticks.append((offset + start + float(np.average(np.arange(span.size), weights=span)), int(span.max())))
+    if not ticks:
+        return np.empty(0)
+    longest = max(length for _, length in ticks)
+    # Ticks running into the search limit are lines or text, not ticks
+    return np.array([center for center, length in ticks if length >= _MAJOR_TICK_RATIO * longest and length < _MAX_TICK_LENGTH])
+
+
+def _outward_run_lengths(region: np.ndarray) -> np.ndarray:
+    """Number of dark pixels from the first row of `region` on, for every column."""
+    return np.cumprod(region, axis=0).sum(axis=0)
+
+
+def find_major_ticks(dark: np.ndarray, box: AxesBox) -> tuple[np.ndarray, np.ndarray]:
+    """Pixel positions of the major ticks below the x axis (columns) and left of the y axis (rows)."""
+    below = dark[box.outer_bottom + 1 : box.outer_bottom + 1 + _MAX_TICK_LENGTH, box.left - 1 : box.right + 2]
+    left_of = dark[box.top - 1 : box.bottom + 2, max(0, box.outer_left - _MAX_TICK_LENGTH) : box.outer_left][:, ::-1].T
+    return _tick_centers(_outward_run_lengths(below), box.left - 1), _tick_centers(_outward_run_lengths(left_of), box.top - 1)
+
+
+def score_ticks(ticks: np.ndarray) -> float:
+    """1 for evenly spaced ticks (within a pixel), 0 when a tick is off by a quarter of the spacing; two ticks cannot be checked."""
+    if ticks.size < 2:
+        return 0.0
+    if ticks.size == 2:
+        return 0.8
+    index = np.arange(ticks.size)
+    spacing = (ticks[-1] - ticks[0]) / (ticks.size - 1)
+    deviation = np.abs(ticks - (ticks[0] + index * spacing)).max()
+    return float(np.clip(1 - (deviation - 1) / (0.25 * spacing - 1), 0, 1)) if spacing > 4 else 0.0
+
+
+def pixels_to_values(pixels: np.ndarray, first_tick_pixel: float, last_tick_pixel: float, axis: AxisCalibration) -> np.ndarray:
+    if axis.log_scale:
+        first, last = np.log10(axis.first_tick), np.log10(axis.last_tick)
+    else:
+        first, last = axis.first_tick, axis.last_tick
+    values = first + (pixels - first_tick_pixel) * (last - first) / (last_tick_pixel - first_tick_pixel)
+    return 10.0**values if axis.log_scale else values
+
+
+def cluster_hues(hues: np.ndarray) -> np.ndarray:
+    """Hues in degrees of the dominant colors, peaks of the circular hue histogram."""
+    n_bins = 360 // _HUE_BIN_DEGREES
+    counts = np.bincount((hues // _HUE_BIN_DEGREES).astype(int) % n_bins, minlength=n_bins).astype(float)
+    smoothed = counts + 0.5 * (np.roll(counts, 1) + np.roll(counts, -1))
+    is_peak = (smoothed > np.roll(smoothed, 1)) & (smoothed >= np.roll(smoothed, -1))
+    is_peak &= smoothed >= max(_MIN_CLUSTER_PIXELS, _MIN_CLUSTER_FRACTION * hues.size)
+    return (np.flatnonzero(is_peak) + 0.5) * _HUE_BIN_DEGREES
+
+
+def _hue_distance(hues: np.ndarray, center: float) -> np.ndarray:
+    distance = np.abs(hues - center) % 360
+    return np.minimum(distance, 360 - distance)
+
+
+def trace_series(mask: np.ndarray, max_skip: int) -> tuple[np.ndarray, np.ndarray, float]:
+    """Trace a curve through the pixels of one color.
+
+    Pixels are grouped into vertical runs per column; the curve is the chain of runs, at most
+    one per column, that maximizes the number of pixels covered minus the cost of vertical
+    jumps and skipped columns. Returns the columns and center rows of the chain and the
+    fraction of the pixels it covers.
+    """
+    columns, rows = np.nonzero(mask.T)
+    if columns.size == 0:
+        return np.empty(0), np.empty(0), 0.0
+
+    # Runs of rows within a column, in column order
+    starts = np.concatenate([[0], np.flatnonzero((np.diff(columns) != 0) | (np.diff(rows) > _MAX_ROW_GAP)) + 1])
+    ends = np.concatenate([starts[1:], [columns.size]]) - 1
+    group_columns, top, bottom = columns[starts], rows[starts], rows[ends]
+    sizes = ends - starts + 1
+
+    n_groups = group_columns.size
+    score = np.empty(n_groups)
+    previous = np.full(n_groups, -1)
+    first_group_of_column = np.searchsorted(group_columns, np.arange(group_columns[-1] + 2))
+    for group in range(n_groups):
+        column = group_columns[group]
+        candidates = np.arange(first_group_of_column[max(0, column - max_skip - 1)], first_group_of_column[column])
+        score[group] = sizes[group]
+        if candidates.size:
+            # Vertical distance between the runs, 0 when they overlap
+            jump = np.maximum(0, np.maximum(top[group] - bottom[candidates], top[candidates] - bottom[group]))
+            skipped = column - group_columns[candidates] - 1
+            linked = score[candidates] - _JUMP_COST * jump - _SKIP_COST * skipped
+            best = int(np.argmax(linked))
+            if linked[best] > 0:
+                score[group] += linked[best]
+                previous[group] = candidates[best]
+
+    chain = []
+    group = int(np.argmax(score))
+    while group >= 0:
+        chain.append(group)
+        group = previous[group]
+    chain = np.array(chain[::-1])
+    traced_columns, traced_rows = group_columns[chain], (top[chain] + bottom[chain]) / 2.0
+
+    # A pixel is on the curve if it lies between the traced rows of its own and neighboring
+    # columns, which also covers steep segments drawn as several runs in one column
+    rows_at = np.interp(np.arange(group_columns[-1] + 2), traced_columns, traced_rows)
+    on_span = (columns >= traced_columns[0]) & (columns <= traced_columns[-1])
+    previous_rows, next_rows = rows_at[np.maximum(columns - 1, 0)], rows_at[columns + 1]
+    low = np.minimum(np.minimum(previous_rows, next_rows), rows_at[columns]) - _MAX_ROW_GAP - 1
+    high = np.maximum(np.maximum(previous_rows, next_rows), rows_at[columns]) + _MAX_ROW_GAP + 1
+    covered = on_span & (rows >= low) & (rows <= high)
+    return traced_columns.astype(float), traced_rows, float(covered.mean())
+
+
+def _trace_score(covered_fraction: float) -> float:
+    """1 when the traced curve holds nearly all pixels of its color, 0 when it holds half or less."""
+    return float(np.clip((covered_fraction - 0.5) / 0.4, 0, 1))
+
+
+def digitize_plot_array(rgb: np.ndarray, x_axis: AxisCalibration, y_axis: AxisCalibration) -> LocalDigitization:
+    """Digitize the line series of a plot given as an (height, width, 3) RGB array."""
+    dark, saturated, hue = _classify_pixels(rgb)
+
+    box, box_score = find_axes_box(dark)
+    if box is None:
+        return LocalDigitization(scores={"axes_box": 0.0}, note="no axes box found")
+
+    x_ticks, y_ticks = find_major_ticks(dark, box)
+    scores = {"axes_box": box_score, "x_ticks": score_ticks(x_ticks), "y_ticks": score_ticks(y_ticks)}
+    if x_ticks.size < 2 or y_ticks.size < 2:
+        return LocalDigitization(scores=scores, note="fewer than two major ticks found on an axis")
+
+    inside = np.zeros_like(saturated)
+    inside[box.top : box.bottom + 1, box.left : box.right + 1] = True
+    candidates = saturated & inside
+    hue_centers = cluster_hues(hue[candidates])
+
+    max_skip = max(3, int(_MAX_SKIP_FRACTION * (box.right - box.left)))
+    series, colors, trace_scores, untraced = [], [], [], 0
+    for center in hue_centers:
+        mask = candidates & (_hue_distance(hue, center) <= _MAX_HUE_DISTANCE)
+        columns, rows, covered = trace_series(mask, max_skip)
+        if columns.size == 0 or columns[-1] - columns[0] < _MIN_SERIES_WIDTH_FRACTION * (box.right - box.left):
+            # Markers, colored text or a curve broken into pieces, best left to the remote service
+            untraced += 1
+            continue
+
+        x = pixels_to_values(columns, x_ticks[0], x_ticks[-1], x_axis)
+        # Rows grow downwards, the first y tick is the lowest one
+        y = pixels_to_values(rows, y_ticks[-1], y_ticks[0], y_axis)
+        series.append((len(series), x, y))
+        colors.append("#{:02x}{:02x}{:02x}".format(*np.median(rgb[mask], axis=0).astype(int).tolist()))
+        trace_scores.append(_trace_score(covered))
+
+    if not series:
+        return LocalDigitization(scores=scores, note="no colored line series found")
+
+    scores["series"] = 0.0 if untraced else min(trace_scores)
+    note = f"{untraced} color(s) could not be traced as lines" if untraced else None
+    return LocalDigitization(series=series, colors=colors, confidence=min(scores.values()), scores=scores, note=note)
+
+
+def digitize_plot_image(path: Path, x_axis: AxisCalibration, y_axis: AxisCalibration) -> LocalDigitization:
+    """Digitize a plot image file, see `digitize_plot_array`. Returns a zero confidence result without Pillow."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return LocalDigitization(note="skipped, Pillow is required. Install with: pip install Pillow")
+
+    with Image.open(path) as image:
+        rgb = np.asarray(image.convert("RGB"))
+    return digitize_plot_array(rgb, x_axis, y_axis)
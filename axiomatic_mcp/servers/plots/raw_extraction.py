@@ -0,0 +1,128 @@
+"""Full-resolution plot extractions persisted next to the plot images.
+
+The plot endpoint returns every point it extracts, but the tools only return a downsampled
+subset. The complete result is kept in ``<stem>_raw.npz`` (compressed, one column per
+quantity) together with the SHA-256 of the image, so later requests for a different point
+budget, an x-range or a single series are served locally instead of re-uploading the image.
+"""
+
+import hashlib
+import uuid
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+RAW_EXTRACTION_SUFFIX = "_raw.npz"
+FORMAT_VERSION = 1
+
+# Where the points come from: the plot endpoint or the local digitizer
+REMOTE_SOURCE = "remote"
+LOCAL_SOURCE = "local"
+
+
+@dataclass
+class RawExtraction:
+    """All extracted points of a plot, series after series.
+
+    The points of series `series_ids[i]` are `x[offsets[i]:offsets[i + 1]]` and `y[offsets[i]:offsets[i + 1]]`.
+    `source` is `REMOTE_SOURCE` or `LOCAL_SOURCE`.
+    """
+
+    series_ids: np.ndarray
+    offsets: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    x_sig_figs: int
+    y_sig_figs: int
+    image_hash: str | None = None
+    source: str = REMOTE_SOURCE
+
+    @classmethod
+    def from_series(
+        cls,
+        series: list[tuple[int, np.ndarray, np.ndarray]],
+        x_sig_figs: int,
+        y_sig_figs: int,
+        image_hash: str | None = None,
+        source: str = REMOTE_SOURCE,
+    ) -> "RawExtraction":
+        lengths = [x.size for _, x, _ in series]
+        return cls(
+            series_ids=np.array([series_id for series_id, _, _ in series], dtype=np.int64),
+            offsets=np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]).astype(np.int64),
+            x=np.concatenate([x for _, x, _ in series]) if series else np.empty(0),
+            y=np.concatenate([y for _, _, y in series]) if series else np.empty(0),
+            x_sig_figs=x_sig_figs,
+            y_sig_figs=y_sig_figs,
+            image_hash=image_hash,
+            source=source,
+        )
+
+    @property
+    def n_points(self) -> int:
+        return int(self.x.size)
+
+    def series(self) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+        for series_id, start, end in zip(self.series_ids.tolist(), self.offsets[:-1].tolist(), self.offsets[1:].tolist(), strict=True):
+            yield series_id, self.x[start:end], self.y[start:end]
+
+
+def sha256_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def raw_extraction_path(plot_path: Path) -> Path:
+    """`<stem>_raw.npz` next to the plot image."""
+    return plot_path.with_name(plot_path.stem + RAW_EXTRACTION_SUFFIX)
+
+
+def plot_stem_of(raw_path: Path) -> str:
+    """Stem of the plot image a `<stem>_raw.npz` file belongs to."""
+    return raw_path.name.removesuffix(RAW_EXTRACTION_SUFFIX) if raw_path.name.endswith(RAW_EXTRACTION_SUFFIX) else raw_path.stem
+
+
+def save_raw_extraction(path: Path, extraction: RawExtraction) -> Path:
+    # Write then rename so concurrent readers never see a partial file
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with tmp_path.open("wb") as f:
+        np.savez_compressed(
+            f,
+            version=np.int64(FORMAT_VERSION),
+            image_hash=np.str_(extraction.image_hash or ""),
+            source=np.str_(extraction.source),
+            sig_figs=np.array([extraction.x_sig_figs, extraction.y_sig_figs], dtype=np.int64),
+            series_ids=extraction.series_ids,
+            offsets=extraction.offsets,
+            x=extraction.x,
+            y=extraction.y,
+        )
+    tmp_path.replace(path)
+    return path
+
+
+def load_raw_extraction(path: Path, image_hash: str | None = None) -> RawExtraction | None:
+    """Load a saved extraction, or None if it is missing, unreadable or was made from a different image than `image_hash`."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != FORMAT_VERSION:
+                return None
+            saved_hash = str(data["image_hash"]) or None
+            if image_hash is not None and saved_hash != image_hash:
+                return None
+            x_sig_figs, y_sig_figs = data["sig_figs"].tolist()
+            return RawExtraction(
+                series_ids=data["series_ids"],
+                offsets=data["offsets"],
+                x=data["x"],
+                y=data["y"],
+                x_sig_figs=x_sig_figs,
+                y_sig_figs=y_sig_figs,
+                image_hash=saved_hash,
+                # Files saved before local extractions existed all come from the plot endpoint
+                source=str(data["source"]) if "source" in data.files else REMOTE_SOURCE,
+            )
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
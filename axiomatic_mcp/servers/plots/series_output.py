@@ -0,0 +1,218 @@
+"""Files and summaries of digitized plot series.
+
+JSON keeps the nested ``series_points`` layout returned by the tools. CSV, Parquet and NPZ hold
+a tidy table, one row per point with the columns ``series_unique_id``, ``x_value`` and
+``y_value``, written from the columns at once. The x and y columns can be renamed, and the
+series can be named and written to tables of their own, so that the AxModelFitter tools read
+them directly with a column mapping instead of the points being copied by hand.
+"""
+
+import csv
+import importlib.util
+import io
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+OUTPUT_FORMATS = ("json", "csv", "parquet", "npz")
+DEFAULT_OUTPUT_FORMAT = "json"
+
+RESPONSE_MODES = ("full", "summary")
+DEFAULT_RESPONSE_MODE = "full"
+
+DEFAULT_X_COLUMN = "x_value"
+DEFAULT_Y_COLUMN = "y_value"
+SERIES_NAME_COLUMN = "series_name"
+
+# Formats the AxModelFitter data file loader reads
+FITTER_FORMATS = ("csv", "json", "parquet")
+
+Series = list[tuple[int, np.ndarray, np.ndarray]]
+
+
+@dataclass
+class TableColumns:
+    """Names of the x and y columns of tables, and optional names of the series in order."""
+
+    x: str = DEFAULT_X_COLUMN
+    y: str = DEFAULT_Y_COLUMN
+    series_names: list[str] | None = None
+
+    def __post_init__(self):
+        if not self.x or not self.y or self.x == self.y:
+            raise ValueError(f"The x and y columns must have different, non-empty names, got {self.x!r} and {self.y!r}")
+        names = self.series_names or []
+        if len(set(names)) != len(names) or not all(names):
+            raise ValueError("Series names must be unique and non-empty")
+        if self.x in names or SERIES_NAME_COLUMN in (self.x, self.y):
+            raise ValueError(f"Series names and {SERIES_NAME_COLUMN!r} cannot be used as the x column")
+
+    def series_name(self, index: int, series_id: int) -> str:
+        """Name of the `index`-th series, `series_<id>` if it was not named."""
+        if self.series_names and index < len(self.series_names):
+            return self.series_names[index]
+        return f"series_{series_id}"
+
+
+def check_output_format(output_format: str) -> str:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}. Supported formats: {', '.join(OUTPUT_FORMATS)}")
+    if output_format == "parquet" and not any(importlib.util.find_spec(engine) for engine in ("pyarrow", "fastparquet")):
+        raise ValueError("Parquet output requires pyarrow. Install with: pip install pyarrow")
+    return output_format
+
+
+def check_response_mode(response_mode: str) -> str:
+    if response_mode not in RESPONSE_MODES:
+        raise ValueError(f"Unknown response mode: {response_mode}. Supported modes: {', '.join(RESPONSE_MODES)}")
+    return response_mode
+
+
+def series_data_path(directory: Path, stem: str, output_format: str) -> Path:
+    """`<stem>_data.<format>` in `directory`."""
+    return directory / f"{stem}_data.{output_format}"
+
+
+def series_to_json(series: Series) -> str:
+    return json.dumps(
+        {
+            "series_points": [
+                {
+                    "series_unique_id": series_id,
+                    "points": [{"x_value": x_val, "y_value": y_val} for x_val, y_val in zip(x.tolist(), y.tolist(), strict=True)],
+                }
+                for series_id, x, y in series
+            ]
+        },
+        indent=2,
+    )
+
+
+def series_columns(series: Series, columns: TableColumns | None = None) -> dict[str, np.ndarray]:
+    """One row per point, series after series, with a `series_name` column if the series are named."""
+    columns = columns or TableColumns()
+    table = {
+        "series_unique_id": np.concatenate([np.full(x.size, series_id, dtype=np.int64) for series_id, x, _ in series] or [np.empty(0, np.int64)]),
+    }
+    if columns.series_names:
+        names = [columns.series_name(index, series_id) for index, (series_id, _, _) in enumerate(series)]
+        table[SERIES_NAME_COLUMN] = np.repeat(np.array(names or [""], dtype=str), [x.size for _, x, _ in series] or [0])
+    table[columns.x] = np.concatenate([x for _, x, _ in series] or [np.empty(0)])
+    table[columns.y] = np.concatenate([y for _, _, y in series] or [np.empty(0)])
+    return table
+
+
+def write_table(path: Path, table: dict[str, np.ndarray], output_format: str) -> Path:
+    """Write named columns of equal length to `path`; JSON tables are lists of records."""
+    if output_format == "csv":
+        # Python floats print as the shortest text that reads back to the same value
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(table)
+        writer.writerows(zip(*(column.tolist() for column in table.values()), strict=True))
+        path.write_text(buffer.getvalue(), encoding="utf-8")
+    elif output_format == "json":
+        rows = zip(*(column.tolist() for column in table.values()), strict=True)
+        path.write_text(json.dumps([dict(zip(table, row, strict=True)) for row in rows]), encoding="utf-8")
+    elif output_format == "npz":
+        with path.open("wb") as f:
+            np.savez_compressed(f, **table)
+    elif output_format == "parquet":
+        import pandas as pd
+
+        pd.DataFrame(table).to_parquet(path, index=False)
+    else:
+        check_output_format(output_format)
+    return path
+
+
+def write_series_file(
+    path: Path,
+    series: Series,
+    output_format: str,
+    series_json: str | None = None,
+    columns: TableColumns | None = None,
+) -> Path:
+    """Write the series to `path` in `output_format`, JSON in the tool layout and the other formats as a tidy table.
+
+    Args:
+        series_json: The output of `series_to_json(series)` if already computed, reused for JSON files.
+        columns: Names of the table columns, see `TableColumns`.
+    """
+    if output_format == "json":
+        path.write_text(series_json if series_json is not None else series_to_json(series), encoding="utf-8")
+        return path
+    return write_table(path, series_columns(series, columns), output_format)
+
+
+def describe_series_tables(paths: list[Path], series: Series, output_format: str, columns: TableColumns | None = None) -> str:
+    """Markdown list of the series tables with their column mapping for the AxModelFitter tools."""
+    columns = columns or TableColumns()
+    lines = [f"Series tables (x column '{columns.x}'):"]
+    for index, (path, (series_id, _, _)) in enumerate(zip(paths, series, strict=True)):
+        y_column = columns.series_name(index, series_id) if columns.series_names else columns.y
+        lines.append(f"- {path} (y column '{y_column}')")
+    if output_format not in FITTER_FORMATS:
+        lines.append(f"The model fitter tools read {', '.join(FITTER_FORMATS)} files, not {output_format}")
+    return "\n".join(lines)
+
+
+def _file_name_part(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("._") or "series"
+
+
+def series_table_paths(data_path: Path, series: Series, columns: TableColumns | None = None) -> list[Path]:
+    """`<stem>_data_<series name>.<format>` next to `data_path` for every series.
+
+    Names that give the same file name, e.g. "a b" and "a_b", a name and another series' default
+    `series_<id>`, or names only differing in case, get the series id appended.
+    """
+    columns = columns or TableColumns()
+    parts = [_file_name_part(columns.series_name(index, series_id)) for index, (series_id, _, _) in enumerate(series)]
+    counts = Counter(part.casefold() for part in parts)
+    parts = [f"{part}_{series_id}" if counts[part.casefold()] > 1 else part for part, (series_id, _, _) in zip(parts, series, strict=True)]
+    if len({part.casefold() for part in parts}) != len(parts):
+        raise ValueError(f"Series names give clashing file names: {', '.join(parts)}")
+    return [data_path.with_name(f"{data_path.stem}_{part}{data_path.suffix}") for part in parts]
+
+
+def write_series_tables(data_path: Path, series: Series, output_format: str, columns: TableColumns | None = None) -> list[Path]:
+    """Write every series to a table of its own, see `series_table_paths`.
+
+    The tables hold the x column and the y column, which is named after the series if the series
+    are named.
+    """
+    columns = columns or TableColumns()
+    paths = series_table_paths(data_path, series, columns)
+    for index, (path, (series_id, x, y)) in enumerate(zip(paths, series, strict=True)):
+        y_column = columns.series_name(index, series_id) if columns.series_names else columns.y
+        write_table(path, {columns.x: x, y_column: y}, output_format)
+    return paths
+
+
+def summarize_series(series: Series) -> list[dict]:
+    return [
+        {
+            "series_unique_id": series_id,
+            "n_points": int(x.size),
+            "x_min": float(x.min()),
+            "x_max": float(x.max()),
+            "y_min": float(y.min()),
+            "y_max": float(y.max()),
+            "y_mean": float(y.mean()),
+        }
+        for series_id, x, y in series
+        if x.size
+    ]
+
+
+def format_series_summary(summary: list[dict]) -> str:
+    lines = ["| Series | Points | x range | y range | y mean |", "|---|---|---|---|---|"]
+    for s in summary:
+        x_range, y_range = f"{s['x_min']:.6g} to {s['x_max']:.6g}", f"{s['y_min']:.6g} to {s['y_max']:.6g}"
+        lines.append(f"| {s['series_unique_id']} | {s['n_points']} | {x_range} | {y_range} | {s['y_mean']:.6g} |")
+    return "\n".join(lines)
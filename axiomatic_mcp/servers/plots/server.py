@@ -1,24 +1,48 @@
 """AxPlotToData MCP server"""
 
+import asyncio
 import base64
-import json
+import contextlib
 import math
 import mimetypes
-import random
 import re
 from pathlib import Path
 from typing import Annotated
 
+import numpy as np
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 from pydantic import BaseModel
 
+from ...providers.lifespan_provider import mcp_lifespan
 from ...providers.middleware_provider import get_mcp_middleware
 from ...providers.toolset_provider import get_mcp_tools
 from ...shared import AxiomaticAPIClient
+from ...shared.utils.disk_cache import sha256_file
+from ...shared.utils.image_preprocessing import DEFAULT_MAX_IMAGE_DIMENSION, PreprocessedImage, prepare_image_upload
 from ...shared.utils.prompt_utils import get_feedback_prompt
+from .downsampling import DEFAULT_DOWNSAMPLING, check_downsampling_method, downsample_indices
+from .local_digitizer import DEFAULT_MIN_CONFIDENCE, AxisCalibration, LocalDigitization, digitize_plot_image
+from .raw_extraction import LOCAL_SOURCE, RawExtraction, load_raw_extraction, plot_stem_of, raw_extraction_path, save_raw_extraction, sha256_bytes
+from .series_output import (
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_RESPONSE_MODE,
+    DEFAULT_X_COLUMN,
+    DEFAULT_Y_COLUMN,
+    TableColumns,
+    check_output_format,
+    check_response_mode,
+    describe_series_tables,
+    format_series_summary,
+    series_data_path,
+    series_table_paths,
+    series_to_json,
+    summarize_series,
+    write_series_file,
+    write_series_tables,
+)
 
 MIN_SIG_FIGS = 4
 MAX_SIG_FIGS = 7
@@ -44,27 +68,97 @@ class SeriesPointsData(BaseModel):
     series_points: list[SeriesPoints]
 
 
+# Powers of ten up to 1e22 are exact doubles, so rounding with them matches float(format(value, ".Ng"))
+_MAX_EXACT_POWER_OF_TEN = 22
+# Integer mantissas of up to 15 digits are exact doubles
+_MAX_EXACT_SIG_FIGS = 15
+# Digits needed to round-trip any double
+_MAX_SIG_FIGS_FLOAT = 17
+# From this magnitude on str() uses scientific notation, and the digits of the integer part no longer all count
+_SCIENTIFIC_NOTATION_THRESHOLD = 1e16
+
+
+def _to_float_array(values: list) -> np.ndarray:
+    """Convert raw JSON values to floats, with NaN for missing or non-numeric entries."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+
+        def to_float(value) -> float:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return math.nan
+
+        return np.fromiter((to_float(value) for value in values), dtype=float, count=len(values))
+
+
+def _decimal_exponents(values: np.ndarray) -> np.ndarray:
+    """floor(log10(|value|)), 0 for zeros and non-finite values."""
+    abs_values = np.abs(values)
+    valid = np.isfinite(abs_values) & (abs_values > 0)
+    exponents = np.zeros(values.shape, dtype=int)
+    exponents[valid] = np.floor(np.log10(abs_values[valid])).astype(int)
+    # log10 can round up just below a power of ten
+    exponents[valid & (10.0 ** exponents.astype(float) > abs_values)] -= 1
+    return exponents
+
+
+def round_to_significant_figures(values: np.ndarray, sig_figs: int) -> np.ndarray:
+    """Vectorized equivalent of float(format(value, f".{sig_figs}g"))"""
+    values = np.asarray(values, dtype=float)
+    decimals = sig_figs - 1 - _decimal_exponents(values)
+    with np.errstate(over="ignore", invalid="ignore"):
+        # Subnormal values need a power of ten beyond the float range
+        scale = 10.0 ** np.abs(decimals).astype(float)
+        scaled = np.where(decimals >= 0, values * scale, values / scale)
+        mantissas = np.round(scaled)
+        # The integer mantissa is exact and so is the power of ten, the final division or
+        # multiplication then yields the double closest to the decimal
+        rounded = np.where(decimals >= 0, mantissas / scale, mantissas * scale)
+        # Scaling rounds too, halfway cases are decided on the exact binary value instead
+        near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 4 * np.finfo(float).eps * np.abs(scaled)
+
+    inexact = np.isfinite(values) & (near_tie | (np.abs(decimals) > _MAX_EXACT_POWER_OF_TEN) | (sig_figs > _MAX_EXACT_SIG_FIGS))
+    if inexact.any():
+        rounded[inexact] = [float(format(value, f".{sig_figs}g")) for value in values[inexact].tolist()]
+    return rounded
+
+
+def significant_figures(values: np.ndarray) -> np.ndarray:
+    """Vectorized count_significant_figures.
+
+    All digits of the integer part count, as does at least one decimal ("100.0" has 4);
+    leading zeros of values below 1 do not ("0.0025" has 2).
+    """
+    values = np.abs(np.asarray(values, dtype=float))
+
+    # Shortest number of significant digits that reproduces each value, as in its repr
+    digits = np.full(values.shape, _MAX_SIG_FIGS_FLOAT)
+    unresolved = np.isfinite(values) & (values > 0)
+    for sig_figs in range(1, _MAX_SIG_FIGS_FLOAT):
+        if not unresolved.any():
+            break
+        exact = unresolved & (round_to_significant_figures(values, sig_figs) == values)
+        digits[exact] = sig_figs
+        unresolved &= ~exact
+
+    in_positional_notation = (values >= 1) & (values < _SCIENTIFIC_NOTATION_THRESHOLD)
+    digits = np.where(in_positional_notation, np.maximum(digits, _decimal_exponents(values) + 2), digits)
+    return np.where(values == 0, 1, digits)
+
+
 def count_significant_figures(value: float) -> int:
     """Counts significant figures in a float"""
-    if value == 0:
-        return 1
+    return int(significant_figures(np.array([value]))[0])
 
-    num_str = str(abs(value))
 
-    # scientific notation
-    if "e" in num_str.lower():
-        num_str = num_str.lower().split("e")[0]
-
-    if "." in num_str:
-        parts = num_str.split(".")
-        if parts[0] == "0" or parts[0] == "":
-            frac = parts[1].lstrip("0")
-            return len(frac) if frac else 1
-        else:
-            return len(parts[0]) + len(parts[1])
-    else:
-        stripped = num_str.lstrip("0")
-        return len(stripped) if stripped else 1
+def _max_tick_sig_figs(tick_values: list) -> int:
+    values = _to_float_array(list(tick_values))
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return 0
+    return int(significant_figures(values).max())
 
 
 def determine_sig_figs(response: dict) -> tuple[int, int]:
@@ -75,24 +169,8 @@ def determine_sig_figs(response: dict) -> tuple[int, int]:
     """
     plot_info = response.get("plot_info", {})
 
-    x_tick_values = plot_info.get("x_axis_tick_values", [])
-    y_tick_values = plot_info.get("y_axis_tick_values", [])
-
-    x_max_sig_figs = 0
-    for value in x_tick_values:
-        try:
-            sig_figs = count_significant_figures(float(value))
-            x_max_sig_figs = max(x_max_sig_figs, sig_figs)
-        except (TypeError, ValueError):
-            continue
-
-    y_max_sig_figs = 0
-    for value in y_tick_values:
-        try:
-            sig_figs = count_significant_figures(float(value))
-            y_max_sig_figs = max(y_max_sig_figs, sig_figs)
-        except (TypeError, ValueError):
-            continue
+    x_max_sig_figs = _max_tick_sig_figs(plot_info.get("x_axis_tick_values", []))
+    y_max_sig_figs = _max_tick_sig_figs(plot_info.get("y_axis_tick_values", []))
 
     x_sig_figs = max(MIN_SIG_FIGS, min(MAX_SIG_FIGS, x_max_sig_figs))
     y_sig_figs = max(MIN_SIG_FIGS, min(MAX_SIG_FIGS, y_max_sig_figs))
@@ -100,11 +178,11 @@ def determine_sig_figs(response: dict) -> tuple[int, int]:
     return x_sig_figs, y_sig_figs
 
 
-def process_plot_parser_output(response_json, max_points: int = 100) -> SeriesPointsData:
-    """Process plot parser output and extract series data for mcp"""
+def parse_plot_parser_output(response_json, image_hash: str | None = None) -> RawExtraction:
+    """All finite points of every series of the plot parser output, with the significant figures of the axis ticks."""
     x_sig_figs, y_sig_figs = determine_sig_figs(response_json)
 
-    extracted_series_list: list[SeriesPoints] = []
+    extracted_series_list = []
 
     series_array = (response_json or {}).get("extracted_series") or []
     for idx, extracted_series in enumerate(series_array):
@@ -112,26 +190,11 @@ def process_plot_parser_output(response_json, max_points: int = 100) -> SeriesPo
         if not all_extracted_points:
             continue
 
-        sample_size = min(max_points, len(all_extracted_points))
-        selected_points = random.sample(all_extracted_points, sample_size)
-
-        condensed_points_list: list[Point] = []
-        for point in selected_points:
-            x_raw = point.get("value_x")
-            y_raw = point.get("value_y")
-            if x_raw is None or y_raw is None:
-                continue
-            try:
-                x_num = float(x_raw)
-                y_num = float(y_raw)
-            except (TypeError, ValueError):
-                continue
-            if not math.isfinite(x_num) or not math.isfinite(y_num):
-                continue
-            x_val = float(format(x_num, f".{x_sig_figs}g"))
-            y_val = float(format(y_num, f".{y_sig_figs}g"))
-            condensed_points_list.append(Point(x_value=x_val, y_value=y_val))
-        if not condensed_points_list:
+        x = _to_float_array([point.get("value_x") for point in all_extracted_points])
+        y = _to_float_array([point.get("value_y") for point in all_extracted_points])
+        finite = np.isfinite(x) & np.isfinite(y)
+        x, y = x[finite], y[finite]
+        if x.size == 0:
             continue
 
         series_id = extracted_series.get("id", idx)
@@ -140,9 +203,99 @@ def process_plot_parser_output(response_json, max_points: int = 100) -> SeriesPo
         except (TypeError, ValueError):
             series_id = idx
 
-        series = SeriesPoints(series_unique_id=series_id, points=condensed_points_list)
-        extracted_series_list.append(series)
-    return SeriesPointsData(series_points=extracted_series_list)
+        extracted_series_list.append((series_id, x, y))
+    return RawExtraction.from_series(extracted_series_list, x_sig_figs, y_sig_figs, image_hash=image_hash)
+
+
+def sample_raw_extraction(
+    extraction: RawExtraction,
+    max_points: int | None = 100,
+    downsampling: str = DEFAULT_DOWNSAMPLING,
+    x_min: float | None = None,
+    x_max: float | None = None,
+    series_ids: list[int] | None = None,
+) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    """Select, crop and downsample the series of an extraction.
+
+    Returns:
+        (series_id, x, y) for every selected series with at least one point in [x_min, x_max], with
+        at most `max_points` points each (all if None) selected by `downsampling` (see `downsampling.py`),
+        sorted by x and rounded to the significant figures of the axis ticks.
+    """
+    sampled = []
+    for series_id, x, y in extraction.series():
+        if series_ids is not None and series_id not in series_ids:
+            continue
+
+        if x_min is not None or x_max is not None:
+            in_range = (x >= (-np.inf if x_min is None else x_min)) & (x <= (np.inf if x_max is None else x_max))
+            x, y = x[in_range], y[in_range]
+            if x.size == 0:
+                continue
+
+        selected = downsample_indices(x, y, x.size if max_points is None else max_points, downsampling)
+        x, y = x[selected], y[selected]
+
+        sampled.append((series_id, round_to_significant_figures(x, extraction.x_sig_figs), round_to_significant_figures(y, extraction.y_sig_figs)))
+    return sampled
+
+
+def axis_calibrations(
+    x_tick_range: list[float] | None,
+    y_tick_range: list[float] | None,
+    x_log_scale: bool = False,
+    y_log_scale: bool = False,
+) -> tuple[AxisCalibration, AxisCalibration] | None:
+    """Calibration of both axes for the local digitizer, or None if no tick range is given."""
+    if x_tick_range is None and y_tick_range is None:
+        return None
+    if x_tick_range is None or y_tick_range is None:
+        raise ValueError("The local digitizer needs the tick ranges of both axes")
+    if len(x_tick_range) != 2 or len(y_tick_range) != 2:
+        raise ValueError("Tick ranges must be [first labelled tick value, last labelled tick value]")
+    return AxisCalibration(*x_tick_range, log_scale=x_log_scale), AxisCalibration(*y_tick_range, log_scale=y_log_scale)
+
+
+def local_raw_extraction(
+    digitization: LocalDigitization,
+    axes: tuple[AxisCalibration, AxisCalibration],
+    image_hash: str | None = None,
+) -> RawExtraction:
+    """Extraction of the local digitizer, rounded to the significant figures of the given tick values."""
+    x_axis, y_axis = axes
+    x_sig_figs, y_sig_figs = determine_sig_figs(
+        {"plot_info": {"x_axis_tick_values": [x_axis.first_tick, x_axis.last_tick], "y_axis_tick_values": [y_axis.first_tick, y_axis.last_tick]}}
+    )
+    return RawExtraction.from_series(digitization.series, x_sig_figs, y_sig_figs, image_hash=image_hash, source=LOCAL_SOURCE)
+
+
+def extract_series_arrays(
+    response_json,
+    max_points: int = 100,
+    downsampling: str = DEFAULT_DOWNSAMPLING,
+) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    """Columnar core of process_plot_parser_output, see `sample_raw_extraction`."""
+    return sample_raw_extraction(parse_plot_parser_output(response_json), max_points=max_points, downsampling=downsampling)
+
+
+def series_points_data(series: list[tuple[int, np.ndarray, np.ndarray]]) -> SeriesPointsData:
+    # A single validation of plain dicts runs in pydantic-core, far cheaper than building models point by point
+    return SeriesPointsData.model_validate(
+        {
+            "series_points": [
+                {
+                    "series_unique_id": series_id,
+                    "points": [{"x_value": x_val, "y_value": y_val} for x_val, y_val in zip(x.tolist(), y.tolist(), strict=True)],
+                }
+                for series_id, x, y in series
+            ]
+        }
+    )
+
+
+def process_plot_parser_output(response_json, max_points: int = 100, downsampling: str = DEFAULT_DOWNSAMPLING) -> SeriesPointsData:
+    """Process plot parser output and extract series data for mcp"""
+    return series_points_data(extract_series_arrays(response_json, max_points=max_points, downsampling=downsampling))
 
 
 PLOTS_SERVER_INSTRUCTIONS = """This server hosts tools for extracting numerical data from plot images. 
@@ -150,26 +303,22 @@ It can analyze line plots and scatter plots and convert visual data points into
 
 plots = FastMCP(
     name="""AxPlotToData server
-    """ + get_feedback_prompt("extract_numerical_series"),
+    """ + get_feedback_prompt("extract_numerical_series, extract_numerical_series_batch, split_and_extract_multi_plot"),
     instructions=PLOTS_SERVER_INSTRUCTIONS,
     version="0.0.1",
     middleware=get_mcp_middleware(),
+    lifespan=mcp_lifespan,
     tools=get_mcp_tools(),
 )
 
 
-@plots.tool(
-    name="extract_numerical_series",
-    description="Analyzes images of line and scatter plots to extract precise numerical data points from all series in the plot",
-    tags={"plot", "filesystem", "analyze"},
-)
-async def extract_data_from_plot_image(
-    plot_path: Annotated[Path, "The absolute path to the image file of the plot to analyze. Supports only PNG for now"],
-    max_number_points_per_series: Annotated[
-        int,
-        "Maximum points returned per series. Uses random sampling if plot contains more points than limit",
-    ] = 100,
-) -> Annotated[ToolResult, "Extracted plot data containing series and points from the plot image"]:
+def check_max_points(max_points: int | None) -> None:
+    if max_points is not None and max_points < 1:
+        raise ToolError(f"max_number_points_per_series must be at least 1, got {max_points}")
+
+
+def validate_plot_image(plot_path: Path) -> str:
+    """Check that the plot image exists and is supported, and return the MIME type to upload it with."""
     if not plot_path.is_file():
         raise FileNotFoundError(f"Image not found or is not a regular file: {plot_path}")
 
@@ -181,39 +330,372 @@ async def extract_data_from_plot_image(
     mime_type, _ = mimetypes.guess_type(str(plot_path))
     if not mime_type or not mime_type.startswith("image/"):
         mime_type = "application/octet-stream"
+    return mime_type
+
+
+async def extract_plot_series(
+    plot_path: Path,
+    max_points: int = 100,
+    preprocess_image: bool = False,
+    max_image_dimension: int = DEFAULT_MAX_IMAGE_DIMENSION,
+    downsampling: str = DEFAULT_DOWNSAMPLING,
+    use_cache: bool = True,
+    axes: tuple[AxisCalibration, AxisCalibration] | None = None,
+    local_min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+) -> tuple[list[tuple[int, np.ndarray, np.ndarray]], PreprocessedImage | None, bool, LocalDigitization | None]:
+    """Extract the series of one plot image.
+
+    The full extraction is kept in `<stem>_raw.npz` and reused while the image is unchanged.
+    Otherwise, if the axes are calibrated, the image is first digitized locally and only
+    uploaded when the local result has a confidence below `local_min_confidence`. Local
+    results are saved too, for `resample_extracted_series`, but never reused here: they
+    depend on the given tick values, and running the local digitizer again is as fast.
+
+    Returns:
+        The (series_id, x, y) series, the preprocessing report if any, whether the saved
+        extraction was reused and the local digitizer result if it ran.
+    """
+    mime_type = validate_plot_image(plot_path)
 
-    with Path.open(plot_path, "rb") as f:
-        files = {"plot_img": (plot_path.name, f, mime_type)}
-        params = {"get_img_coords": True, "v2": True}
+    image_hash = await asyncio.to_thread(sha256_file, plot_path)
+    raw_path = raw_extraction_path(plot_path)
+    extraction = await asyncio.to_thread(load_raw_extraction, raw_path, image_hash) if use_cache else None
+    if extraction is not None and extraction.source == LOCAL_SOURCE:
+        extraction = None
+    cached = extraction is not None
 
-        try:
-            response = AxiomaticAPIClient().post("/document/plot/points", files=files, params=params)
-        except Exception as e:
-            raise ToolError(f"Failed to analyze plot image: {e!s}") from e
+    local = None
+    if extraction is None and axes is not None:
+        local = await asyncio.to_thread(digitize_plot_image, plot_path, *axes)
+        if local.confidence >= local_min_confidence:
+            extraction = local_raw_extraction(local, axes, image_hash)
+            await store_raw_extraction(raw_path, extraction)
+
+    preprocessed = None
+    if extraction is None:
+        preprocessed = await prepare_image_upload(plot_path, "image/png", preprocess_image, max_image_dimension)
+        extraction = await request_raw_extraction(plot_path.name, preprocessed.content if preprocessed else plot_path, mime_type, image_hash)
+        await store_raw_extraction(raw_path, extraction)
+
+    return sample_raw_extraction(extraction, max_points=max_points, downsampling=downsampling), preprocessed, cached, local
 
-        if not isinstance(response, dict):
-            raise ToolError("Upstream service returned non-JSON response")
 
-        if "extracted_series" not in response:
-            raise ToolError("Upstream service returned unexpected response format")
+async def request_raw_extraction(file_name: str, content: bytes | Path, mime_type: str, image_hash: str | None = None) -> RawExtraction:
+    files = {"plot_img": (file_name, content, mime_type)}
+    params = {"get_img_coords": True, "v2": True}
 
-    series_data = process_plot_parser_output(response, max_points=max_number_points_per_series)
+    try:
+        response = await AxiomaticAPIClient().post("/document/plot/points", files=files, params=params)
+    except Exception as e:
+        raise ToolError(f"Failed to analyze plot image: {e!s}") from e
+
+    if not isinstance(response, dict):
+        raise ToolError("Upstream service returned non-JSON response")
+
+    if "extracted_series" not in response:
+        raise ToolError("Upstream service returned unexpected response format")
+
+    return await asyncio.to_thread(parse_plot_parser_output, response, image_hash)
+
+
+async def store_raw_extraction(raw_path: Path, extraction: RawExtraction) -> None:
+    # Not being able to save the extraction only means the next request uploads the image again
+    with contextlib.suppress(OSError):
+        await asyncio.to_thread(save_raw_extraction, raw_path, extraction)
+
+
+def local_digitizer_text(local: LocalDigitization, min_confidence: float) -> str:
+    if local.confidence >= min_confidence:
+        return f"{local.summary()}, used instead of uploading the image"
+    return f"{local.summary()}, below {min_confidence:.2f}, extracted by the remote service instead"
+
+
+async def save_series(
+    data_path: Path,
+    series: list[tuple[int, np.ndarray, np.ndarray]],
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+    response_mode: str = DEFAULT_RESPONSE_MODE,
+    columns: TableColumns | None = None,
+    split_series: bool = False,
+) -> str:
+    """Write the series to `data_path` and return the text describing them in a tool response.
+
+    In "full" mode the text holds the points as JSON, serialized once for both the response and
+    a JSON file; in "summary" mode it only holds statistics of every series. With `split_series`
+    every series is also written to a table of its own and the text lists them.
+    """
+    series_json = series_to_json(series) if response_mode == "full" or output_format == "json" else None
+    await asyncio.to_thread(write_series_file, data_path, series, output_format, series_json, columns)
+
+    tables_text = ""
+    if split_series:
+        table_paths = await asyncio.to_thread(write_series_tables, data_path, series, output_format, columns)
+        tables_text = describe_series_tables(table_paths, series, output_format, columns) + "\n\n"
+
+    if response_mode == "summary":
+        return tables_text + format_series_summary(summarize_series(series))
+    return f"{tables_text}```json\n{series_json}\n```"
+
+
+@plots.tool(
+    name="extract_numerical_series",
+    description="Analyzes images of line and scatter plots to extract precise numerical data points from all series in the plot",
+    tags={"plot", "filesystem", "analyze"},
+)
+async def extract_data_from_plot_image(
+    plot_path: Annotated[Path, "The absolute path to the image file of the plot to analyze. Supports only PNG for now"],
+    max_number_points_per_series: Annotated[
+        int,
+        "Maximum points returned per series. Uses the downsampling method if plot contains more points than limit",
+    ] = 100,
+    downsampling: Annotated[
+        str,
+        "How series are reduced to the point limit: 'lttb' (default, keeps the visual shape), 'minmax' (keeps every peak and dip), "
+        "'uniform' (evenly spaced in x) or 'random' (seeded). Points are always returned sorted by x",
+    ] = DEFAULT_DOWNSAMPLING,
+    preprocess_image: Annotated[bool, "Downsample, strip metadata and losslessly recompress the image locally before uploading"] = False,
+    max_image_dimension: Annotated[int, "Longest side in pixels of the preprocessed image"] = DEFAULT_MAX_IMAGE_DIMENSION,
+    use_cache: Annotated[bool, "Reuse the full extraction saved in <stem>_raw.npz while the image is unchanged instead of uploading it again"] = True,
+    output_format: Annotated[
+        str,
+        "Format of the data file: 'json' (default, series with lists of points), or one row per point (series_unique_id, x_value, y_value) "
+        "as 'csv', 'parquet' or 'npz'",
+    ] = DEFAULT_OUTPUT_FORMAT,
+    x_column: Annotated[str, "Name of the x column of table data files (csv, parquet, npz)"] = DEFAULT_X_COLUMN,
+    y_column: Annotated[str, "Name of the y column of table data files"] = DEFAULT_Y_COLUMN,
+    series_names: Annotated[
+        list[str] | None,
+        "Names of the series in the order they are returned, written to a series_name column of table data files",
+    ] = None,
+    split_series: Annotated[
+        bool,
+        "Also write every series to <stem>_data_<series name>.<output_format> with only its x and y columns (the y column named after "
+        "the series if named), which the model fitter tools read directly as data_file",
+    ] = False,
+    response_mode: Annotated[
+        str,
+        "'full' (default) returns the points, 'summary' only returns the data file path and per-series statistics (points, x and y ranges)",
+    ] = DEFAULT_RESPONSE_MODE,
+    x_tick_range: Annotated[
+        list[float] | None,
+        "Values of the first (leftmost) and last (rightmost) labelled major ticks of the x axis. Given with y_tick_range, the plot is "
+        "first digitized locally, without uploading it; this suits clean, machine-generated line plots with a full axes box and outward ticks",
+    ] = None,
+    y_tick_range: Annotated[
+        list[float] | None,
+        "Values of the first (lowest) and last (highest) labelled major ticks of the y axis, see x_tick_range",
+    ] = None,
+    x_log_scale: Annotated[bool, "Whether the x axis is logarithmic, for the local digitizer"] = False,
+    y_log_scale: Annotated[bool, "Whether the y axis is logarithmic, for the local digitizer"] = False,
+    local_min_confidence: Annotated[
+        float,
+        "Lowest confidence (0 to 1) of the local digitizer at which its result is used, below it the image is sent to the remote service",
+    ] = DEFAULT_MIN_CONFIDENCE,
+) -> Annotated[ToolResult, "Extracted plot data containing series and points from the plot image"]:
+    check_downsampling_method(downsampling)
+    check_max_points(max_number_points_per_series)
+    check_output_format(output_format)
+    columns = TableColumns(x_column, y_column, series_names)
+    check_response_mode(response_mode)
+    axes = axis_calibrations(x_tick_range, y_tick_range, x_log_scale, y_log_scale)
+
+    series, preprocessed, cached, local = await extract_plot_series(
+        plot_path,
+        max_points=max_number_points_per_series,
+        preprocess_image=preprocess_image,
+        max_image_dimension=max_image_dimension,
+        downsampling=downsampling,
+        use_cache=use_cache,
+        axes=axes,
+        local_min_confidence=local_min_confidence,
+    )
 
-    json_path = plot_path.parent / (plot_path.stem + "_data.json")
+    data_path = series_data_path(plot_path.parent, plot_path.stem, output_format)
+    series_text = await save_series(data_path, series, output_format, response_mode, columns, split_series)
 
-    with Path.open(json_path, "w", encoding="utf-8") as f:
-        json.dump(series_data.model_dump(), f, indent=2)
+    cache_text = " (reused saved extraction, no upload)" if cached else ""
+    local_text = f"{local_digitizer_text(local, local_min_confidence)}\n\n" if local else ""
+    preprocessing_text = f"{preprocessed.summary()}\n\n" if preprocessed else ""
 
     return ToolResult(
         content=[
             TextContent(
                 type="text",
-                text=f"Extracted plot data saved to: {json_path}\n\n```json\n{json.dumps(series_data.model_dump(), indent=2)}\n```",
+                text=f"Extracted plot data saved to: {data_path}{cache_text}\n\n{local_text}{preprocessing_text}{series_text}",
             )
         ],
     )
 
 
+def resolve_plot_paths(paths: list[str], recursive: bool = False) -> list[Path]:
+    """Expand directories to the PNG images they contain, keeping the given order and dropping duplicates."""
+    resolved: dict[Path, None] = {}
+    for path in paths:
+        target = Path(path).expanduser()
+        if target.is_dir():
+            candidates = target.rglob("*") if recursive else target.glob("*")
+            resolved.update(dict.fromkeys(sorted(p for p in candidates if p.is_file() and p.suffix.lower() == ".png")))
+        else:
+            resolved[target] = None
+    return list(resolved)
+
+
+@plots.tool(
+    name="extract_numerical_series_batch",
+    description=(
+        "Batch version of extract_numerical_series: digitizes many plot images (a directory and/or a list of PNG files) in one call. "
+        "Images are processed in parallel; each one's data is saved to <stem>_data.<output_format> next to it. "
+        "Returns a compact summary table instead of the points."
+    ),
+    tags={"plot", "filesystem", "analyze", "batch"},
+)
+async def extract_data_from_plot_images(
+    paths: Annotated[list[str], "Absolute paths of PNG plot images and/or directories containing them"],
+    recursive: Annotated[bool, "Also include images in subdirectories of the given directories"] = False,
+    max_concurrency: Annotated[int, "Maximum number of images processed at the same time"] = 4,
+    max_number_points_per_series: Annotated[
+        int,
+        "Maximum points returned per series. Uses the downsampling method if plot contains more points than limit",
+    ] = 100,
+    downsampling: Annotated[
+        str,
+        "How series are reduced to the point limit: 'lttb' (default, keeps the visual shape), 'minmax' (keeps every peak and dip), "
+        "'uniform' (evenly spaced in x) or 'random' (seeded). Points are always returned sorted by x",
+    ] = DEFAULT_DOWNSAMPLING,
+    preprocess_image: Annotated[bool, "Downsample, strip metadata and losslessly recompress each image locally before uploading"] = False,
+    max_image_dimension: Annotated[int, "Longest side in pixels of the preprocessed images"] = DEFAULT_MAX_IMAGE_DIMENSION,
+    use_cache: Annotated[bool, "Reuse the full extraction saved in <stem>_raw.npz while the image is unchanged instead of uploading it again"] = True,
+    output_format: Annotated[
+        str,
+        "Format of the data file: 'json' (default, series with lists of points), or one row per point (series_unique_id, x_value, y_value) "
+        "as 'csv', 'parquet' or 'npz'",
+    ] = DEFAULT_OUTPUT_FORMAT,
+    x_column: Annotated[str, "Name of the x column of table data files (csv, parquet, npz)"] = DEFAULT_X_COLUMN,
+    y_column: Annotated[str, "Name of the y column of table data files"] = DEFAULT_Y_COLUMN,
+    series_names: Annotated[
+        list[str] | None,
+        "Names of the series in the order they are returned for every image, written to a series_name column of table data files",
+    ] = None,
+    split_series: Annotated[
+        bool,
+        "Also write every series to <stem>_data_<series name>.<output_format> with only its x and y columns (the y column named after "
+        "the series if named), which the model fitter tools read directly as data_file",
+    ] = False,
+    x_tick_range: Annotated[
+        list[float] | None,
+        "Values of the first (leftmost) and last (rightmost) labelled major ticks of the x axis. Given with y_tick_range, every plot is "
+        "first digitized locally, without uploading it, which needs all images to share the axes; "
+        "this suits clean, machine-generated line plots with a full axes box and outward ticks",
+    ] = None,
+    y_tick_range: Annotated[
+        list[float] | None,
+        "Values of the first (lowest) and last (highest) labelled major ticks of the y axis, see x_tick_range",
+    ] = None,
+    x_log_scale: Annotated[bool, "Whether the x axis is logarithmic, for the local digitizer"] = False,
+    y_log_scale: Annotated[bool, "Whether the y axis is logarithmic, for the local digitizer"] = False,
+    local_min_confidence: Annotated[
+        float,
+        "Lowest confidence (0 to 1) of the local digitizer at which its result is used, below it the image is sent to the remote service",
+    ] = DEFAULT_MIN_CONFIDENCE,
+) -> Annotated[ToolResult, "Summary of the extracted data of every image"]:
+    check_downsampling_method(downsampling)
+    check_max_points(max_number_points_per_series)
+    check_output_format(output_format)
+    columns = TableColumns(x_column, y_column, series_names)
+    axes = axis_calibrations(x_tick_range, y_tick_range, x_log_scale, y_log_scale)
+
+    plot_paths = await asyncio.to_thread(resolve_plot_paths, paths, recursive)
+    if not plot_paths:
+        raise ToolError(f"No PNG images found in: {', '.join(paths)}")
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def extract(plot_path: Path) -> dict:
+        try:
+            async with semaphore:
+                series, preprocessed, cached, local = await extract_plot_series(
+                    plot_path,
+                    max_points=max_number_points_per_series,
+                    preprocess_image=preprocess_image,
+                    max_image_dimension=max_image_dimension,
+                    downsampling=downsampling,
+                    use_cache=use_cache,
+                    axes=axes,
+                    local_min_confidence=local_min_confidence,
+                )
+            data_path = series_data_path(plot_path.parent, plot_path.stem, output_format)
+            await save_series(data_path, series, output_format, "summary", columns, split_series)
+        except Exception as e:
+            return {"status": "failed", "plot_path": str(plot_path), "error": str(e)}
+
+        return {
+            "status": "extracted",
+            "plot_path": str(plot_path),
+            "data_path": str(data_path),
+            "series_paths": [str(path) for path in series_table_paths(data_path, series, columns)] if split_series else None,
+            "series": len(series),
+            "points": sum(x.size for _, x, _ in series),
+            "bytes_saved": preprocessed.bytes_saved if preprocessed else None,
+            "cached": cached,
+            "local": local is not None and local.confidence >= local_min_confidence,
+            "local_confidence": local.confidence if local else None,
+        }
+
+    results = await asyncio.gather(*(extract(plot_path) for plot_path in plot_paths))
+
+    n_failed = sum(1 for r in results if r["status"] == "failed")
+    n_cached = sum(1 for r in results if r.get("cached"))
+    n_local = sum(1 for r in results if r.get("local"))
+    lines = [
+        f"Processed {len(results)} images: {len(results) - n_failed} extracted "
+        f"({n_cached} from saved extractions, {n_local} digitized locally), {n_failed} failed",
+        "",
+        "| Image | Series | Points | Data file |",
+        "|---|---|---|---|",
+    ]
+    for r in results:
+        name = Path(r["plot_path"]).name
+        if r["status"] == "failed":
+            lines.append(f"| {name} | - | - | FAILED: {r['error']} |")
+        else:
+            lines.append(f"| {name} | {r['series']} | {r['points']} | {r['data_path']} |")
+
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(lines))],
+        structured_content={"results": results},
+    )
+
+
+async def request_plot_split(plot_path: Path) -> list[bytes]:
+    """Split a multi-panel figure and return the decoded PNG bytes of every panel."""
+    mime_type = validate_plot_image(plot_path)
+
+    files = {"plot_img": (plot_path.name, plot_path, mime_type)}
+    params = {"get_img_coords": True, "v2": True}
+
+    try:
+        response = await AxiomaticAPIClient().post("/document/plot/split", files=files, params=params)
+    except Exception as e:
+        raise ToolError(f"Failed to split plot image: {e!s}") from e
+
+    if not isinstance(response, (list, tuple)) or not all(isinstance(x, str) for x in response):
+        raise ToolError("Upstream service returned unexpected response format; expected a list of base64-encoded image strings")
+    if not response:
+        raise ToolError("Upstream service returned no split images")
+
+    panels = []
+    for idx, b64_split_img in enumerate(response):
+        match = re.match(r"data:image/[^;]+;base64,(.*)", b64_split_img)
+        image_data = match.group(1) if match else b64_split_img
+
+        try:
+            panels.append(base64.b64decode(image_data, validate=True))
+        except Exception as e:
+            raise ToolError(f"Invalid base64 image payload at index {idx}: {e!s}") from e
+
+    return panels
+
+
 @plots.tool(
     name="split_multi_plot",
     description="Given an image of a plot with multiple subplots, splits it into the individual subplots",
@@ -222,54 +704,206 @@ async def extract_data_from_plot_image(
 async def split_multi_plot(
     plot_path: Annotated[Path, "The absolute path to the image file of the plot to split. Supports only PNG for now"],
 ) -> Annotated[ToolResult, "Paths to the saved split images"]:
-    if not plot_path.is_file():
-        raise FileNotFoundError(f"Image not found or is not a regular file: {plot_path}")
+    panels = await request_plot_split(plot_path)
 
-    supported_extensions = {".png"}
-    file_extension = plot_path.suffix.lower()
-    if file_extension not in supported_extensions:
-        raise ValueError(f"Unsupported image format: {file_extension}. Supported formats: {', '.join(supported_extensions)}")
+    split_image_paths = [plot_path.parent / (plot_path.stem + f"_split_{idx}.png") for idx in range(len(panels))]
+    await asyncio.gather(*(asyncio.to_thread(path.write_bytes, binary) for path, binary in zip(split_image_paths, panels, strict=True)))
 
-    mime_type, _ = mimetypes.guess_type(str(plot_path))
-    if not mime_type or not mime_type.startswith("image/"):
-        mime_type = "application/octet-stream"
+    return ToolResult(
+        content=[
+            TextContent(
+                type="text",
+                text=(f"Split into {len(split_image_paths)} images:\n" + "\n".join(f"- {p}" for p in split_image_paths)),
+            ),
+        ],
+    )
 
-    with Path.open(plot_path, "rb") as f:
-        files = {"plot_img": (plot_path.name, f, mime_type)}
-        params = {"get_img_coords": True, "v2": True}
 
+@plots.tool(
+    name="split_and_extract_multi_plot",
+    description=(
+        "Given an image of a figure with multiple subplots, splits it into the individual subplots and extracts the numerical "
+        "series of every subplot in parallel, in one call. Each panel's data is saved to <stem>_split_<idx>_data.<output_format>."
+    ),
+    tags={"plot", "filesystem", "analyze"},
+)
+async def split_and_extract_multi_plot(
+    plot_path: Annotated[Path, "The absolute path to the image file of the figure to split. Supports only PNG for now"],
+    max_number_points_per_series: Annotated[
+        int,
+        "Maximum points returned per series. Uses the downsampling method if plot contains more points than limit",
+    ] = 100,
+    downsampling: Annotated[
+        str,
+        "How series are reduced to the point limit: 'lttb' (default, keeps the visual shape), 'minmax' (keeps every peak and dip), "
+        "'uniform' (evenly spaced in x) or 'random' (seeded). Points are always returned sorted by x",
+    ] = DEFAULT_DOWNSAMPLING,
+    max_concurrency: Annotated[int, "Maximum number of panels extracted at the same time"] = 4,
+    save_panel_images: Annotated[bool, "Also save each panel as <stem>_split_<idx>.png, like split_multi_plot"] = False,
+    use_cache: Annotated[bool, "Reuse the full extraction of a panel saved in <stem>_split_<idx>_raw.npz instead of uploading it again"] = True,
+    output_format: Annotated[
+        str,
+        "Format of the data file: 'json' (default, series with lists of points), or one row per point (series_unique_id, x_value, y_value) "
+        "as 'csv', 'parquet' or 'npz'",
+    ] = DEFAULT_OUTPUT_FORMAT,
+    x_column: Annotated[str, "Name of the x column of table data files (csv, parquet, npz)"] = DEFAULT_X_COLUMN,
+    y_column: Annotated[str, "Name of the y column of table data files"] = DEFAULT_Y_COLUMN,
+    series_names: Annotated[
+        list[str] | None,
+        "Names of the series in the order they are returned for every panel, written to a series_name column of table data files",
+    ] = None,
+    split_series: Annotated[
+        bool,
+        "Also write every series to <stem>_data_<series name>.<output_format> with only its x and y columns (the y column named after "
+        "the series if named), which the model fitter tools read directly as data_file",
+    ] = False,
+    response_mode: Annotated[
+        str,
+        "'full' (default) returns the points, 'summary' only returns the data file path and per-series statistics (points, x and y ranges)",
+    ] = DEFAULT_RESPONSE_MODE,
+) -> Annotated[ToolResult, "Extracted series of every panel"]:
+    check_downsampling_method(downsampling)
+    check_max_points(max_number_points_per_series)
+    check_output_format(output_format)
+    columns = TableColumns(x_column, y_column, series_names)
+    check_response_mode(response_mode)
+
+    panels = await request_plot_split(plot_path)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    panel_texts: dict[int, str] = {}
+
+    async def extract_panel(idx: int, binary: bytes) -> dict:
+        panel_stem = plot_path.stem + f"_split_{idx}"
         try:
-            response = AxiomaticAPIClient().post("/document/plot/split", files=files, params=params)
+            if save_panel_images:
+                await asyncio.to_thread((plot_path.parent / f"{panel_stem}.png").write_bytes, binary)
+
+            panel_hash = sha256_bytes(binary)
+            raw_path = raw_extraction_path(plot_path.parent / f"{panel_stem}.png")
+            extraction = await asyncio.to_thread(load_raw_extraction, raw_path, panel_hash) if use_cache else None
+            cached = extraction is not None
+            if extraction is None:
+                # Panels are uploaded straight from memory, they are never re-read from disk
+                async with semaphore:
+                    extraction = await request_raw_extraction(f"{panel_stem}.png", binary, "image/png", panel_hash)
+                await store_raw_extraction(raw_path, extraction)
+
+            series = sample_raw_extraction(extraction, max_points=max_number_points_per_series, downsampling=downsampling)
+            data_path = series_data_path(plot_path.parent, panel_stem, output_format)
+            panel_texts[idx] = await save_series(data_path, series, output_format, response_mode, columns, split_series)
         except Exception as e:
-            raise ToolError(f"Failed to split plot image: {e!s}") from e
+            return {"panel": idx, "status": "failed", "error": str(e)}
 
-        if not isinstance(response, (list, tuple)) or not all(isinstance(x, str) for x in response):
-            raise ToolError("Upstream service returned unexpected response format; expected a list of base64-encoded image strings")
-        if not response:
-            raise ToolError("Upstream service returned no split images")
+        result = {"panel": idx, "status": "extracted", "data_path": str(data_path), "cached": cached}
+        if response_mode == "summary":
+            return {**result, "summary": summarize_series(series)}
+        return {**result, **series_points_data(series).model_dump()}
 
-    split_image_paths = []
+    results = await asyncio.gather(*(extract_panel(idx, binary) for idx, binary in enumerate(panels)))
 
-    for idx, b64_split_img in enumerate(response):
-        split_image_path = plot_path.parent / (plot_path.stem + f"_split_{idx}.png")
+    n_failed = sum(1 for r in results if r["status"] == "failed")
+    lines = [f"Split {plot_path.name} into {len(panels)} panels: {len(panels) - n_failed} extracted, {n_failed} failed"]
+    for r in results:
+        if r["status"] == "failed":
+            lines.append(f"\n## Panel {r['panel']}\n\nFAILED: {r['error']}")
+        else:
+            lines.append(f"\n## Panel {r['panel']}\n\nSaved to: {r['data_path']}\n\n{panel_texts[r['panel']]}")
 
-        match = re.match(r"data:image/[^;]+;base64,(.*)", b64_split_img)
-        image_data = match.group(1) if match else b64_split_img
+    return ToolResult(
+        content=[TextContent(type="text", text="\n".join(lines))],
+        structured_content={"panels": results},
+    )
 
-        try:
-            binary = base64.b64decode(image_data, validate=True)
-        except Exception as e:
-            raise ToolError(f"Invalid base64 image payload at index {idx}: {e!s}") from e
 
-        split_image_path.write_bytes(binary)
+@plots.tool(
+    name="resample_extracted_series",
+    description=(
+        "Re-samples, crops to an x-range or exports series of a plot already digitized by extract_numerical_series, "
+        "extract_numerical_series_batch or split_and_extract_multi_plot, from the full-resolution extraction saved in "
+        "<stem>_raw.npz next to the image. Runs locally in milliseconds, nothing is uploaded. "
+        "Use it instead of extracting again to change the number of points, the downsampling or the x-range."
+    ),
+    tags={"plot", "filesystem"},
+)
+async def resample_extracted_series(
+    plot_path: Annotated[Path, "The absolute path of the digitized plot image, or of its <stem>_raw.npz file"],
+    max_number_points_per_series: Annotated[
+        int | None,
+        "Maximum points returned per series, reduced with the downsampling method. None returns every extracted point",
+    ] = 100,
+    downsampling: Annotated[
+        str,
+        "How series are reduced to the point limit: 'lttb' (default, keeps the visual shape), 'minmax' (keeps every peak and dip), "
+        "'uniform' (evenly spaced in x) or 'random' (seeded). Points are always returned sorted by x",
+    ] = DEFAULT_DOWNSAMPLING,
+    x_min: Annotated[float | None, "Only keep points with x >= x_min"] = None,
+    x_max: Annotated[float | None, "Only keep points with x <= x_max"] = None,
+    series_ids: Annotated[list[int] | None, "Only keep the series with these series_unique_id values. All series if None"] = None,
+    output_path: Annotated[Path | None, "Where to write the data file. Defaults to <stem>_data.<output_format> next to the image"] = None,
+    output_format: Annotated[
+        str,
+        "Format of the data file: 'json' (default, series with lists of points), or one row per point (series_unique_id, x_value, y_value) "
+        "as 'csv', 'parquet' or 'npz'",
+    ] = DEFAULT_OUTPUT_FORMAT,
+    x_column: Annotated[str, "Name of the x column of table data files (csv, parquet, npz)"] = DEFAULT_X_COLUMN,
+    y_column: Annotated[str, "Name of the y column of table data files"] = DEFAULT_Y_COLUMN,
+    series_names: Annotated[
+        list[str] | None,
+        "Names of the series in the order they are returned, written to a series_name column of table data files",
+    ] = None,
+    split_series: Annotated[
+        bool,
+        "Also write every series to <stem>_data_<series name>.<output_format> with only its x and y columns (the y column named after "
+        "the series if named), which the model fitter tools read directly as data_file",
+    ] = False,
+    response_mode: Annotated[
+        str,
+        "'full' (default) returns the points, 'summary' only returns the data file path and per-series statistics (points, x and y ranges)",
+    ] = DEFAULT_RESPONSE_MODE,
+) -> Annotated[ToolResult, "Re-sampled plot data containing series and points"]:
+    check_downsampling_method(downsampling)
+    check_max_points(max_number_points_per_series)
+    check_output_format(output_format)
+    columns = TableColumns(x_column, y_column, series_names)
+    check_response_mode(response_mode)
+    if x_min is not None and x_max is not None and x_min > x_max:
+        raise ToolError(f"x_min ({x_min}) must not be greater than x_max ({x_max})")
+
+    if plot_path.suffix.lower() == ".npz":
+        raw_path, image_hash = plot_path, None
+    else:
+        raw_path = raw_extraction_path(plot_path)
+        # Panels of split figures are only saved on request, without the image there is nothing to compare with
+        image_hash = await asyncio.to_thread(sha256_file, plot_path) if plot_path.is_file() else None
+
+    if not raw_path.is_file():
+        raise ToolError(f"No saved extraction found at {raw_path}. Run extract_numerical_series on the image first")
+
+    extraction = await asyncio.to_thread(load_raw_extraction, raw_path, image_hash)
+    if extraction is None:
+        raise ToolError(f"The saved extraction {raw_path} is unreadable or the image changed since. Run extract_numerical_series again")
+
+    series = await asyncio.to_thread(
+        sample_raw_extraction,
+        extraction,
+        max_points=max_number_points_per_series,
+        downsampling=downsampling,
+        x_min=x_min,
+        x_max=x_max,
+        series_ids=series_ids,
+    )
+    if not series:
+        raise ToolError("No points match the requested series and x-range")
 
-        split_image_paths.append(split_image_path)
+    data_path = output_path or series_data_path(raw_path.parent, plot_stem_of(raw_path), output_format)
+    series_text = await save_series(data_path, series, output_format, response_mode, columns, split_series)
 
+    n_points = sum(x.size for _, x, _ in series)
     return ToolResult(
         content=[
             TextContent(
                 type="text",
-                text=(f"Split into {len(split_image_paths)} images:\n" + "\n".join(f"- {p}" for p in split_image_paths)),
-            ),
+                text=f"Re-sampled {n_points} of {extraction.n_points} extracted points, saved to: {data_path}\n\n{series_text}",
+            )
         ],
     )
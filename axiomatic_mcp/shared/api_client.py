@@ -1,5 +1,10 @@
+import asyncio
 import os
-from typing import Any
+import re
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import Any, BinaryIO
 
 import httpx
 
@@ -8,25 +13,182 @@ DEFAULT_API_URL = "https://api.axiomatic-ai.com"
 
 TIMEOUT = 1000
 
+# Connection pool limits, shared by every tool of every server in the process
+MAX_CONNECTIONS = int(os.getenv("AXIOMATIC_HTTP_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("AXIOMATIC_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("AXIOMATIC_HTTP_KEEPALIVE_EXPIRY", "60"))
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def iter_file_chunks(file: Path | BinaryIO, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a file in chunks from a worker thread, so neither memory nor the event loop is held up."""
+    handle = await asyncio.to_thread(Path.open, file, "rb") if isinstance(file, Path) else file
+    try:
+        while chunk := await asyncio.to_thread(handle.read, chunk_size):
+            yield chunk
+    finally:
+        if isinstance(file, Path):
+            await asyncio.to_thread(handle.close)
+
+
+def _is_streamable(content: Any) -> bool:
+    return isinstance(content, Path | AsyncIterable) or hasattr(content, "read")
+
+
+def _content_length(content: Any) -> int | None:
+    """Size in bytes of a part's content, or None if unknown. Stats files, so call it from a worker thread."""
+    if isinstance(content, bytes):
+        return len(content)
+    if isinstance(content, str):
+        return len(content.encode("utf-8"))
+    if isinstance(content, Path):
+        return content.stat().st_size
+    if hasattr(content, "fileno"):
+        try:
+            return os.fstat(content.fileno()).st_size - content.tell()
+        except (OSError, ValueError):
+            return None
+    return None
+
+
+def _form_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value)
+
+
+# HTML5 form encoding of names and filenames, as httpx does for buffered multipart bodies
+_FORM_PARAM_REPLACEMENTS = {'"': "%22", "\\": "\\\\"} | {chr(c): f"%{c:02X}" for c in range(0x20) if c != 0x1B}
+_FORM_PARAM_RE = re.compile("|".join(re.escape(c) for c in _FORM_PARAM_REPLACEMENTS))
+
+
+def _quote_form_param(value: str) -> str:
+    return _FORM_PARAM_RE.sub(lambda match: _FORM_PARAM_REPLACEMENTS[match.group(0)], value)
+
+
+async def encode_streaming_multipart(
+    data: dict[str, Any] | None,
+    files: dict[str, Any],
+) -> tuple[dict[str, str], AsyncIterator[bytes]]:
+    """Encode a multipart/form-data body whose file parts are streamed instead of buffered.
+
+    File values are `(filename, content, content_type)` tuples where content may be bytes,
+    a `Path`, an open binary file, or an async iterable of bytes.
+
+    Returns:
+        The request headers and an async iterator over the encoded body. Content-Length is
+        set whenever every part has a known size, otherwise the body is sent chunked.
+    """
+    boundary = uuid.uuid4().hex
+    parts: list[tuple[bytes, Any]] = []
+
+    for name, value in (data or {}).items():
+        header = f'--{boundary}\r\nContent-Disposition: form-data; name="{_quote_form_param(name)}"\r\n\r\n'.encode()
+        parts.append((header, _form_value(value).encode("utf-8")))
+
+    for name, (filename, content, content_type) in files.items():
+        header = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote_form_param(name)}"; filename="{_quote_form_param(filename)}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+        ).encode()
+        parts.append((header, content))
+
+    closing = f"--{boundary}--\r\n".encode()
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    lengths = await asyncio.to_thread(lambda: [_content_length(content) for _, content in parts])
+    if all(length is not None for length in lengths):
+        total = sum(len(header) + length + 2 for (header, _), length in zip(parts, lengths, strict=True)) + len(closing)
+        headers["Content-Length"] = str(total)
+
+    async def body() -> AsyncIterator[bytes]:
+        for header, content in parts:
+            yield header
+            if isinstance(content, bytes):
+                yield content
+            elif isinstance(content, str):
+                yield content.encode("utf-8")
+            elif isinstance(content, AsyncIterable):
+                async for chunk in content:
+                    yield chunk
+            else:
+                async for chunk in iter_file_chunks(content):
+                    yield chunk
+            yield b"\r\n"
+        yield closing
+
+    return headers, body()
+
 
 class AxiomaticAPIClient:
+    """Async client for the Axiomatic API.
+
+    Instances are cheap: all of them share one lazily created ``httpx.AsyncClient`` so
+    that TCP/TLS connections stay warm for the lifetime of the server process.
+    """
+
+    _shared_client: httpx.AsyncClient | None = None
+    _shared_loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(self):
         # Get API URL
-        api_url = os.getenv("AXIOMATIC_API_URL", DEFAULT_API_URL)
+        self.api_url = os.getenv("AXIOMATIC_API_URL", DEFAULT_API_URL)
 
         # Get API Key
-        api_key = os.getenv("AXIOMATIC_API_KEY")
-        if not api_key:
+        self.api_key = os.getenv("AXIOMATIC_API_KEY")
+        if not self.api_key:
             raise ValueError("AXIOMATIC_API_KEY environment variable is not set")
 
-        self.client = httpx.Client(
-            base_url=api_url,
-            timeout=TIMEOUT,
-            headers={
-                "X-API-Key": api_key,
-                "X-origin": "mcp-client",
-            },
-        )
+    @property
+    def client(self) -> httpx.AsyncClient:
+        cls = type(self)
+        loop = asyncio.get_running_loop()
+
+        # An AsyncClient is bound to the event loop it was first used on
+        if cls._shared_client is None or cls._shared_client.is_closed or cls._shared_loop is not loop:
+            if cls._shared_client is not None and not cls._shared_client.is_closed:
+                cls._close_on_own_loop(cls._shared_client, cls._shared_loop)
+            cls._shared_client = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=TIMEOUT,
+                headers={
+                    "X-API-Key": self.api_key,
+                    "X-origin": "mcp-client",
+                },
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+            cls._shared_loop = loop
+
+        return cls._shared_client
+
+    @staticmethod
+    def _close_on_own_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Schedule closing a client bound to another event loop on that loop.
+
+        A client whose loop has already stopped cannot be closed anymore: its
+        connections are released when the loop's transports are collected.
+        """
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared connection pool. A new one is created on the next request."""
+        client, loop = cls._shared_client, cls._shared_loop
+        cls._shared_client = None
+        cls._shared_loop = None
+        if client is None or client.is_closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            cls._close_on_own_loop(client, loop)
 
     def _handle_raise_for_status(self, response: httpx.Response) -> None:
         try:
@@ -38,34 +200,37 @@ class AxiomaticAPIClient:
             except Exception:
                 raise
 
-    def get(
+    async def get(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        response = self.client.get(endpoint, params=params)
+        response = await self.client.get(endpoint, params=params)
         self._handle_raise_for_status(response)
         return response.json()
 
-    def post(
+    async def post(
         self,
         endpoint: str,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        if files:
+        """POST JSON `data`, or a multipart form when `files` is given.
+
+        File values are `(filename, content, content_type)` tuples. Content given as a `Path`,
+        an open binary file or an async iterable of bytes is streamed instead of buffered.
+        """
+        if files and any(_is_streamable(file[1]) for file in files.values()):
+            # Paths, file handles and async iterators are streamed from disk in chunks
+            headers, body = await encode_streaming_multipart(data, files)
+            response = await self.client.post(endpoint, content=body, headers=headers, params=params)
+        elif files:
             # When uploading files, use multipart/form-data
-            response = self.client.post(endpoint, files=files, data=data, params=params)
+            response = await self.client.post(endpoint, files=files, data=data, params=params)
         else:
             # For JSON data, use application/json
-            response = self.client.post(endpoint, json=data, params=params)
+            response = await self.client.post(endpoint, json=data, params=params)
 
         self._handle_raise_for_status(response)
         return response.json()
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.client.close()
@@ -0,0 +1,326 @@
+"""Persistent full-text index of the equations, headings and figure captions of parsed documents.
+
+Every parse feeds the index (see `pdf_to_markdown`), keyed by the SHA-256 of the PDF, so a
+corpus can be searched locally without re-parsing or re-uploading anything. Equations are
+indexed twice: as LaTeX normalized to plain tokens (``n_{\\mathrm{eff}}`` becomes ``n eff``)
+and through the text around them (section heading and preceding paragraph), so a search can
+combine symbols with words such as "dispersion relation".
+
+Methods are blocking; call them through ``asyncio.to_thread`` from async code.
+"""
+
+import bisect
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..utils.disk_cache import get_cache_dir
+
+MAX_CONTEXT_CHARS = 400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_hash TEXT PRIMARY KEY,
+    pdf_path TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    doc_hash TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    text TEXT NOT NULL,
+    section TEXT,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_doc_hash ON entries (doc_hash);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(symbols, context, tokenize = 'porter unicode61');
+"""
+
+ENTRY_KINDS = ("equation", "inline_equation", "heading", "caption")
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_CAPTION_RE = re.compile(r"^\s*(?:\*\*|_)?((?:fig(?:ure)?|table)\.?\s*\d+[a-z]?\b.*)$", re.IGNORECASE)
+_IMAGE_ALT_RE = re.compile(r"!\[([^\]]+)\]\([^)]*\)")
+
+# Commands that only change how a symbol looks, their argument is kept
+_STYLE_COMMAND_RE = re.compile(r"\\(?:math[a-z]+|text[a-z]*|operatorname|boldsymbol|bm|rm|bf|it|cal)\b")
+# Commands that carry no meaning for search
+_LAYOUT_COMMAND_RE = re.compile(r"\\(?:left|right|[bB]igg?[lr]?|displaystyle|quad|qquad|label\{[^}]*\}|[,;:!])")
+_LATEX_TOKEN_RE = re.compile(r"\\([a-zA-Z]+)|([a-zA-Z]+|\d+)")
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+
+_QUERY_STOPWORDS = frozenset(
+    [
+        "a",
+        "all",
+        "an",
+        "and",
+        "any",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "involving",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "their",
+        "this",
+        "to",
+        "with",
+    ]
+)
+
+
+def get_index_path() -> Path:
+    return Path(os.getenv("AXIOMATIC_INDEX_PATH", get_cache_dir() / "equation_index.sqlite3")).expanduser()
+
+
+def normalize_latex(latex: str) -> str:
+    """Reduce LaTeX to space separated symbol tokens, e.g. ``n_{\\mathrm{eff}}(\\omega)`` -> ``n eff omega``."""
+    latex = _LAYOUT_COMMAND_RE.sub(" ", _STYLE_COMMAND_RE.sub(" ", latex))
+    return " ".join(command or word for command, word in _LATEX_TOKEN_RE.findall(latex))
+
+
+def _fts_phrase(tokens: list[str]) -> str:
+    return '"' + " ".join(token.replace('"', "") for token in tokens) + '"'
+
+
+def build_match_expression(query: str | None = None, symbols: str | None = None) -> str | None:
+    """FTS5 expression: all `symbols` as a phrase in the equation, any `query` word in the text around it."""
+    clauses = []
+    if symbols:
+        symbol_tokens = normalize_latex(symbols).split()
+        if symbol_tokens:
+            clauses.append(f"symbols : {_fts_phrase(symbol_tokens)}")
+    if query:
+        words = [word for word in _QUERY_TOKEN_RE.findall(query.lower()) if word not in _QUERY_STOPWORDS]
+        if words:
+            clauses.append("context : (" + " OR ".join(_fts_phrase([word]) for word in words) + ")")
+    return " AND ".join(clauses) or None
+
+
+@dataclass
+class IndexEntry:
+    kind: str
+    text: str
+    section: str | None
+    line: int | None
+    symbols: str
+    context: str
+
+
+class _MarkdownLocator:
+    """Maps character offsets of a markdown document to line numbers, sections and surrounding text."""
+
+    def __init__(self, markdown: str):
+        self.markdown = markdown
+        self.line_starts = [0] + [m.end() for m in re.finditer("\n", markdown)]
+        self.headings: list[tuple[int, str]] = []
+        for line_idx, line in enumerate(markdown.splitlines()):
+            match = _HEADING_RE.match(line)
+            if match:
+                self.headings.append((line_idx + 1, match.group(2)))
+        self._heading_lines = [line for line, _ in self.headings]
+
+    def line_of(self, offset: int) -> int:
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def section_of(self, line: int) -> str | None:
+        idx = bisect.bisect_right(self._heading_lines, line) - 1
+        return self.headings[idx][1] if idx >= 0 else None
+
+    def text_before(self, offset: int) -> str:
+        start = self.markdown.rfind("\n\n", 0, max(0, offset - 1))
+        paragraph = self.markdown[max(0, start, offset - MAX_CONTEXT_CHARS) : offset]
+        return " ".join(paragraph.split())
+
+
+def extract_index_entries(markdown: str, interline_equations: list[str], inline_equations: list[str]) -> list[IndexEntry]:
+    """Locate the parser's equations in the markdown and collect headings and figure captions."""
+    locator = _MarkdownLocator(markdown)
+    entries = []
+
+    for kind, equations in (("equation", interline_equations), ("inline_equation", inline_equations)):
+        search_from = 0
+        for latex in dict.fromkeys(eq.strip() for eq in equations):
+            if not latex:
+                continue
+            # Equations come in document order, searching onward keeps repeated ones apart.
+            # Inline equations are looked up with their delimiters first so that a symbol is
+            # not located inside a display equation that happens to contain it.
+            offset = -1
+            if kind == "inline_equation":
+                offset = markdown.find(f"${latex}$", search_from)
+                offset = offset + 1 if offset >= 0 else -1
+            if offset < 0:
+                offset = markdown.find(latex, search_from)
+            if offset < 0:
+                offset = markdown.find(latex)
+            line = section = None
+            context = ""
+            if offset >= 0:
+                search_from = offset + len(latex)
+                line = locator.line_of(offset)
+                section = locator.section_of(line)
+                context = locator.text_before(offset)
+            entries.append(IndexEntry(kind, latex, section, line, normalize_latex(latex), f"{section or ''} {context}".strip()))
+
+    for line, heading in locator.headings:
+        entries.append(IndexEntry("heading", heading, heading, line, "", heading))
+
+    for line_idx, line_text in enumerate(markdown.splitlines()):
+        # Single-word alt texts are image names or placeholders such as "image", not captions
+        captions = [m.group(1) for m in _IMAGE_ALT_RE.finditer(line_text) if len(m.group(1).split()) > 1]
+        caption_match = _CAPTION_RE.match(line_text)
+        if caption_match:
+            captions.append(caption_match.group(1).strip("*_ "))
+        for caption in captions:
+            section = locator.section_of(line_idx + 1)
+            entries.append(IndexEntry("caption", caption, section, line_idx + 1, "", caption))
+
+    return entries
+
+
+class EquationIndex:
+    """SQLite index of parsed documents with an FTS5 table over their entries."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_index_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def has_document(self, doc_hash: str) -> bool:
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT 1 FROM documents WHERE doc_hash = ?", (doc_hash,)).fetchone() is not None
+        finally:
+            connection.close()
+
+    def add_document(
+        self,
+        doc_hash: str,
+        pdf_path: Path,
+        markdown: str,
+        interline_equations: list[str],
+        inline_equations: list[str],
+    ) -> int:
+        """Index a parsed document, replacing any previous entries of the same content.
+
+        Returns:
+            The number of indexed entries.
+        """
+        entries = extract_index_entries(markdown, interline_equations, inline_equations)
+
+        connection = self._connect()
+        try:
+            with connection:
+                self._delete(connection, doc_hash)
+                connection.execute(
+                    "INSERT INTO documents (doc_hash, pdf_path, indexed_at) VALUES (?, ?, ?)",
+                    (doc_hash, str(pdf_path), time.time()),
+                )
+                for entry in entries:
+                    cursor = connection.execute(
+                        "INSERT INTO entries (doc_hash, kind, text, section, line) VALUES (?, ?, ?, ?, ?)",
+                        (doc_hash, entry.kind, entry.text, entry.section, entry.line),
+                    )
+                    connection.execute(
+                        "INSERT INTO entries_fts (rowid, symbols, context) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, entry.symbols, entry.context),
+                    )
+        finally:
+            connection.close()
+
+        return len(entries)
+
+    def update_path(self, doc_hash: str, pdf_path: Path) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("UPDATE documents SET pdf_path = ? WHERE doc_hash = ?", (str(pdf_path), doc_hash))
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, doc_hash: str) -> None:
+        connection.execute("DELETE FROM entries_fts WHERE rowid IN (SELECT id FROM entries WHERE doc_hash = ?)", (doc_hash,))
+        connection.execute("DELETE FROM entries WHERE doc_hash = ?", (doc_hash,))
+        connection.execute("DELETE FROM documents WHERE doc_hash = ?", (doc_hash,))
+
+    def search(
+        self,
+        query: str | None = None,
+        symbols: str | None = None,
+        kinds: list[str] | None = None,
+        document: str | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Search the index, best matches first.
+
+        Args:
+            query: Words to look for in headings, captions and the text around equations.
+            symbols: LaTeX or plain symbols that must all appear, in order, in the equation.
+            kinds: Restrict results to these entry kinds (see `ENTRY_KINDS`).
+            document: Restrict results to documents whose path contains this string.
+            limit: Maximum number of results.
+        """
+        match = build_match_expression(query, symbols)
+        if match is None:
+            raise ValueError("Provide a query or symbols to search for")
+
+        sql = """
+            SELECT e.kind, e.text, e.section, e.line, d.pdf_path, d.doc_hash
+            FROM entries_fts
+            JOIN entries e ON e.id = entries_fts.rowid
+            JOIN documents d ON d.doc_hash = e.doc_hash
+            WHERE entries_fts MATCH ?
+        """
+        params: list = [match]
+        if kinds:
+            sql += f" AND e.kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kinds)
+        if document:
+            # A substring match, with the wildcards of LIKE taken literally
+            escaped = document.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " AND d.pdf_path LIKE ? ESCAPE '\\'"
+            params.append(f"%{escaped}%")
+        sql += " ORDER BY bm25(entries_fts) LIMIT ?"
+        params.append(limit)
+
+        connection = self._connect()
+        try:
+            return [dict(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+
+    def stats(self) -> dict[str, int]:
+        connection = self._connect()
+        try:
+            counts = {"documents": connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]}
+            counts.update(dict(connection.execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind").fetchall()))
+            return counts
+        finally:
+            connection.close()
+
+
+equation_index = EquationIndex()
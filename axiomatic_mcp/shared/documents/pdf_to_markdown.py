@@ -1,9 +1,27 @@
 import asyncio
+import contextlib
+import io
+import os
+import re
+import sqlite3
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 from ...shared.api_client import AxiomaticAPIClient
+from ..utils.disk_cache import DiskCache, make_cache_key, sha256_file
+from .equation_index import equation_index
+
+PARSE_PARAMS = {"method": "mistral", "ocr": False, "layout_model": "doclayout_yolo"}
+
+PARSE_CACHE_MAX_BYTES = int(os.getenv("AXIOMATIC_PARSE_CACHE_MAX_MB", "1024")) * 1024 * 1024
+
+DEFAULT_CHUNK_CONCURRENCY = 4
+CHUNK_MAX_ATTEMPTS = 3
+CHUNK_RETRY_DELAY = float(os.getenv("AXIOMATIC_CHUNK_RETRY_DELAY", "1"))
+
+# Shared by every server that parses PDFs (documents, equations, ...)
+parse_cache = DiskCache("parse", max_bytes=PARSE_CACHE_MAX_BYTES)
 
 
 class ParseResponse(BaseModel):
@@ -16,22 +34,174 @@ class ParseResponse(BaseModel):
     )
 
 
-async def pdf_to_markdown(file_path: Path) -> ParseResponse:
-    if not file_path.exists():
-        raise FileNotFoundError(f"Document not found: {file_path}")
+def get_parse_cache_key(file_hash: str, pages_per_chunk: int | None = None) -> str:
+    return make_cache_key("parse", file_hash, PARSE_PARAMS, pages_per_chunk)
+
+
+def split_pdf(file_path: Path, pages_per_chunk: int) -> list[tuple[int, int, bytes]]:
+    """Split a PDF into standalone PDFs of at most `pages_per_chunk` pages.
+
+    Returns:
+        A list of (first_page, last_page, pdf_bytes) tuples in page order, pages are 1-based.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(file_path)
+    n_pages = len(reader.pages)
+
+    chunks = []
+    for start in range(0, n_pages, pages_per_chunk):
+        end = min(start + pages_per_chunk, n_pages)
+        writer = PdfWriter()
+        for page_idx in range(start, end):
+            writer.add_page(reader.pages[page_idx])
+
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        chunks.append((start + 1, end, buffer.getvalue()))
+
+    return chunks
+
+
+def chunk_retry_delay(attempt: int) -> float:
+    """Seconds to wait after the `attempt`-th failed request of a chunk, doubling every attempt."""
+    return CHUNK_RETRY_DELAY * 2 ** (attempt - 1)
+
+
+def replace_placeholders(text: str, replacements: dict[str, str]) -> str:
+    """Replace every key of `replacements` in `text` in a single pass, longest keys first."""
+    if not replacements:
+        return text
+
+    pattern = re.compile("|".join(re.escape(key) for key in sorted(replacements, key=len, reverse=True)))
+    return pattern.sub(lambda m: replacements[m.group(0)], text)
+
+
+def merge_parse_responses(responses: list[tuple[int, int, ParseResponse]]) -> ParseResponse:
+    """Stitch per-chunk parse results back together in page order.
+
+    Image names are prefixed with the chunk's page range so that names returned by
+    independent requests cannot collide, and the chunk's markdown is rewritten to match.
+    """
+    markdown_parts = []
+    images: dict[str, str] = {}
+    interline_equations: list[str] = []
+    inline_equations: list[str] = []
+
+    for first_page, last_page, response in sorted(responses, key=lambda item: item[0]):
+        renamed = {name: f"p{first_page:04d}-{last_page:04d}_{name}" for name in response.images}
+        markdown_parts.append(replace_placeholders(response.markdown, renamed))
+        images.update({renamed[name]: data for name, data in response.images.items()})
+        interline_equations.extend(response.interline_equations)
+        inline_equations.extend(response.inline_equations)
+
+    return ParseResponse(
+        markdown="\n\n".join(markdown_parts),
+        images=images,
+        interline_equations=interline_equations,
+        inline_equations=inline_equations,
+    )
 
-    if file_path.suffix.lower() != ".pdf":
-        raise ValueError("File must be a PDF")
 
-    file_content = await asyncio.to_thread(file_path.read_bytes)
-    files = {"file": (file_path.name, file_content, "application/pdf")}
-    params = {"method": "mistral", "ocr": False, "layout_model": "doclayout_yolo"}
+async def _parse_pdf_content(file_name: str, file_content: bytes | Path) -> ParseResponse:
+    files = {"file": (file_name, file_content, "application/pdf")}
 
-    response = await asyncio.to_thread(
-        AxiomaticAPIClient().post,
+    response = await AxiomaticAPIClient().post(
         "/document/parse",
         files=files,
-        params=params,
+        params=PARSE_PARAMS,
     )
 
     return ParseResponse(**response)
+
+
+async def _parse_pdf_chunked(file_path: Path, pages_per_chunk: int, max_concurrency: int) -> ParseResponse:
+    chunks = await asyncio.to_thread(split_pdf, file_path, pages_per_chunk)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def parse_chunk(first_page: int, last_page: int, content: bytes) -> tuple[int, int, ParseResponse]:
+        chunk_name = f"{file_path.stem}_p{first_page}-{last_page}.pdf"
+        # A failed chunk is retried on its own instead of re-parsing the whole document
+        for attempt in range(1, CHUNK_MAX_ATTEMPTS + 1):
+            try:
+                async with semaphore:
+                    return first_page, last_page, await _parse_pdf_content(chunk_name, content)
+            except Exception as e:
+                if attempt == CHUNK_MAX_ATTEMPTS:
+                    raise RuntimeError(f"Failed to parse pages {first_page}-{last_page}: {e!s}") from e
+            # Back off without holding a slot, so the other chunks go on meanwhile
+            await asyncio.sleep(chunk_retry_delay(attempt))
+
+    responses = await asyncio.gather(*(parse_chunk(*chunk) for chunk in chunks))
+    return merge_parse_responses(responses)
+
+
+async def _update_equation_index(file_hash: str, file_path: Path, parsed: ParseResponse, reindex: bool) -> None:
+    try:
+        if not reindex and await asyncio.to_thread(equation_index.has_document, file_hash):
+            await asyncio.to_thread(equation_index.update_path, file_hash, file_path.resolve())
+            return
+
+        await asyncio.to_thread(
+            equation_index.add_document,
+            file_hash,
+            file_path.resolve(),
+            parsed.markdown,
+            parsed.interline_equations,
+            parsed.inline_equations,
+        )
+    except (sqlite3.Error, OSError):
+        # Like the cache, the index is an optimization only and must not fail the parse
+        pass
+
+
+async def pdf_to_markdown(
+    file_path: Path,
+    use_cache: bool = True,
+    pages_per_chunk: int | None = None,
+    max_concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    use_index: bool = True,
+) -> ParseResponse:
+    """Parse a PDF into markdown.
+
+    When `pages_per_chunk` is set, the PDF is split locally into page ranges that are parsed
+    concurrently (at most `max_concurrency` requests in flight) and stitched back together.
+    With `use_index`, the equations, headings and figure captions of the result are added to
+    the local equation index.
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Document not found: {file_path}")
+
+    if file_path.suffix.lower() != ".pdf":
+        raise ValueError("File must be a PDF")
+
+    if pages_per_chunk is not None and pages_per_chunk < 1:
+        raise ValueError("pages_per_chunk must be a positive integer")
+
+    file_hash = await asyncio.to_thread(sha256_file, file_path) if use_cache or use_index else None
+
+    cache_key = None
+    if use_cache:
+        cache_key = get_parse_cache_key(file_hash, pages_per_chunk)
+        cached = await asyncio.to_thread(parse_cache.get, cache_key)
+        if cached is not None:
+            parsed = ParseResponse.model_validate_json(cached)
+            if use_index:
+                await _update_equation_index(file_hash, file_path, parsed, reindex=False)
+            return parsed
+
+    if pages_per_chunk is not None:
+        parsed = await _parse_pdf_chunked(file_path, pages_per_chunk, max(1, max_concurrency))
+    else:
+        # Passing the path streams the upload from disk instead of buffering the whole PDF
+        parsed = await _parse_pdf_content(file_path.name, file_path)
+
+    if cache_key is not None:
+        # The cache is an optimization only, an unwritable cache dir must not fail the parse
+        with contextlib.suppress(OSError):
+            await asyncio.to_thread(parse_cache.set, cache_key, parsed.model_dump_json().encode("utf-8"))
+
+    if use_index:
+        await _update_equation_index(file_hash, file_path, parsed, reindex=True)
+
+    return parsed
@@ -27,8 +27,7 @@ async def internal_feedback(
     }
 
     try:
-        client = AxiomaticAPIClient()
-        api_result = client.post(ApiRoutes.MCP_MODEL_FEEDBACK, data=payload)
+        api_result = await AxiomaticAPIClient().post(ApiRoutes.MCP_MODEL_FEEDBACK, data=payload)
     except Exception as e:
         return ToolResult(
             content=[TextContent(type="text", text=f"Failed to log feedback: {e}")],
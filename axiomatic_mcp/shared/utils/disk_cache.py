@@ -0,0 +1,88 @@
+import contextlib
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "axiomatic_mcp"
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_dir() -> Path:
+    """Root directory of all on-disk caches, overridable with AXIOMATIC_CACHE_DIR."""
+    return Path(os.getenv("AXIOMATIC_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+
+
+def sha256_file(path: Path) -> str:
+    """Hash a file in chunks so that large documents are never fully loaded in memory."""
+    digest = hashlib.sha256()
+    with Path.open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Size-bounded key/value store on disk with least-recently-used eviction.
+
+    Each entry is a single file named after its key. Reads refresh the file's mtime,
+    which is what eviction orders on, so no separate index has to be kept consistent.
+    Methods are blocking; call them through ``asyncio.to_thread`` from async code.
+    """
+
+    def __init__(self, namespace: str, max_bytes: int, suffix: str = ".json"):
+        self.directory = get_cache_dir() / namespace
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            value = path.read_bytes()
+        except OSError:
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so concurrent readers never see a partial entry
+        tmp_path = self.directory / f".{key}.{uuid.uuid4().hex}.tmp"
+        tmp_path.write_bytes(value)
+        Path.replace(tmp_path, self._path(key))
+
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,107 @@
+"""Optional client-side shrinking of PNG/JPEG images before they are uploaded.
+
+Images are downsampled so that their longest side is at most `max_dimension` pixels, EXIF
+orientation is applied and all metadata (EXIF, ICC text chunks, thumbnails) is dropped, then
+PNGs are recompressed losslessly and JPEGs at near-lossless quality. The format is kept, since
+the plot endpoints only accept PNG. Requires Pillow, which is an optional dependency.
+"""
+
+import asyncio
+import io
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_MAX_IMAGE_DIMENSION = int(os.getenv("AXIOMATIC_IMAGE_MAX_DIMENSION", "2048"))
+JPEG_QUALITY = 95
+
+PREPROCESSABLE_MIME_TYPES = {"image/png", "image/jpeg"}
+
+
+@dataclass
+class PreprocessedImage:
+    content: bytes | Path
+    original_bytes: int
+    final_bytes: int
+    original_size: tuple[int, int] | None = None
+    final_size: tuple[int, int] | None = None
+    note: str | None = None
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_bytes - self.final_bytes
+
+    def report(self) -> dict:
+        return {
+            "original_bytes": self.original_bytes,
+            "final_bytes": self.final_bytes,
+            "bytes_saved": self.bytes_saved,
+            "original_size": self.original_size,
+            "final_size": self.final_size,
+            "note": self.note,
+        }
+
+    def summary(self) -> str:
+        if self.note:
+            return f"Image preprocessing: {self.note}"
+        text = (
+            f"Image preprocessing: {_format_bytes(self.original_bytes)} -> {_format_bytes(self.final_bytes)} "
+            f"(saved {_format_bytes(self.bytes_saved)})"
+        )
+        if self.original_size != self.final_size:
+            text += f", resized {self.original_size[0]}x{self.original_size[1]} -> {self.final_size[0]}x{self.final_size[1]}"
+        return text
+
+
+def _format_bytes(n_bytes: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if abs(n_bytes) < 1024:
+            return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:.1f} GB"
+
+
+def preprocess_image(path: Path, max_dimension: int = DEFAULT_MAX_IMAGE_DIMENSION) -> PreprocessedImage:
+    """Shrink an image for upload.
+
+    Returns the original file untouched (as a `Path`) when Pillow is not installed or when the
+    re-encoded image would not be smaller.
+    """
+    original_bytes = path.stat().st_size
+
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return PreprocessedImage(path, original_bytes, original_bytes, note="skipped, Pillow is required. Install with: pip install Pillow")
+
+    with Image.open(path) as opened:
+        image_format = opened.format
+        original_size = opened.size
+        image = ImageOps.exif_transpose(opened)
+        image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        # Saving without exif/pnginfo/icc_profile arguments drops all metadata
+        if image_format == "JPEG":
+            image.convert("RGB").save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True, subsampling=0)
+        else:
+            image.save(buffer, format="PNG", optimize=True)
+        final_size = image.size
+
+    content = buffer.getvalue()
+    if len(content) >= original_bytes and final_size == original_size:
+        return PreprocessedImage(path, original_bytes, original_bytes, original_size, original_size)
+
+    return PreprocessedImage(content, original_bytes, len(content), original_size, final_size)
+
+
+async def prepare_image_upload(
+    path: Path,
+    mime_type: str | None,
+    enabled: bool,
+    max_dimension: int = DEFAULT_MAX_IMAGE_DIMENSION,
+) -> PreprocessedImage | None:
+    """Preprocess `path` in a worker thread if enabled and it is a PNG/JPEG, else return None."""
+    if not enabled or mime_type not in PREPROCESSABLE_MIME_TYPES:
+        return None
+    return await asyncio.to_thread(preprocess_image, path, max_dimension)
@@ -0,0 +1,93 @@
+"""Tests for the AxDocumentAnnotator MCP server."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastmcp.client import Client
+
+from axiomatic_mcp.servers.annotations import server
+from axiomatic_mcp.servers.annotations.server import (
+    AnnotationsResponse,
+    PDFAnnotation,
+    dump_annotations_response,
+    get_annotation_cache_key,
+    load_annotations_response,
+    mcp,
+    merge_chunk_annotations,
+)
+from axiomatic_mcp.shared.api_client import AxiomaticAPIClient
+
+
+@pytest_asyncio.fixture
+async def mcp_client():
+    async with Client(transport=mcp) as client:
+        yield client
+
+
+def _pdf_annotations(*items: dict) -> list:
+    return AnnotationsResponse.model_validate({"annotations": [{"reference": "Doe (2024)", **item} for item in items]}).annotations
+
+
+def test_merge_chunk_annotations_rebases_pages_and_deduplicates():
+    first_chunk = _pdf_annotations(
+        {"annotation_type": "parameter", "description": "Loss is 2 dB/cm", "parameter_name": "loss", "parameter_value": 2.0, "page_number": 3},
+    )
+    second_chunk = _pdf_annotations(
+        {"annotation_type": "parameter", "description": "loss is  2 dB/cm", "parameter_name": "loss", "parameter_value": 2.0, "page_number": 1},
+        {"annotation_type": "text", "description": "Operating wavelength", "page_number": 2},
+    )
+
+    merged = merge_chunk_annotations([(11, 20, second_chunk), (1, 10, first_chunk)])
+
+    assert all(isinstance(annotation, PDFAnnotation) for annotation in merged)
+    assert [(annotation.page_number, annotation.description) for annotation in merged] == [(3, "Loss is 2 dB/cm"), (12, "Operating wavelength")]
+
+
+def test_merge_chunk_annotations_keeps_repeated_annotations_within_a_chunk():
+    finding = {"annotation_type": "text", "description": "Operating wavelength"}
+    first_chunk = _pdf_annotations({**finding, "page_number": 2}, {**finding, "page_number": 5})
+    second_chunk = _pdf_annotations({**finding, "page_number": 1})
+
+    merged = merge_chunk_annotations([(1, 10, first_chunk), (11, 20, second_chunk)])
+
+    assert [annotation.page_number for annotation in merged] == [2, 5]
+
+
+def test_cached_response_round_trip_keeps_page_numbers():
+    response = AnnotationsResponse(annotations=_pdf_annotations({"annotation_type": "text", "description": "Operating wavelength", "page_number": 4}))
+
+    loaded = load_annotations_response(dump_annotations_response(response))
+
+    assert isinstance(loaded.annotations[0], PDFAnnotation)
+    assert loaded.annotations[0].page_number == 4
+
+
+def test_expired_cached_response_is_ignored():
+    response = AnnotationsResponse(annotations=[])
+
+    assert load_annotations_response(dump_annotations_response(response), ttl_seconds=-1) is None
+    assert load_annotations_response(b"not json") is None
+
+
+def test_cache_key_ignores_query_case_and_whitespace():
+    assert get_annotation_cache_key("hash", "application/pdf", "Extract  the\nparameters") == get_annotation_cache_key(
+        "hash", "application/pdf", "extract the parameters"
+    )
+    assert get_annotation_cache_key("hash", "application/pdf", "q") != get_annotation_cache_key("hash", "image/png", "q")
+
+
+@pytest.mark.asyncio
+async def test_file_queries_stream_the_file_from_disk(mcp_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    monkeypatch.setattr(server, "store_annotations", AsyncMock())
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("The loss is 2 dB/cm.")
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(return_value={"annotations": []})) as post:
+        await mcp_client.call_tool("annotate_file_queries", {"file_path": str(file_path), "queries": ["losses", "wavelengths"], "use_cache": False})
+
+    assert post.await_count == 2
+    uploads = [call.kwargs["files"]["file"] for call in post.await_args_list]
+    assert all(isinstance(content, Path) and content == file_path for _, content, _ in uploads)
@@ -0,0 +1,57 @@
+"""Tests for the local annotation store."""
+
+import pytest
+
+from axiomatic_mcp.servers.annotations.store import AnnotationStore, normalize_parameter_name
+
+
+def _parameter(name: str, value: float, unit: str, page: int, tags: list[str] | None = None) -> dict:
+    return {
+        "annotation_type": "parameter",
+        "description": f"{name} of the waveguide",
+        "parameter_name": name,
+        "parameter_value": value,
+        "parameter_unit": unit,
+        "page_number": page,
+        "reference": "Doe (2024)",
+        "tags": tags or [],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnnotationStore(tmp_path / "annotations.sqlite3")
+    store.add_annotations("a", tmp_path / "a.pdf", "application/pdf", "parameters", [_parameter("Propagation loss", 2.0, "dB/cm", 3, ["Loss"])])
+    store.add_annotations("b", tmp_path / "b.pdf", "application/pdf", "parameters", [_parameter("propagation_loss", 0.1, "dB/mm", 5)])
+    return store
+
+
+def test_normalize_parameter_name():
+    assert normalize_parameter_name("Propagation  loss (TE)") == "propagation_loss_te"
+
+
+def test_query_by_parameter_across_documents_in_si(store):
+    rows = store.query(parameter_name="propagation loss")
+
+    assert [(row["page_number"], row["si_value"], row["si_unit"]) for row in rows] == [(3, 200.0, "dB/m"), (5, 100.0, "dB/m")]
+
+
+def test_query_by_tag_and_page(store):
+    assert len(store.query(tag="loss")) == 1
+    assert store.query(page_number=5)[0]["parameter_value"] == 0.1
+
+
+def test_rerunning_a_query_replaces_its_annotations(store, tmp_path):
+    store.add_annotations("a", tmp_path / "a.pdf", "application/pdf", "parameters", [_parameter("Propagation loss", 3.0, "dB/cm", 4)])
+
+    assert [row["parameter_value"] for row in store.query(document="a.pdf")] == [3.0]
+    assert store.query(tag="loss") == []
+
+
+def test_query_matches_like_wildcards_literally(store, tmp_path):
+    store.add_annotations("c", tmp_path / "c_100%.pdf", "application/pdf", "parameters", [_parameter("Fill factor", 50.0, "%", 1)])
+
+    assert store.query(document="a_pdf") == []
+    assert [row["file_path"] for row in store.query(document="_100%")] == [str(tmp_path / "c_100%.pdf")]
+    assert store.query(text="%") == []
+    assert len(store.query(parameter_name="propagation_loss")) == 2
@@ -0,0 +1,33 @@
+"""Tests for the conversion of annotation parameter units to SI."""
+
+import numpy as np
+import pytest
+
+from axiomatic_mcp.servers.annotations.units import parse_unit, to_si
+
+
+@pytest.mark.parametrize(
+    ("unit", "factor", "si_unit"),
+    [
+        ("dB/cm", 100.0, "dB/m"),
+        ("µm", 1e-6, "m"),
+        ("GHz", 1e9, "Hz"),
+        ("ps/nm/km", 1e-6, "s/m^2"),
+        ("cm^-1", 100.0, "1/m"),
+        ("mA/cm2", 10.0, "A/m^2"),
+        ("Pa s", 1.0, "Pa·s"),
+    ],
+)
+def test_parse_unit(unit, factor, si_unit):
+    parsed_factor, offset, parsed_unit = parse_unit(unit)
+
+    assert parsed_factor == pytest.approx(factor)
+    assert offset == 0.0
+    assert parsed_unit == si_unit
+
+
+def test_to_si_converts_column_and_passes_unknown_units_through():
+    values, units = to_si([2.0, None, 25.0, 3.0, 4.0], ["dB/cm", "nm", "°C", None, "furlong"])
+
+    np.testing.assert_allclose(values, [200.0, np.nan, 298.15, 3.0, 4.0])
+    assert units == ["dB/m", "m", "K", None, "furlong"]
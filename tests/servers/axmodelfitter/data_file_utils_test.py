@@ -0,0 +1,88 @@
+"""Tests for loading data files of the AxModelFitter server."""
+
+import os
+
+import numpy as np
+import pytest
+
+from axiomatic_mcp.servers.axmodelfitter import data_file_utils
+from axiomatic_mcp.servers.axmodelfitter.data_file_utils import (
+    DataFileCache,
+    load_data_columns,
+    resolve_data_input,
+    resolve_output_data_only,
+)
+
+INPUT_DATA = [{"column": "t", "name": "t", "unit": "s"}]
+OUTPUT_DATA = {"columns": "y", "name": "y", "unit": "m"}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    data_file_utils.data_file_cache.clear()
+    yield
+    data_file_utils.data_file_cache.clear()
+
+
+@pytest.fixture
+def load_count(monkeypatch):
+    calls = []
+    load_data_file = data_file_utils.load_data_file
+
+    def counting_load_data_file(*args, **kwargs):
+        calls.append(args)
+        return load_data_file(*args, **kwargs)
+
+    monkeypatch.setattr(data_file_utils, "load_data_file", counting_load_data_file)
+    return calls
+
+
+def test_data_file_is_parsed_once_while_unchanged(tmp_path, load_count):
+    path = tmp_path / "data.csv"
+    path.write_text("t,y\n0,1.5\n1,2.5\n")
+
+    inputs, outputs = resolve_data_input(str(path), INPUT_DATA, OUTPUT_DATA)
+    assert resolve_output_data_only(str(path), OUTPUT_DATA) == [1.5, 2.5]
+    assert inputs == [{"name": "t", "unit": "s", "magnitudes": [0.0, 1.0]}]
+    assert outputs == {"name": "y", "unit": "m", "magnitudes": [1.5, 2.5]}
+    assert len(load_count) == 1
+
+    path.write_text("t,y\n0,3.5\n1,4.5\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1))
+    assert resolve_output_data_only(str(path), OUTPUT_DATA) == [3.5, 4.5]
+    assert len(load_count) == 2
+
+
+def test_cached_columns_are_read_only(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("t,y\n0,1.5\n1,2.5\n")
+
+    columns = load_data_columns(str(path))
+
+    assert list(columns) == ["t", "y"]
+    assert load_data_columns(str(path)) is columns
+    with pytest.raises(ValueError):
+        columns["y"][0] = 0.0
+
+
+def test_cache_evicts_least_recently_used_entries_by_size():
+    cache = DataFileCache(max_bytes=3 * 80)
+    for key in ("a", "b", "c"):
+        cache.set((key,), {"x": np.zeros(10)})
+
+    cache.get(("a",))
+    cache.set(("d",), {"x": np.zeros(10)})
+    cache.set(("too large",), {"x": np.zeros(31)})
+
+    assert [cache.get((key,)) is not None for key in ("a", "b", "c", "d", "too large")] == [True, False, True, True, False]
+    assert cache.nbytes == 3 * 80
+
+
+def test_cache_counts_the_strings_of_object_columns():
+    labels = np.array(["sample " * 20] * 10, dtype=object)
+    cache = DataFileCache(max_bytes=1000)
+
+    cache.set(("labels",), {"label": labels})
+
+    assert labels.nbytes == 80
+    assert cache.get(("labels",)) is None and cache.nbytes == 0
@@ -0,0 +1,124 @@
+"""Tests for the AxDocumentParser MCP server."""
+
+import base64
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastmcp.client import Client
+from pypdf import PdfWriter
+
+from axiomatic_mcp.servers.documents.server import is_markdown_current, mcp, resolve_pdf_paths, save_parse_response, write_base64_image
+from axiomatic_mcp.shared.api_client import AxiomaticAPIClient
+from axiomatic_mcp.shared.documents import pdf_to_markdown as pdf_module
+from axiomatic_mcp.shared.documents.equation_index import EquationIndex
+from axiomatic_mcp.shared.documents.pdf_to_markdown import ParseResponse, replace_placeholders
+from axiomatic_mcp.shared.utils.disk_cache import DiskCache
+
+
+@pytest_asyncio.fixture
+async def mcp_client():
+    async with Client(transport=mcp) as client:
+        yield client
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    """API key set, and the parse cache and equation index kept in `tmp_path`."""
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    monkeypatch.setenv("AXIOMATIC_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(pdf_module, "parse_cache", DiskCache("parse", max_bytes=1024 * 1024))
+    monkeypatch.setattr(pdf_module, "equation_index", EquationIndex(tmp_path / "cache" / "index.sqlite3"))
+
+
+def _write_pdf(path, n_pages: int = 1):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    writer = PdfWriter()
+    for _ in range(n_pages):
+        writer.add_blank_page(width=100, height=100)
+    with path.open("wb") as f:
+        writer.write(f)
+    return path
+
+
+def test_resolve_pdf_paths(tmp_path):
+    papers = tmp_path / "papers"
+    a, b, c = _write_pdf(papers / "a.pdf"), _write_pdf(papers / "b.PDF"), _write_pdf(papers / "sub" / "c.pdf")
+    (papers / "notes.txt").write_text("not a pdf")
+
+    assert resolve_pdf_paths(str(papers)) == [a, b]
+    assert resolve_pdf_paths(str(papers), recursive=True) == [a, b, c]
+    assert resolve_pdf_paths(str(papers / "**" / "*.pdf")) == [a, c]
+    assert resolve_pdf_paths(str(a)) == [a]
+    assert resolve_pdf_paths(str(tmp_path / "missing.pdf")) == []
+
+
+def test_is_markdown_current(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "paper.pdf")
+    markdown_path = tmp_path / "paper.md"
+    assert not is_markdown_current(pdf_path)
+
+    markdown_path.write_text("# Paper")
+    os.utime(markdown_path, (1, 1))
+    assert not is_markdown_current(pdf_path)
+
+    os.utime(pdf_path, (1, 1))
+    assert is_markdown_current(pdf_path)
+
+
+@pytest.mark.asyncio
+async def test_parse_pdfs_to_md_skips_current_files_and_reports_failures(mcp_client, tmp_path, api):
+    papers = tmp_path / "papers"
+    _write_pdf(papers / "converted.pdf", 1)
+    _write_pdf(papers / "failed.pdf", 2)
+    skipped = _write_pdf(papers / "skipped.pdf", 3)
+    (papers / "skipped.md").write_text("# Already converted")
+    os.utime(skipped, (1, 1))
+
+    async def post(endpoint, data=None, files=None, params=None):
+        if files["file"][0] == "failed.pdf":
+            raise RuntimeError("server error")
+        return {"markdown": "# Converted"}
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=post)) as mock_post:
+        response = await mcp_client.call_tool("parse_pdfs_to_md", {"path": str(papers)})
+
+    assert sorted(call.kwargs["files"]["file"][0] for call in mock_post.await_args_list) == ["converted.pdf", "failed.pdf"]
+    manifest = response.structured_content
+    assert [(r["pdf_path"], r["pages"]) for r in manifest["converted"]] == [(str(papers / "converted.pdf"), 1)]
+    assert [(r["pdf_path"], r["pages"]) for r in manifest["skipped"]] == [(str(skipped), 3)]
+    assert manifest["failed"] == [{"pdf_path": str(papers / "failed.pdf"), "error": "server error"}]
+    assert response.content[0].text.startswith("Processed 3 PDFs: 1 converted, 1 skipped, 1 failed")
+    assert (papers / "converted.md").read_text() == "# Converted"
+    assert (papers / "skipped.md").read_text() == "# Already converted"
+
+
+def test_write_base64_image_with_and_without_data_uri(tmp_path):
+    encoded = base64.b64encode(b"\x89PNG image").decode()
+
+    write_base64_image(tmp_path / "raw.png", encoded)
+    write_base64_image(tmp_path / "uri.png", f"data:image/png;base64,{encoded}")
+
+    assert (tmp_path / "raw.png").read_bytes() == (tmp_path / "uri.png").read_bytes() == b"\x89PNG image"
+
+
+def test_replace_placeholders_in_one_pass():
+    # Replacements are never replaced again, and longer names win over their prefixes
+    assert replace_placeholders("x.png y.png", {"x.png": "y.png", "y.png": "z.png"}) == "y.png z.png"
+    assert replace_placeholders("img-10 img-1", {"img-1": "A", "img-10": "B"}) == "B A"
+    assert replace_placeholders("unchanged", {}) == "unchanged"
+
+
+@pytest.mark.asyncio
+async def test_save_parse_response_writes_images_and_rewrites_placeholders(tmp_path):
+    images = {f"img-{i}.jpeg": base64.b64encode(f"image {i}".encode()).decode() for i in (1, 10)}
+    images["img-1.jpeg"] = f"data:image/jpeg;base64,{images['img-1.jpeg']}"
+    response = ParseResponse(markdown="![](img-1.jpeg)\n![](img-10.jpeg)", images=images)
+
+    markdown_path, markdown = await save_parse_response(tmp_path / "paper.pdf", response)
+
+    assert markdown == "![](paper_fig_1.png)\n![](paper_fig_2.png)"
+    assert markdown_path == tmp_path / "paper.md" and markdown_path.read_text() == markdown
+    assert (tmp_path / "paper_fig_1.png").read_bytes() == b"image 1"
+    assert (tmp_path / "paper_fig_2.png").read_bytes() == b"image 10"
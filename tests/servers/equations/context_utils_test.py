@@ -0,0 +1,61 @@
+"""Tests for local relevance filtering of equation derivation context."""
+
+from axiomatic_mcp.servers.equations.context_utils import (
+    build_equation_index,
+    build_task_context,
+    extract_display_equations,
+    split_sections,
+)
+
+
+def _long_document(relevant_section: int) -> str:
+    sections = []
+    for i in range(40):
+        text = f"# Section {i}\n\n" + "Unrelated filler text about experimental setup. " * 60
+        if i == relevant_section:
+            text += "\n\nThe effective index dispersion is $$n_{eff}(\\lambda) = n_0 + a \\lambda$$"
+        sections.append(text)
+    return "\n\n".join(sections)
+
+
+def test_short_documents_are_sent_in_full():
+    markdown = "# Intro\n\nE = mc^2"
+    assert build_task_context(markdown, "derive the energy") == markdown
+
+
+def test_selects_relevant_section_and_equation_index():
+    markdown = _long_document(relevant_section=17)
+    context = build_task_context(markdown, "Express the effective index dispersion n_eff")
+
+    assert len(context) < len(markdown)
+    assert "# Section 17" in context
+    assert "# Section 3\n" not in context
+    assert "(1) $$n_{eff}(\\lambda) = n_0 + a \\lambda$$" in context
+
+
+def test_equation_index_counts_against_the_context_budget():
+    equations = "\n\n".join(f"$$x_{{{i}}} = {i} \\cdot y$$" for i in range(2000))
+    markdown = _long_document(relevant_section=17) + "\n\n# Appendix\n\n" + equations
+    context = build_task_context(markdown, "Express the effective index dispersion n_eff", max_context_chars=20_000)
+
+    assert len(context) <= 20_000 + 200
+    assert "# Section 17" in context
+    assert "(1) $$n_{eff}(\\lambda) = n_0 + a \\lambda$$" in context
+    assert "more equations omitted]" in context
+
+
+def test_build_equation_index_truncates_to_budget():
+    assert build_equation_index(["a", "b"], 100) == "(1) $$a$$\n(2) $$b$$"
+    assert build_equation_index(["a", "b", "c"], 20) == "(1) $$a$$\n(2) $$b$$\n[... 1 more equations omitted]"
+
+
+def test_falls_back_to_full_text_when_nothing_matches():
+    markdown = _long_document(relevant_section=-1)
+    assert build_task_context(markdown, "quantum chromodynamics") == markdown
+
+
+def test_split_sections_and_extract_equations():
+    markdown = "preamble\n# A\n\n$$x = 1$$\n\n## B\n\n\\begin{equation} y = 2 \\end{equation}"
+
+    assert split_sections(markdown) == ["preamble", "# A\n\n$$x = 1$$", "## B\n\n\\begin{equation} y = 2 \\end{equation}"]
+    assert extract_display_equations(markdown) == ["x = 1", "y = 2"]
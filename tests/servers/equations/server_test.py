@@ -0,0 +1,38 @@
+"""Tests for the AxEquationExplorer MCP server."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastmcp.client import Client
+
+from axiomatic_mcp.servers.equations.server import mcp
+from axiomatic_mcp.shared.api_client import AxiomaticAPIClient
+
+
+@pytest_asyncio.fixture
+async def mcp_client():
+    async with Client(transport=mcp) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_batch_tools_write_separate_code_files(mcp_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    document = tmp_path / "paper.md"
+    document.write_text("# Energy\n\n$$E = m c^2$$\n", encoding="utf-8")
+    arguments = {"document": str(document), "tasks": ["first", "second"], "full_document": True}
+
+    responses = [{"code": f"# {tool}", "explanation": ""} for tool in ("derive", "derive", "check", "check")]
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=responses)):
+        await mcp_client.call_tool("find_functional_forms", arguments)
+        await mcp_client.call_tool("check_equations", arguments)
+
+    assert sorted(path.name for path in tmp_path.glob("paper_code_*.py")) == [
+        "paper_code_check_1.py",
+        "paper_code_check_2.py",
+        "paper_code_derive_1.py",
+        "paper_code_derive_2.py",
+    ]
+    assert (tmp_path / "paper_code_derive_1.py").read_text() == "# derive"
+    assert (tmp_path / "paper_code_check_2.py").read_text() == "# check"
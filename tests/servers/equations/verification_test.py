@@ -0,0 +1,65 @@
+"""Tests for local verification of generated equations code."""
+
+import asyncio
+import os
+
+import pytest
+
+from axiomatic_mcp.servers.equations.verification import format_verification, verify_code_file
+
+
+@pytest.mark.asyncio
+async def test_reports_composed_equation_and_test_outcomes(tmp_path):
+    code_path = tmp_path / "paper_code.py"
+    code_path.write_text(
+        "composed_equation = 2 * 3\n"
+        "def test_matches():\n"
+        "    assert composed_equation == 6\n"
+        "def test_mismatch():\n"
+        "    assert composed_equation == 5\n"
+    )
+
+    result = await verify_code_file(code_path, timeout=30)
+
+    assert result["status"] == "failed"
+    assert result["composed_equation"] == "6"
+    assert result["tests"]["test_matches"] == "passed"
+    assert result["tests"]["test_mismatch"].startswith("failed: AssertionError")
+    assert "composed_equation = 6" in format_verification(result)
+
+
+@pytest.mark.asyncio
+async def test_captures_exceptions(tmp_path):
+    code_path = tmp_path / "paper_code.py"
+    code_path.write_text("raise ValueError('bad derivation')\n")
+
+    result = await verify_code_file(code_path, timeout=30)
+
+    assert result["status"] == "failed"
+    assert "ValueError: bad derivation" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_kills_jobs_exceeding_timeout(tmp_path):
+    code_path = tmp_path / "paper_code.py"
+    code_path.write_text("while True:\n    pass\n")
+
+    result = await verify_code_file(code_path, timeout=0.5)
+
+    assert result["status"] == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_kills_jobs_when_cancelled(tmp_path):
+    code_path = tmp_path / "paper_code.py"
+    code_path.write_text("import os, time\nopen('pid', 'w').write(str(os.getpid()))\nwhile True:\n    time.sleep(0.01)\n")
+
+    task = asyncio.create_task(verify_code_file(code_path, timeout=30))
+    while not (tmp_path / "pid").exists() or not (tmp_path / "pid").read_text():
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int((tmp_path / "pid").read_text()), 0)
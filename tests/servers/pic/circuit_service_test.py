@@ -0,0 +1,27 @@
+"""Tests for running circuit code to extract its netlist."""
+
+import asyncio
+import sys
+
+import pytest
+
+from axiomatic_mcp.servers.pic.services.circuit_service import CircuitService
+
+CODE = """
+import json
+import time
+
+for _ in range(20):
+    time.sleep(0.001)
+print(json.dumps({{"circuit": {name!r}}}))
+"""
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executions_keep_their_output_apart():
+    stdout = sys.stdout
+
+    outputs = await asyncio.gather(*(asyncio.to_thread(CircuitService._execute_netlist_code, CODE.format(name=f"c{i}")) for i in range(8)))
+
+    assert outputs == [f'{{"circuit": "c{i}"}}' for i in range(8)]
+    assert sys.stdout is stdout
@@ -0,0 +1,103 @@
+"""Tests for the downsampling of extracted plot series."""
+
+import numpy as np
+import pytest
+
+from axiomatic_mcp.servers.plots.downsampling import DOWNSAMPLING_METHODS, downsample_indices, lttb
+
+
+def _reference_lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> list[int]:
+    n_points = len(x)
+    every = (n_points - 2) / (max_points - 2)
+    selected = [0]
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = int(bucket * every) + 1, int((bucket + 1) * every) + 1
+        next_start, next_end = int((bucket + 1) * every) + 1, min(int((bucket + 2) * every) + 1, n_points)
+        if bucket == max_points - 3:
+            next_start, next_end = n_points - 1, n_points
+        mean_x, mean_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        areas = [abs((x[previous] - mean_x) * (y[i] - y[previous]) - (x[previous] - x[i]) * (mean_y - y[previous])) for i in range(start, end)]
+        previous = start + int(np.argmax(areas))
+        selected.append(previous)
+    return [*selected, n_points - 1]
+
+
+def _resonance(n_points: int = 5000) -> tuple[np.ndarray, np.ndarray]:
+    x = np.linspace(1500, 1600, n_points)
+    y = 1 - 0.9 / (1 + ((x - 1550.013) / 0.05) ** 2)
+    return x, y
+
+
+def test_lttb_matches_reference_implementation():
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(0, 10, 1000))
+    y = np.sin(x) + rng.normal(scale=0.1, size=x.size)
+
+    assert lttb(x, y, 100).tolist() == _reference_lttb(x, y, 100)
+
+
+def test_lttb_keeps_narrow_dip():
+    x, y = _resonance()
+
+    selected = downsample_indices(x, y, 50, "lttb")
+
+    assert len(selected) == 50
+    # Random sampling of 50 out of 5000 points rarely hits one of the 3 points at the bottom of the dip
+    assert y[selected].min() < 0.3
+
+
+def test_minmax_keeps_every_extremum():
+    x, y = _resonance()
+
+    selected = downsample_indices(x, y, 50, "minmax")
+
+    assert len(selected) <= 50
+    assert int(np.argmin(y)) in selected.tolist()
+    assert int(np.argmax(y)) in selected.tolist()
+
+
+@pytest.mark.parametrize("method", DOWNSAMPLING_METHODS)
+def test_downsampling_is_deterministic_and_sorted_by_x(method):
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0, 1, 2000)
+    y = rng.normal(size=2000)
+
+    selected = downsample_indices(x, y, 100, method)
+
+    assert 0 < len(selected) <= 100
+    assert len(set(selected.tolist())) == len(selected)
+    assert np.all(np.diff(x[selected]) >= 0)
+    assert downsample_indices(x, y, 100, method).tolist() == selected.tolist()
+
+
+@pytest.mark.parametrize("method", DOWNSAMPLING_METHODS)
+def test_series_within_limit_is_only_sorted(method):
+    x = np.array([3.0, 1.0, 2.0])
+    y = np.array([30.0, 10.0, 20.0])
+
+    assert downsample_indices(x, y, 10, method).tolist() == [1, 2, 0]
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError, match="Unknown downsampling method"):
+        downsample_indices(np.arange(3.0), np.arange(3.0), 2, "median")
+
+
+@pytest.mark.parametrize("method", DOWNSAMPLING_METHODS)
+@pytest.mark.parametrize("max_points", [0, -1, -5])
+def test_no_points_for_zero_or_negative_limits(method, max_points):
+    x, y = _resonance(100)
+
+    selected = downsample_indices(x, y, max_points, method)
+
+    assert selected.size == 0
+    assert selected.dtype == np.intp
+    assert x[selected].size == 0
+
+
+@pytest.mark.parametrize("method", DOWNSAMPLING_METHODS)
+def test_one_point_limit(method):
+    x, y = _resonance(100)
+
+    assert downsample_indices(x, y, 1, method).size == 1
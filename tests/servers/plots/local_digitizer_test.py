@@ -0,0 +1,110 @@
+"""Tests for the local digitizer of clean line plots."""
+
+import numpy as np
+import pytest
+
+from axiomatic_mcp.servers.plots.local_digitizer import AxisCalibration, digitize_plot_array, pixels_to_values, score_ticks
+
+# Box spines, ticks every 80 columns (x = 0, 1, 2, 3) and every 60 rows (y = 0, 1, 2, 3 from the bottom)
+LEFT, RIGHT, TOP, BOTTOM = 60, 380, 20, 250
+X_TICKS = [80, 160, 240, 320]
+Y_TICKS = [230, 170, 110, 50]
+
+
+def _column(x: float) -> float:
+    return 80 + 80 * x
+
+
+def _row(y: float) -> float:
+    return 230 - 60 * y
+
+
+def _draw_curve(image: np.ndarray, f, x_range: tuple[float, float], color: tuple[int, int, int], dash: int | None = None):
+    columns = np.arange(int(_column(x_range[0])), int(_column(x_range[1])) + 1)
+    rows = np.round(_row(f((columns - 80) / 80))).astype(int)
+    for i, column in enumerate(columns[:-1]):
+        if dash and i % dash >= dash - 3:
+            continue
+        top, bottom = sorted((rows[i], rows[i + 1]))
+        image[top : bottom + 2, column] = color
+
+
+def _render(series, line_color_of_frame=(0, 0, 0)) -> np.ndarray:
+    image = np.full((300, 400, 3), 255, dtype=np.uint8)
+    image[TOP - 1, LEFT - 1 : RIGHT + 2] = line_color_of_frame
+    image[BOTTOM + 1, LEFT - 1 : RIGHT + 2] = line_color_of_frame
+    image[TOP - 1 : BOTTOM + 2, LEFT - 1] = line_color_of_frame
+    image[TOP - 1 : BOTTOM + 2, RIGHT + 1] = line_color_of_frame
+    for column in X_TICKS:
+        image[BOTTOM + 2 : BOTTOM + 7, column] = line_color_of_frame
+    for row in Y_TICKS:
+        image[row, LEFT - 6 : LEFT - 1] = line_color_of_frame
+    for f, x_range, color, dash in series:
+        _draw_curve(image, f, x_range, color, dash)
+    return image
+
+
+def _blue(x):
+    return 1.5 + np.sin(x)
+
+
+def _red(x):
+    return 0.5 + 0.2 * x
+
+
+def test_digitize_plot_array_recovers_colored_series():
+    image = _render([(_blue, (0.0, 3.5), (31, 119, 180), None), (_red, (-0.2, 3.6), (214, 39, 40), 10)])
+    # Legend sample of the blue series, away from its curve
+    image[30:32, 300:325] = (31, 119, 180)
+
+    result = digitize_plot_array(image, AxisCalibration(0, 3), AxisCalibration(0, 3))
+
+    assert result.confidence >= 0.8, result.summary()
+    assert len(result.series) == 2
+    by_color = dict(zip(result.colors, result.series, strict=True))
+    for color, f, x_range in (("#1f77b4", _blue, (0.0, 3.5)), ("#d62728", _red, (-0.2, 3.6))):
+        _, x, y = by_color[color]
+        assert x.min() == pytest.approx(x_range[0], abs=0.02)
+        assert x.max() == pytest.approx(x_range[1], abs=0.02)
+        # One pixel is 1/60 in y
+        assert np.abs(y - f(x)).max() < 0.05
+
+
+def test_digitize_plot_array_log_axis():
+    image = _render([(_red, (0.0, 3.0), (214, 39, 40), None)])
+
+    _, x, _ = digitize_plot_array(image, AxisCalibration(1e-3, 1, log_scale=True), AxisCalibration(0, 3)).series[0]
+
+    assert x.min() == pytest.approx(1e-3, rel=0.05)
+    assert x.max() == pytest.approx(1.0, rel=0.05)
+
+
+def test_digitize_plot_array_low_confidence_for_unsupported_plots():
+    x_axis, y_axis = AxisCalibration(0, 3), AxisCalibration(0, 3)
+
+    black_line = _render([(_blue, (0.0, 3.5), (0, 0, 0), None)])
+    assert digitize_plot_array(black_line, x_axis, y_axis).confidence == 0.0
+
+    no_frame = _render([(_blue, (0.0, 3.5), (31, 119, 180), None)], line_color_of_frame=(255, 255, 255))
+    assert digitize_plot_array(no_frame, x_axis, y_axis).confidence == 0.0
+
+    markers = _render([])
+    for x in np.arange(0.0, 3.5, 0.5):
+        row, column = int(_row(_blue(x))), int(_column(x))
+        markers[row - 3 : row + 4, column - 3 : column + 4] = (31, 119, 180)
+    assert digitize_plot_array(markers, x_axis, y_axis).confidence == 0.0
+
+
+def test_pixels_to_values_and_tick_scores():
+    pixels = np.array([80.0, 200.0, 320.0])
+    np.testing.assert_allclose(pixels_to_values(pixels, 80, 320, AxisCalibration(0, 3)), [0, 1.5, 3])
+    np.testing.assert_allclose(pixels_to_values(pixels, 80, 320, AxisCalibration(1, 1000, log_scale=True)), [1, 10**1.5, 1000])
+
+    assert score_ticks(np.array([80.0, 160.0, 240.0, 321.0])) == 1.0
+    assert score_ticks(np.array([80.0, 160.0, 260.0, 320.0])) == 0.0
+    assert score_ticks(np.array([80.0])) == 0.0
+
+    with pytest.raises(ValueError):
+        AxisCalibration(1, 1)
+    with pytest.raises(ValueError):
+        AxisCalibration(0, 10, log_scale=True)
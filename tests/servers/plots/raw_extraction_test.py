@@ -0,0 +1,73 @@
+"""Tests for the full-resolution plot extractions saved next to the images."""
+
+import numpy as np
+
+from axiomatic_mcp.servers.plots.raw_extraction import (
+    LOCAL_SOURCE,
+    REMOTE_SOURCE,
+    RawExtraction,
+    load_raw_extraction,
+    plot_stem_of,
+    raw_extraction_path,
+    save_raw_extraction,
+)
+
+
+def _extraction(image_hash: str | None = "abc") -> RawExtraction:
+    return RawExtraction.from_series(
+        [(0, np.array([1.0, 2.0, 3.0]), np.array([10.0, 20.0, 30.0])), (5, np.array([0.5]), np.array([-1.0]))],
+        x_sig_figs=4,
+        y_sig_figs=6,
+        image_hash=image_hash,
+    )
+
+
+def test_raw_extraction_round_trip(tmp_path):
+    path = raw_extraction_path(tmp_path / "figure.png")
+
+    save_raw_extraction(path, _extraction())
+    loaded = load_raw_extraction(path, image_hash="abc")
+
+    assert path.name == "figure_raw.npz"
+    assert plot_stem_of(path) == "figure"
+    assert [(series_id, x.tolist(), y.tolist()) for series_id, x, y in loaded.series()] == [
+        (0, [1.0, 2.0, 3.0], [10.0, 20.0, 30.0]),
+        (5, [0.5], [-1.0]),
+    ]
+    assert (loaded.x_sig_figs, loaded.y_sig_figs, loaded.image_hash, loaded.n_points) == (4, 6, "abc", 4)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_load_raw_extraction_rejects_other_image_and_broken_files(tmp_path):
+    path = tmp_path / "figure_raw.npz"
+    save_raw_extraction(path, _extraction())
+
+    assert load_raw_extraction(path, image_hash="other") is None
+    assert load_raw_extraction(path) is not None
+    assert load_raw_extraction(tmp_path / "missing_raw.npz") is None
+
+    path.write_bytes(b"not an npz file")
+    assert load_raw_extraction(path) is None
+
+
+def test_empty_raw_extraction_round_trip(tmp_path):
+    path = tmp_path / "empty_raw.npz"
+
+    save_raw_extraction(path, RawExtraction.from_series([], x_sig_figs=4, y_sig_figs=4, image_hash=None))
+    loaded = load_raw_extraction(path)
+
+    assert list(loaded.series()) == []
+    assert loaded.image_hash is None
+
+
+def test_raw_extraction_keeps_its_source(tmp_path):
+    path = tmp_path / "figure_raw.npz"
+
+    save_raw_extraction(path, RawExtraction.from_series([], x_sig_figs=4, y_sig_figs=4, source=LOCAL_SOURCE))
+    assert load_raw_extraction(path).source == LOCAL_SOURCE
+
+    # Files written before the source was recorded come from the plot endpoint
+    with np.load(path) as data:
+        legacy = {key: data[key] for key in data.files if key != "source"}
+    np.savez_compressed(path, **legacy)
+    assert load_raw_extraction(path).source == REMOTE_SOURCE
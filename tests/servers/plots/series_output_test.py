@@ -0,0 +1,145 @@
+"""Tests for the data files and summaries of digitized plot series."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from axiomatic_mcp.servers.axmodelfitter.data_file_utils import load_data_file
+from axiomatic_mcp.servers.plots.series_output import (
+    TableColumns,
+    check_output_format,
+    check_response_mode,
+    describe_series_tables,
+    format_series_summary,
+    series_data_path,
+    series_table_paths,
+    series_to_json,
+    summarize_series,
+    write_series_file,
+    write_series_tables,
+)
+
+SERIES = [(0, np.array([0.1, 0.2, 0.3]), np.array([1.0, 4.0, 9.0])), (3, np.array([1e-9]), np.array([-2.5]))]
+
+
+def test_series_to_json_keeps_the_tool_layout():
+    assert json.loads(series_to_json(SERIES)) == {
+        "series_points": [
+            {"series_unique_id": 0, "points": [{"x_value": 0.1, "y_value": 1.0}, {"x_value": 0.2, "y_value": 4.0}, {"x_value": 0.3, "y_value": 9.0}]},
+            {"series_unique_id": 3, "points": [{"x_value": 1e-9, "y_value": -2.5}]},
+        ]
+    }
+
+
+def test_csv_output_is_one_row_per_point(tmp_path):
+    path = write_series_file(series_data_path(tmp_path, "plot", "csv"), SERIES, "csv")
+
+    assert path.name == "plot_data.csv"
+    assert path.read_text().splitlines() == ["series_unique_id,x_value,y_value", "0,0.1,1.0", "0,0.2,4.0", "0,0.3,9.0", "3,1e-09,-2.5"]
+    assert pd.read_csv(path)["x_value"].tolist() == [0.1, 0.2, 0.3, 1e-9]
+
+
+def test_npz_output_round_trip(tmp_path):
+    path = write_series_file(tmp_path / "plot_data.npz", SERIES, "npz")
+
+    with np.load(path) as data:
+        assert data["series_unique_id"].tolist() == [0, 0, 0, 3]
+        assert data["x_value"].tolist() == [0.1, 0.2, 0.3, 1e-9]
+        assert data["y_value"].tolist() == [1.0, 4.0, 9.0, -2.5]
+
+
+def test_parquet_output_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    path = write_series_file(tmp_path / "plot_data.parquet", SERIES, "parquet")
+
+    assert pd.read_parquet(path).to_dict("list") == {
+        "series_unique_id": [0, 0, 0, 3],
+        "x_value": [0.1, 0.2, 0.3, 1e-9],
+        "y_value": [1.0, 4.0, 9.0, -2.5],
+    }
+
+
+def test_json_output_reuses_serialized_text(tmp_path):
+    path = write_series_file(tmp_path / "plot_data.json", SERIES, "json", series_json="precomputed")
+
+    assert path.read_text() == "precomputed"
+
+
+def test_summary_of_series():
+    summary = summarize_series(SERIES)
+
+    assert summary[0] == {
+        "series_unique_id": 0,
+        "n_points": 3,
+        "x_min": 0.1,
+        "x_max": 0.3,
+        "y_min": 1.0,
+        "y_max": 9.0,
+        "y_mean": pytest.approx(14 / 3),
+    }
+    assert format_series_summary(summary).splitlines()[2:] == [
+        "| 0 | 3 | 0.1 to 0.3 | 1 to 9 | 4.66667 |",
+        "| 3 | 1 | 1e-09 to 1e-09 | -2.5 to -2.5 | -2.5 |",
+    ]
+
+
+def test_unknown_output_format_and_response_mode_are_rejected():
+    with pytest.raises(ValueError, match="Unknown output format"):
+        check_output_format("xlsx")
+    with pytest.raises(ValueError, match="Unknown response mode"):
+        check_response_mode("points")
+
+
+def test_tables_with_renamed_columns_and_named_series(tmp_path):
+    columns = TableColumns(x="wavelength_nm", y="transmission", series_names=["TE", "TM"])
+
+    path = write_series_file(tmp_path / "plot_data.csv", SERIES, "csv", columns=columns)
+
+    assert pd.read_csv(path).to_dict("list") == {
+        "series_unique_id": [0, 0, 0, 3],
+        "series_name": ["TE", "TE", "TE", "TM"],
+        "wavelength_nm": [0.1, 0.2, 0.3, 1e-9],
+        "transmission": [1.0, 4.0, 9.0, -2.5],
+    }
+
+
+@pytest.mark.parametrize("output_format", ["csv", "json"])
+def test_series_tables_are_readable_by_the_model_fitter(tmp_path, output_format):
+    data_path = series_data_path(tmp_path, "plot", output_format)
+
+    unnamed = write_series_tables(data_path, SERIES, output_format, TableColumns(x="t"))
+    named = write_series_tables(data_path, SERIES, output_format, TableColumns(x="t", series_names=["fast decay"]))
+
+    assert [path.name for path in unnamed] == [f"plot_data_series_0.{output_format}", f"plot_data_series_3.{output_format}"]
+    assert [path.name for path in named] == [f"plot_data_fast_decay.{output_format}", f"plot_data_series_3.{output_format}"]
+    # pandas parses JSON floats to within one ulp
+    assert load_data_file(str(unnamed[0])).to_dict("list") == {"t": pytest.approx([0.1, 0.2, 0.3]), "y_value": [1.0, 4.0, 9.0]}
+    assert load_data_file(str(named[0])).to_dict("list") == {"t": pytest.approx([0.1, 0.2, 0.3]), "fast decay": [1.0, 4.0, 9.0]}
+    assert "y column 'fast decay'" in describe_series_tables(named, SERIES, output_format, TableColumns(x="t", series_names=["fast decay"]))
+
+
+def test_series_table_names_never_collide(tmp_path):
+    data_path = series_data_path(tmp_path, "plot", "csv")
+    three = [*SERIES, (5, np.array([1.0]), np.array([2.0]))]
+
+    sanitized = series_table_paths(data_path, three, TableColumns(series_names=["a b", "a_b", "c"]))
+    default = series_table_paths(data_path, three, TableColumns(series_names=["series_3"]))
+    cased = series_table_paths(data_path, SERIES, TableColumns(series_names=["TE", "te"]))
+
+    assert [path.name for path in sanitized] == ["plot_data_a_b_0.csv", "plot_data_a_b_3.csv", "plot_data_c.csv"]
+    assert [path.name for path in default] == ["plot_data_series_3_0.csv", "plot_data_series_3_3.csv", "plot_data_series_5.csv"]
+    assert [path.name for path in cased] == ["plot_data_TE_0.csv", "plot_data_te_3.csv"]
+    with pytest.raises(ValueError, match="clashing"):
+        series_table_paths(data_path, three, TableColumns(series_names=["a", "a_0", "a "]))
+
+
+def test_invalid_table_columns_are_rejected():
+    with pytest.raises(ValueError, match="different"):
+        TableColumns(x="x", y="x")
+    with pytest.raises(ValueError, match="unique"):
+        TableColumns(series_names=["a", "a"])
+    with pytest.raises(ValueError, match="x column"):
+        TableColumns(x="a", series_names=["a"])
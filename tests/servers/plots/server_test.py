@@ -0,0 +1,277 @@
+"""Tests for the AxPlotToData MCP server."""
+
+import base64
+import warnings
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from fastmcp.client import Client
+from fastmcp.exceptions import ToolError
+
+from axiomatic_mcp.servers.plots.raw_extraction import LOCAL_SOURCE, REMOTE_SOURCE, load_raw_extraction
+from axiomatic_mcp.servers.plots.server import (
+    AxiomaticAPIClient,
+    axis_calibrations,
+    count_significant_figures,
+    determine_sig_figs,
+    extract_plot_series,
+    parse_plot_parser_output,
+    plots,
+    process_plot_parser_output,
+    request_plot_split,
+    resolve_plot_paths,
+    round_to_significant_figures,
+    sample_raw_extraction,
+)
+
+
+@pytest_asyncio.fixture
+async def mcp_client():
+    async with Client(transport=plots) as client:
+        yield client
+
+
+def test_count_significant_figures():
+    assert count_significant_figures(0.0) == 1
+    assert count_significant_figures(100.0) == 4
+    assert count_significant_figures(12.5) == 3
+    assert count_significant_figures(-0.0025) == 2
+    assert count_significant_figures(1.5e-7) == 2
+    assert count_significant_figures(1.25e20) == 3
+
+
+def test_round_to_significant_figures_matches_format():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(size=500) * 10.0 ** rng.integers(-30, 30, 500), np.round(rng.uniform(-1000, 1000, 500), 3), [0.0]])
+
+    for sig_figs in range(1, 18):
+        expected = [float(format(value, f".{sig_figs}g")) for value in values.tolist()]
+        assert round_to_significant_figures(values, sig_figs).tolist() == expected
+
+
+def test_round_to_significant_figures_of_subnormals_without_warnings():
+    values = np.array([5e-324, 1.2345e-310, -2.5e-320])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        rounded = round_to_significant_figures(values, 3)
+
+    assert rounded.tolist() == [float(format(value, ".3g")) for value in values.tolist()]
+
+
+def test_determine_sig_figs_ignores_invalid_ticks_and_clamps():
+    response = {"plot_info": {"x_axis_tick_values": [0, 0.5, "n/a", None], "y_axis_tick_values": [1.23456789, 2.0]}}
+
+    assert determine_sig_figs(response) == (4, 7)
+
+
+def test_process_plot_parser_output_filters_rounds_and_downsamples():
+    points = [{"value_x": i / 3, "value_y": 1000 + i / 7} for i in range(1000)]
+    points[1] = {"value_x": None, "value_y": 1.0}
+    points[2] = {"value_x": "nan", "value_y": 1.0}
+    points[3] = {"value_x": 1.0, "value_y": "not a number"}
+    points[4] = {"value_x": float("inf"), "value_y": 1.0}
+    response = {
+        "plot_info": {"x_axis_tick_values": [0, 100], "y_axis_tick_values": [1000, 1100]},
+        "extracted_series": [
+            {"id": "7", "points": points[:10]},
+            {"id": "abc", "points": points},
+            {"id": 3, "points": [{"value_x": None, "value_y": None}]},
+        ],
+    }
+
+    result = process_plot_parser_output(response, max_points=50)
+
+    assert [series.series_unique_id for series in result.series_points] == [7, 1]
+    first, second = result.series_points
+    assert [(point.x_value, point.y_value) for point in first.points[:2]] == [(0.0, 1000.0), (1.667, 1000.7)]
+    assert len(first.points) == 6
+    assert len(second.points) == 50
+    assert all(np.isfinite([point.x_value, point.y_value]).all() for point in second.points)
+    assert [point.x_value for point in second.points] == sorted(point.x_value for point in second.points)
+    assert process_plot_parser_output(response, max_points=50) == result
+
+
+def _response(n_points: int = 500) -> dict:
+    return {
+        "plot_info": {"x_axis_tick_values": [0, 10], "y_axis_tick_values": [0, 1]},
+        "extracted_series": [
+            {"id": 0, "points": [{"value_x": i / 50, "value_y": (i % 7) / 7} for i in range(n_points)]},
+            {"id": 1, "points": [{"value_x": i / 50, "value_y": 0.5} for i in range(n_points)]},
+        ],
+    }
+
+
+def test_sample_raw_extraction_crops_and_selects_series():
+    extraction = parse_plot_parser_output(_response())
+
+    sampled = sample_raw_extraction(extraction, max_points=None, x_min=2.0, x_max=3.0, series_ids=[1])
+
+    assert [series_id for series_id, _, _ in sampled] == [1]
+    _, x, y = sampled[0]
+    assert x.tolist() == [round(2.0 + i / 50, 10) for i in range(51)]
+    assert set(y.tolist()) == {0.5}
+    assert sample_raw_extraction(extraction, x_min=100.0) == []
+
+
+@pytest.mark.asyncio
+async def test_extract_plot_series_reuses_saved_extraction(tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    plot_path = tmp_path / "plot.png"
+    plot_path.write_bytes(b"png bytes")
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(return_value=_response())) as post:
+        first, _, first_cached, _ = await extract_plot_series(plot_path, max_points=20)
+        second, _, second_cached, _ = await extract_plot_series(plot_path, max_points=50)
+
+        plot_path.write_bytes(b"changed png bytes")
+        _, _, third_cached, _ = await extract_plot_series(plot_path, max_points=50)
+
+    assert post.await_count == 2
+    assert (first_cached, second_cached, third_cached) == (False, True, False)
+    assert [x.size for _, x, _ in first] == [20, 20]
+    assert [x.size for _, x, _ in second] == [50, 50]
+    assert (tmp_path / "plot_raw.npz").is_file()
+
+
+@pytest.mark.asyncio
+async def test_extract_plot_series_digitizes_clean_plots_locally(mcp_client, tmp_path, monkeypatch):
+    image_module = pytest.importorskip("PIL.Image")
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+
+    # Black axes box from x = 0 to 10 and y = 0 to 1 with outward ticks, and a blue line y = x / 10
+    image = np.full((120, 220, 3), 255, dtype=np.uint8)
+    image[9, 9:211] = image[110, 9:211] = 0
+    image[9:111, 9] = image[9:111, 210] = 0
+    image[111:116, [10, 110, 209]] = 0
+    image[[109, 59, 10], 4:9] = 0
+    columns = np.arange(10, 210)
+    image[np.round(109 - (columns - 10) / 2).astype(int), columns] = (31, 119, 180)
+    image[np.round(108 - (columns - 10) / 2).astype(int), columns] = (31, 119, 180)
+    plot_path = tmp_path / "plot.png"
+    image_module.fromarray(image).save(plot_path)
+    axes = axis_calibrations([0, 10], [0, 1])
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(return_value=_response())) as post:
+        series, _, cached, local = await extract_plot_series(plot_path, max_points=20, axes=axes)
+        assert post.await_count == 0
+        assert not cached and local.confidence >= 0.8
+        [(_, x, y)] = series
+        assert x.size == 20
+        assert np.abs(y - x / 10).max() < 0.02
+
+        # Saved for resampling, but never reused in place of a new local or remote extraction
+        assert load_raw_extraction(tmp_path / "plot_raw.npz").source == LOCAL_SOURCE
+        response = await mcp_client.call_tool("resample_extracted_series", {"plot_path": str(plot_path), "max_number_points_per_series": 5})
+        assert response.content[0].text.startswith("Re-sampled 5 of 200")
+        _, _, cached, _ = await extract_plot_series(plot_path, max_points=20, axes=axes)
+        assert post.await_count == 0 and not cached
+
+        _, _, _, local = await extract_plot_series(plot_path, max_points=20, axes=axes, local_min_confidence=1.1)
+        assert post.await_count == 1
+        assert local.confidence < 1.1
+        assert load_raw_extraction(tmp_path / "plot_raw.npz").source == REMOTE_SOURCE
+
+        _, _, cached, local = await extract_plot_series(plot_path, max_points=20, axes=axes)
+        assert post.await_count == 1 and cached and local is None
+
+    with pytest.raises(ValueError):
+        axis_calibrations([0, 10], None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool", ["extract_numerical_series", "resample_extracted_series"])
+@pytest.mark.parametrize("max_points", [0, -3])
+async def test_tools_reject_point_limits_below_one(mcp_client, tmp_path, tool, max_points):
+    with pytest.raises(ToolError, match="at least 1"):
+        await mcp_client.call_tool(tool, {"plot_path": str(tmp_path / "plot.png"), "max_number_points_per_series": max_points})
+
+
+def test_resolve_plot_paths_keeps_order_and_drops_duplicates(tmp_path):
+    figures = tmp_path / "figures"
+    (figures / "sub").mkdir(parents=True)
+    for name in ("b.png", "a.PNG", "notes.txt", "sub/c.png"):
+        (figures / name).write_bytes(b"png bytes")
+    extra = tmp_path / "extra.png"
+
+    assert resolve_plot_paths([str(extra), str(figures), str(figures / "b.png")]) == [extra, figures / "a.PNG", figures / "b.png"]
+    assert resolve_plot_paths([str(figures)], recursive=True) == [figures / "a.PNG", figures / "b.png", figures / "sub" / "c.png"]
+
+
+@pytest.mark.asyncio
+async def test_extract_numerical_series_batch_isolates_failures_and_reuses_extractions(mcp_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    for name in ("good.png", "bad.png"):
+        (tmp_path / name).write_bytes(name.encode())
+    arguments = {"paths": [str(tmp_path), str(tmp_path / "missing.png")], "max_number_points_per_series": 10, "output_format": "csv"}
+
+    async def post(endpoint, data=None, files=None, params=None):
+        if files["plot_img"][0] == "bad.png":
+            raise RuntimeError("server error")
+        return _response()
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=post)) as mock_post:
+        first = await mcp_client.call_tool("extract_numerical_series_batch", arguments)
+        second = await mcp_client.call_tool("extract_numerical_series_batch", arguments)
+
+    # The saved extraction of good.png is reused, the failed images are tried again
+    assert sorted(call.kwargs["files"]["plot_img"][0] for call in mock_post.await_args_list) == ["bad.png", "bad.png", "good.png"]
+    results = {Path(r["plot_path"]).name: r for r in first.structured_content["results"]}
+    assert [results[name]["status"] for name in ("bad.png", "good.png", "missing.png")] == ["failed", "extracted", "failed"]
+    assert "server error" in results["bad.png"]["error"]
+    assert (results["good.png"]["series"], results["good.png"]["points"], results["good.png"]["cached"]) == (2, 20, False)
+    assert results["good.png"]["data_path"] == str(tmp_path / "good_data.csv") and (tmp_path / "good_data.csv").is_file()
+    assert first.content[0].text.startswith("Processed 3 images: 1 extracted (0 from saved extractions, 0 digitized locally), 2 failed")
+    assert [r["cached"] for r in second.structured_content["results"] if r["status"] == "extracted"] == [True]
+
+
+@pytest.mark.asyncio
+async def test_request_plot_split_decodes_panels(tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    plot_path = tmp_path / "figure.png"
+    plot_path.write_bytes(b"png bytes")
+    encoded = [base64.b64encode(panel).decode() for panel in (b"panel 0", b"panel 1")]
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(return_value=[f"data:image/png;base64,{encoded[0]}", encoded[1]])) as post:
+        assert await request_plot_split(plot_path) == [b"panel 0", b"panel 1"]
+    # The figure is streamed from disk
+    assert post.await_args.kwargs["files"]["plot_img"][1] == plot_path
+
+    for response, message in (([], "no split images"), ({"error": "x"}, "unexpected response format"), (["not base64!"], "index 0")):
+        with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(return_value=response)), pytest.raises(ToolError, match=message):
+            await request_plot_split(plot_path)
+
+
+@pytest.mark.asyncio
+async def test_split_and_extract_multi_plot_extracts_panels_independently(mcp_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    plot_path = tmp_path / "figure.png"
+    plot_path.write_bytes(b"png bytes")
+    panels = [base64.b64encode(panel).decode() for panel in (b"panel 0", b"panel 1")]
+
+    async def post(endpoint, data=None, files=None, params=None):
+        if endpoint == "/document/plot/split":
+            return panels
+        name, content, _ = files["plot_img"]
+        if name == "figure_split_1.png":
+            raise RuntimeError("server error")
+        # Panels are uploaded from memory
+        assert content == b"panel 0"
+        return _response()
+
+    arguments = {"plot_path": str(plot_path), "max_number_points_per_series": 10, "save_panel_images": True, "response_mode": "summary"}
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=post)) as mock_post:
+        response = await mcp_client.call_tool("split_and_extract_multi_plot", arguments)
+
+    assert mock_post.await_count == 3
+    first, second = response.structured_content["panels"]
+    assert first["status"] == "extracted" and first["data_path"] == str(tmp_path / "figure_split_0_data.json")
+    assert [series["n_points"] for series in first["summary"]] == [10, 10]
+    assert second["status"] == "failed" and "server error" in second["error"]
+    assert response.content[0].text.startswith("Split figure.png into 2 panels: 1 extracted, 1 failed")
+    assert (tmp_path / "figure_split_0.png").read_bytes() == b"panel 0"
+    assert load_raw_extraction(tmp_path / "figure_split_0_raw.npz").source == REMOTE_SOURCE
+    assert not (tmp_path / "figure_split_1_raw.npz").exists()
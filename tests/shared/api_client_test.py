@@ -0,0 +1,134 @@
+"""Tests for the streaming multipart encoder and the shared connection pool of the API client."""
+
+import asyncio
+import io
+import threading
+
+import httpx
+import pytest
+from fastmcp import FastMCP
+from fastmcp.client import Client
+
+from axiomatic_mcp.providers.lifespan_provider import mcp_lifespan
+from axiomatic_mcp.shared.api_client import AxiomaticAPIClient, encode_streaming_multipart, iter_file_chunks
+
+
+async def _read(body) -> bytes:
+    return b"".join([chunk async for chunk in body])
+
+
+def _boundary(headers: dict[str, str]) -> str:
+    return headers["Content-Type"].split("boundary=")[1]
+
+
+@pytest.mark.asyncio
+async def test_body_matches_httpx_encoding(tmp_path):
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.7\r\n" + bytes(range(256)) * 10)
+    data = {"query": "Extract the parameters", "verbose": True, "page": 3, "empty": None}
+    filename = 'odd "name"\\ with\nnew\tline.pdf'
+
+    headers, body = await encode_streaming_multipart(data, {"file": (filename, pdf_path, "application/pdf"), "notes": ("notes.txt", b"abc", None)})
+    content = await _read(body)
+
+    expected = httpx.Request(
+        "POST",
+        "https://example.com",
+        data=data,
+        files={"file": (filename, pdf_path.read_bytes(), "application/pdf"), "notes": ("notes.txt", b"abc", "application/octet-stream")},
+        headers={"Content-Type": headers["Content-Type"]},
+    )
+    assert content == expected.read()
+    assert int(headers["Content-Length"]) == len(content)
+    assert b'filename="odd %22name%22\\\\ with%0Anew%09line.pdf"' in content
+
+
+@pytest.mark.asyncio
+async def test_streams_paths_handles_and_async_iterables(tmp_path):
+    path = tmp_path / "image.png"
+    path.write_bytes(b"png" * 1000)
+    handle = io.BytesIO(b"skipped-handle bytes")
+    handle.seek(8)
+
+    async def chunks():
+        yield b"part one, "
+        yield b"part two"
+
+    headers, body = await encode_streaming_multipart(
+        None, {"path": ("image.png", path, "image/png"), "handle": ("handle.bin", handle, None), "stream": ("stream.bin", chunks(), None)}
+    )
+    content = await _read(body)
+
+    boundary = _boundary(headers).encode()
+    parts = content.split(b"--" + boundary)
+    assert parts[0] == b"" and parts[-1] == b"--\r\n"
+    assert [part.split(b"\r\n\r\n", 1)[1] for part in parts[1:-1]] == [b"png" * 1000 + b"\r\n", b"handle bytes\r\n", b"part one, part two\r\n"]
+    # The length of an async iterable is unknown, so the body is sent chunked
+    assert "Content-Length" not in headers
+
+
+@pytest.mark.asyncio
+async def test_content_length_of_paths_and_handles(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x" * 12345)
+
+    with path.open("rb") as handle:
+        handle.seek(45)
+        headers, body = await encode_streaming_multipart({"a": "b"}, {"path": ("data.bin", path, None), "handle": ("rest.bin", handle, None)})
+        content = await _read(body)
+
+    assert int(headers["Content-Length"]) == len(content)
+    assert content.count(b"x") == 12345 + 12300
+
+
+@pytest.mark.asyncio
+async def test_iter_file_chunks(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+
+    chunks = [chunk async for chunk in iter_file_chunks(path, chunk_size=300)]
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 124]
+    assert b"".join(chunks) == path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_client_replaced_on_another_loop_is_closed_on_its_own_loop(monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+
+        async def create_client():
+            return AxiomaticAPIClient().client
+
+        stale = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result()
+
+        client = AxiomaticAPIClient().client
+        await AxiomaticAPIClient.aclose()
+
+        assert client is not stale and client.is_closed
+        await asyncio.to_thread(lambda: asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result())
+        assert stale.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_server_lifespan_closes_the_shared_client(monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    server = FastMCP(name="Lifespan", lifespan=mcp_lifespan)
+
+    @server.tool
+    async def open_client() -> bool:
+        return AxiomaticAPIClient().client.is_closed
+
+    async with Client(transport=server) as client:
+        assert (await client.call_tool("open_client")).data is False
+        shared = AxiomaticAPIClient._shared_client
+
+    assert shared is not None and shared.is_closed
+    assert AxiomaticAPIClient._shared_client is None
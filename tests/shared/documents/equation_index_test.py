@@ -0,0 +1,77 @@
+"""Tests for the local equation index."""
+
+import pytest
+
+from axiomatic_mcp.shared.documents.equation_index import EquationIndex, build_match_expression, normalize_latex
+
+MARKDOWN = """# Introduction
+
+## Dispersion of the slab waveguide
+
+The dispersion relation of the guided mode reads
+
+$$\\beta = k_0 n_{\\mathrm{eff}}(\\omega)$$
+
+where $n_{\\mathrm{eff}}$ is the effective index.
+
+Figure 2: Effective index versus wavelength.
+
+# Losses
+
+$$\\alpha = 2 \\mathrm{Im}(n_{eff}) k_0$$
+"""
+
+INTERLINE = ["\\beta = k_0 n_{\\mathrm{eff}}(\\omega)", "\\alpha = 2 \\mathrm{Im}(n_{eff}) k_0"]
+INLINE = ["n_{\\mathrm{eff}}"]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = EquationIndex(tmp_path / "index.sqlite3")
+    index.add_document("hash", tmp_path / "paper.pdf", MARKDOWN, INTERLINE, INLINE)
+    return index
+
+
+def test_normalize_latex():
+    assert normalize_latex("n_{\\mathrm{eff}}(\\omega)") == "n eff omega"
+    assert normalize_latex("\\left( \\frac{a}{b} \\right)") == "frac a b"
+
+
+def test_match_expression_restricts_query_words_to_context():
+    assert build_match_expression("all dispersion relations", "n_{eff}") == 'symbols : "n eff" AND context : ("dispersion" OR "relations")'
+    assert build_match_expression() is None
+
+
+def test_search_combines_symbols_and_context(index):
+    results = index.search("dispersion relation", "n_eff", kinds=["equation"])
+
+    assert [r["text"] for r in results] == [INTERLINE[0]]
+    assert results[0]["section"] == "Dispersion of the slab waveguide"
+    assert results[0]["line"] == 7
+
+
+def test_locates_inline_equations_outside_display_equations(index):
+    results = index.search(symbols="n_eff", kinds=["inline_equation"])
+
+    assert results[0]["line"] == 9
+
+
+def test_indexes_captions_and_headings(index):
+    assert index.search("wavelength")[0]["kind"] == "caption"
+    assert index.stats() == {"documents": 1, "equation": 2, "inline_equation": 1, "heading": 3, "caption": 1}
+
+
+def test_reindexing_replaces_entries(index, tmp_path):
+    index.add_document("hash", tmp_path / "moved.pdf", MARKDOWN, INTERLINE, INLINE)
+
+    assert index.stats()["equation"] == 2
+    assert index.search(symbols="alpha")[0]["pdf_path"] == str(tmp_path / "moved.pdf")
+
+
+def test_document_filter_takes_wildcards_literally(index, tmp_path):
+    index.add_document("other", tmp_path / "paper_2%.pdf", MARKDOWN, INTERLINE, INLINE)
+
+    assert {r["pdf_path"] for r in index.search(symbols="alpha", document="paper.")} == {str(tmp_path / "paper.pdf")}
+    assert {r["pdf_path"] for r in index.search(symbols="alpha", document="paper_2%")} == {str(tmp_path / "paper_2%.pdf")}
+    assert index.search(symbols="alpha", document="paper%pdf") == []
+    assert index.search(symbols="alpha", document="paper_pdf") == []
@@ -0,0 +1,78 @@
+"""Tests for parsing PDFs as page chunks."""
+
+import io
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from axiomatic_mcp.shared.api_client import AxiomaticAPIClient
+from axiomatic_mcp.shared.documents import pdf_to_markdown as pdf_module
+from axiomatic_mcp.shared.documents.pdf_to_markdown import ParseResponse, chunk_retry_delay, merge_parse_responses, pdf_to_markdown, split_pdf
+
+
+def _write_pdf(path, n_pages: int):
+    writer = PdfWriter()
+    for _ in range(n_pages):
+        writer.add_blank_page(width=100, height=100)
+    with path.open("wb") as f:
+        writer.write(f)
+    return path
+
+
+def _chunk_response(first_page: int) -> dict:
+    return {
+        "markdown": f"Page {first_page} ![img-0.jpeg](img-0.jpeg)",
+        "images": {"img-0.jpeg": f"data-{first_page}"},
+        "interline_equations": [f"E_{first_page}"],
+        "inline_equations": [],
+    }
+
+
+def test_split_pdf_into_page_ranges(tmp_path):
+    chunks = split_pdf(_write_pdf(tmp_path / "doc.pdf", 5), pages_per_chunk=2)
+
+    assert [(first, last) for first, last, _ in chunks] == [(1, 2), (3, 4), (5, 5)]
+    assert [len(PdfReader(io.BytesIO(content)).pages) for _, _, content in chunks] == [2, 2, 1]
+
+
+def test_merge_parse_responses_in_page_order_with_unique_image_names():
+    merged = merge_parse_responses(
+        [(3, 4, ParseResponse.model_validate(_chunk_response(3))), (1, 2, ParseResponse.model_validate(_chunk_response(1)))]
+    )
+
+    assert merged.markdown == "Page 1 ![p0001-0002_img-0.jpeg](p0001-0002_img-0.jpeg)\n\nPage 3 ![p0003-0004_img-0.jpeg](p0003-0004_img-0.jpeg)"
+    assert merged.images == {"p0001-0002_img-0.jpeg": "data-1", "p0003-0004_img-0.jpeg": "data-3"}
+    assert merged.interline_equations == ["E_1", "E_3"]
+
+
+def test_chunk_retry_delay_doubles():
+    assert [chunk_retry_delay(attempt) / pdf_module.CHUNK_RETRY_DELAY for attempt in (1, 2, 3)] == [1, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks_are_retried_on_their_own(tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_API_KEY", "test-key")
+    monkeypatch.setattr(pdf_module, "CHUNK_RETRY_DELAY", 0.01)
+    path = _write_pdf(tmp_path / "doc.pdf", 4)
+    failures = {"doc_p3-4.pdf": 1}
+
+    async def post(endpoint, data=None, files=None, params=None):
+        name = files["file"][0]
+        if failures.get(name):
+            failures[name] -= 1
+            raise RuntimeError("temporary failure")
+        return _chunk_response(int(name.split("_p")[1].split("-")[0]))
+
+    with patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=post)) as mock_post:
+        parsed = await pdf_to_markdown(path, use_cache=False, pages_per_chunk=2, use_index=False)
+
+    assert sorted(call.kwargs["files"]["file"][0] for call in mock_post.await_args_list) == ["doc_p1-2.pdf", "doc_p3-4.pdf", "doc_p3-4.pdf"]
+    assert list(parsed.images) == ["p0001-0002_img-0.jpeg", "p0003-0004_img-0.jpeg"]
+
+    failures["doc_p1-2.pdf"] = pdf_module.CHUNK_MAX_ATTEMPTS
+    with (
+        patch.object(AxiomaticAPIClient, "post", new=AsyncMock(side_effect=post)),
+        pytest.raises(RuntimeError, match="Failed to parse pages 1-2"),
+    ):
+        await pdf_to_markdown(path, use_cache=False, pages_per_chunk=2, use_index=False)
@@ -0,0 +1,49 @@
+"""Tests for the on-disk LRU cache."""
+
+import os
+
+import pytest
+
+from axiomatic_mcp.shared.utils.disk_cache import DiskCache, make_cache_key, sha256_file
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AXIOMATIC_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_get_returns_stored_value(cache_dir):
+    cache = DiskCache("test", max_bytes=1024)
+    cache.set("key", b"value")
+
+    assert cache.get("key") == b"value"
+    assert cache.get("missing") is None
+
+
+def test_evicts_least_recently_used(cache_dir):
+    cache = DiskCache("test", max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    os.utime(cache._path("a"), (1, 1))
+    os.utime(cache._path("b"), (2, 2))
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == b"aaaa"
+    cache.set("c", b"cccc")
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
+
+
+def test_cache_key_is_order_independent_for_dicts():
+    assert make_cache_key("x", {"a": 1, "b": 2}) == make_cache_key("x", {"b": 2, "a": 1})
+    assert make_cache_key("x", {"a": 1}) != make_cache_key("x", {"a": 2})
+
+
+def test_sha256_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abc")
+
+    assert sha256_file(path) == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
@@ -0,0 +1,31 @@
+"""Tests for client-side image preprocessing."""
+
+import pytest
+
+from axiomatic_mcp.shared.utils.image_preprocessing import preprocess_image
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def test_downsamples_and_strips_metadata(tmp_path):
+    path = tmp_path / "scan.jpg"
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    Image.new("RGB", (4000, 2000), "white").save(path, format="JPEG", quality=100, exif=exif)
+
+    result = preprocess_image(path, max_dimension=1000)
+
+    assert result.original_size == (4000, 2000)
+    assert result.final_size == (1000, 500)
+    assert result.bytes_saved > 0
+    assert isinstance(result.content, bytes)
+
+
+def test_keeps_original_when_not_smaller(tmp_path):
+    path = tmp_path / "plot.png"
+    Image.new("RGB", (10, 10), "white").save(path, format="PNG", optimize=True)
+
+    result = preprocess_image(path, max_dimension=1000)
+
+    assert result.content == path
+    assert result.bytes_saved == 0